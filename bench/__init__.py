@@ -0,0 +1,133 @@
+"""
+Benchmarks of the hot paths of the mod that run outside of the game.
+
+The game's modules are replaced by the stand-ins of the tests, so the numbers
+only compare the mod's own overhead between implementations. Run all of them
+with ``python -m bench`` or only some with ``python -m bench <name> ...``.
+"""
+
+from __future__ import annotations
+
+import gc
+import io
+import sys
+import timeit
+import tracemalloc
+from contextlib import contextmanager
+from typing import TYPE_CHECKING, Any
+from unittest import mock
+
+import tests  # noqa: F401 - installs the stand-in game modules
+from control_any_sim import ts4_services
+from control_any_sim.services.selection_group import SelectionGroupService
+from control_any_sim.util.logger import Logger, LogLevel
+from tests.fakes import HOUSEHOLD_ID, FakeClient, fake_services_module
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterator
+
+REPEAT = 5
+ZONE_ID = 1
+
+# the benchmarks measure the production configuration
+Logger.set_level(LogLevel.ERROR)
+
+
+def measure(
+    statement: str,
+    namespace: dict[str, Any],
+    number: int,
+    setup: str = "pass",
+) -> float:
+    """
+    Time a statement with timeit, the best of several repetitions.
+
+    Returns
+    -------
+        The time of a single execution of the statement in microseconds.
+
+    """
+    timer = timeit.Timer(statement, setup, globals=namespace)
+
+    return min(timer.repeat(REPEAT, number)) / number * 1e6
+
+
+def measure_memory(function: Callable[[], object]) -> float:
+    """
+    Trace the memory that a function allocates and keeps in its result.
+
+    Returns
+    -------
+        The size of the memory blocks that are still allocated in KiB.
+
+    """
+    gc.collect()
+    tracemalloc.start()
+
+    try:
+        result = function()
+        gc.collect()
+        size, _peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    del result
+
+    return size / 1024
+
+
+def report(name: str, value: float, unit: str = "us") -> None:
+    """Write a single measurement to stdout."""
+    sys.stdout.write(f"{name:<56} {value:>12.3f} {unit}\n")
+
+
+@contextmanager
+def fake_services() -> Iterator[tuple[FakeClient, mock.MagicMock]]:
+    """Back the mod's service accessors by the stand-ins of the tests."""
+    client = FakeClient()
+    fake = fake_services_module(client)
+    previous = ts4_services.facade.services
+
+    # calls of mocks take microseconds, the hot accessors are plain functions
+    fake.get_first_client = lambda: client
+    fake.active_household_id = lambda: HOUSEHOLD_ID
+    fake.active_sim_info = lambda: None
+    fake.current_zone_id = lambda: ZONE_ID
+
+    ts4_services.use(fake)
+
+    try:
+        yield (client, fake)
+    finally:
+        ts4_services.use(previous)
+
+
+@contextmanager
+def selection_group(
+    selectable_sims: list[int],
+    household_npcs: list[int] | None = None,
+) -> Iterator[SelectionGroupService]:
+    """Create a selection group and remove its event listeners afterwards."""
+    group = SelectionGroupService(HOUSEHOLD_ID, selectable_sims, household_npcs)
+
+    try:
+        yield group
+    finally:
+        for subscription in group._subscriptions:  # noqa: SLF001
+            subscription.cancel()
+
+
+@contextmanager
+def debug_logging() -> Iterator[io.StringIO]:
+    """Enable debug messages and write them to memory instead of the log file."""
+    handler = io.StringIO()
+    Logger.flush()
+
+    with mock.patch.object(Logger, "handler", handler):
+        Logger.set_level(LogLevel.DEBUG)
+
+        try:
+            yield handler
+        finally:
+            Logger.flush()
+            Logger.set_level(LogLevel.ERROR)
@@ -0,0 +1,34 @@
+"""Run the benchmarks, all of them or the ones given by name."""
+
+from __future__ import annotations
+
+import importlib
+import sys
+
+BENCHMARKS = (
+    "injection",
+    "serialize",
+    "greeting",
+    "skewer",
+    "affordances",
+    "membership",
+    "selectable",
+    "logger",
+    "persist",
+    "load",
+    "spawn",
+    "pie_menu",
+    "npc",
+    "active_client",
+)
+
+
+def main(names: list[str]) -> None:
+    """Run the benchmark modules with the given names."""
+    for name in names or BENCHMARKS:
+        sys.stdout.write(f"# {name}\n")
+        importlib.import_module(f"bench.bench_{name}").run()
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
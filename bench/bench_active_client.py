@@ -0,0 +1,63 @@
+"""Lookups of the active client by the Sim.is_selected override."""
+
+from __future__ import annotations
+
+from typing import Any
+
+from bench import fake_services, measure, report
+from control_any_sim import main, ts4_services
+from control_any_sim.ts4_services.clientmanager import ClientManager
+from tests.fakes import HOUSEHOLD_ID, FakeClient
+
+NUMBER = 100_000
+
+
+class GameClientManager:
+    """Client manager of the game with a single client."""
+
+    def __init__(self, client: FakeClient) -> None:
+        """Create a manager of the given client."""
+        self.client = client
+
+    def get_client_by_household_id(self, household_id: int) -> FakeClient | None:
+        """Get the client of a household."""
+        return self.client if household_id == HOUSEHOLD_ID else None
+
+
+class Sim:
+    """Sim that is not the active sim of the client."""
+
+
+def original(_sim: Sim) -> bool:
+    """Stand-in for the game's property, the override does not reach it."""
+    return False
+
+
+def is_selected_with_new_wrapper(sim: Sim) -> bool:
+    """Look up the client like the override did before, with a new wrapper."""
+    services = ts4_services.facade.services
+    client = ClientManager(services.client_manager(), services).get_active_client()
+
+    if client is None:
+        return False
+
+    return sim is client.active_sim
+
+
+def run() -> None:
+    """Compare a new client manager wrapper per call with the cached client."""
+    with fake_services() as (client, services):
+        client_manager = GameClientManager(client)
+        services.client_manager = lambda: client_manager
+        namespace: dict[str, Any] = {
+            "legacy": is_selected_with_new_wrapper,
+            "override": main.canys_sim_info_is_selected,
+            "original": original,
+            "sim": Sim(),
+        }
+
+        report("new wrapper per call", measure("legacy(sim)", namespace, NUMBER))
+        report(
+            "cached active client",
+            measure("override(original, sim)", namespace, NUMBER),
+        )
@@ -0,0 +1,85 @@
+"""Affordances injected into 300 spawning sims, per instance or per class."""
+
+from __future__ import annotations
+
+import functools
+from typing import Any
+
+from bench import measure, measure_memory, report
+from control_any_sim.services.interactions_service import InteractionsService
+
+NUMBER = 20
+SIM_COUNT = 300
+AFFORDANCE_COUNT = 200
+
+
+def make_affordances(count: int, prefix: str) -> tuple[type, ...]:
+    """Create stand-in interaction classes."""
+    return tuple(type(f"{prefix}{index}", (), {}) for index in range(count))
+
+
+GAME_AFFORDANCES = make_affordances(AFFORDANCE_COUNT, "GameInteraction")
+INJECTED_AFFORDANCES = make_affordances(
+    len(InteractionsService.sim_interactions),
+    "ModInteraction",
+)
+
+
+def make_sim_class() -> type:
+    """Create a sim class with the affordance lists of the game."""
+    return type(
+        "Sim",
+        (),
+        {
+            "_super_affordances": GAME_AFFORDANCES,
+            "_relation_panel_affordances": GAME_AFFORDANCES,
+        },
+    )
+
+
+def inject_per_instance(sim: Any) -> None:  # noqa: ANN401
+    """Extend the lists of every sim like the listeners did before."""
+    sim._super_affordances = sim._super_affordances + INJECTED_AFFORDANCES  # noqa: SLF001
+    sim._relation_panel_affordances = (  # noqa: SLF001
+        sim._relation_panel_affordances + INJECTED_AFFORDANCES  # noqa: SLF001
+    )
+
+
+def inject_per_class(sim: Any) -> None:  # noqa: ANN401
+    """Extend the lists through the listeners of the service."""
+    InteractionsService.inject_into_sim(sim)
+    InteractionsService.inject_into_relationship_panel(sim)
+
+
+def spawn(inject: Any) -> list[Any]:  # noqa: ANN401
+    """Spawn the sims of a new class and inject the affordances into each."""
+    sim_class = make_sim_class()
+    sims = [sim_class() for _ in range(SIM_COUNT)]
+
+    for sim in sims:
+        inject(sim)
+
+    return sims
+
+
+def run() -> None:
+    """Compare the memory and time of both injections for all sims."""
+    InteractionsService.injected_affordances = INJECTED_AFFORDANCES
+
+    try:
+        for name, inject in (
+            ("per instance", inject_per_instance),
+            ("per class", inject_per_class),
+        ):
+            report(
+                f"{name}, {SIM_COUNT} sims, memory",
+                measure_memory(functools.partial(spawn, inject)),
+                "KiB",
+            )
+            report(
+                f"{name}, {SIM_COUNT} sims, time",
+                measure("spawn(inject)", {"spawn": spawn, "inject": inject}, NUMBER),
+            )
+    finally:
+        InteractionsService.injected_affordances = None
+        InteractionsService.interned_affordances.clear()
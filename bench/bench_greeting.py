@@ -0,0 +1,61 @@
+"""Custom sim check of the lot owner household for the greeting decision."""
+
+from __future__ import annotations
+
+from bench import fake_services, measure, report
+from control_any_sim.services.selection_group import SelectionGroupService
+from tests.fakes import OTHER_HOUSEHOLD_ID, FakeSimInfo
+
+NUMBER = 2_000
+GROUP_SIZES = (100, 10_000)
+HOUSEHOLD_SIZES = (8, 100)
+
+
+class Household:
+    """Lot owner household without any custom sim."""
+
+    def __init__(self, size: int) -> None:
+        """Create a household with the given number of members."""
+        self.id = OTHER_HOUSEHOLD_ID
+        self.sim_infos = [
+            FakeSimInfo(sim_id, OTHER_HOUSEHOLD_ID) for sim_id in range(size)
+        ]
+
+
+def list_scan(selectable_sims: list[int], household: Household) -> bool:
+    """Check the members like the override did with the selectable sims list."""
+    return any(sim_info.id in selectable_sims for sim_info in household.sim_infos)
+
+
+def run() -> None:
+    """Compare the list scan with the index lookups for growing groups."""
+    with fake_services():
+        for group_size in GROUP_SIZES:
+            run_group(group_size)
+
+
+def run_group(group_size: int) -> None:
+    """Measure the check for a group of the given size."""
+    selectable_sims = list(range(10**6, 10**6 + group_size))
+    group = SelectionGroupService(1, selectable_sims)
+
+    for household_size in HOUSEHOLD_SIZES:
+        namespace = {
+            "group": group,
+            "household": Household(household_size),
+            "list_scan": list_scan,
+            "selectable_sims": selectable_sims,
+        }
+        name = f"{group_size} custom sims, {household_size} members"
+
+        report(
+            f"list scan, {name}",
+            measure("list_scan(selectable_sims, household)", namespace, 20),
+        )
+        report(
+            f"index, {name}",
+            measure("group.has_custom_sim_in_household(household)", namespace, NUMBER),
+        )
+
+    for subscription in group._subscriptions:  # noqa: SLF001
+        subscription.cancel()
@@ -0,0 +1,41 @@
+"""Call overhead of the plain and the fast injection wrappers."""
+
+from __future__ import annotations
+
+from typing import Callable
+
+from bench import measure, report
+from control_any_sim.util.inject import inject
+
+NUMBER = 200_000
+
+
+class Target:
+    """Game class with a hot method."""
+
+    def is_npc(self, value: int) -> int:
+        """Return the value like a cheap game method does."""
+        return value
+
+
+def override(
+    original: Callable[[Target, int], int],
+    self: Target,
+    value: int,
+) -> int:
+    """Delegate to the original method like most overrides of the mod do."""
+    return original(self, value)
+
+
+def run() -> None:
+    """Compare a direct call with calls through both injection wrappers."""
+    namespace = {
+        "target": Target(),
+        "original": Target.is_npc,
+        "plain": inject(Target.is_npc, override),
+        "fast": inject(Target.is_npc, override, fast=True),
+    }
+
+    report("original method", measure("original(target, 1)", namespace, NUMBER))
+    report("plain wrapper", measure("plain(target, 1)", namespace, NUMBER))
+    report("fast wrapper", measure("fast(target, 1)", namespace, NUMBER))
@@ -0,0 +1,63 @@
+"""Loading the selection group of one household among many stored ones."""
+
+from __future__ import annotations
+
+import json
+import tempfile
+from pathlib import Path
+from typing import Any
+
+from bench import fake_services, measure, report, selection_group
+from control_any_sim.util.persistence import StateStore
+
+NUMBER = 200
+HOUSEHOLD_COUNTS = (10, 100, 1_000)
+GROUP_SIZE = 50
+
+
+def load_from_single_file(path: Path, household_id: int) -> str:
+    """Read the groups of all households from one file and pick one."""
+    with path.open(encoding="utf8") as file_handler:
+        states: dict[str, str] = json.load(file_handler)
+
+    return states[str(household_id)]
+
+
+def run() -> None:
+    """Compare a record per household with a single file for all households."""
+    with fake_services(), selection_group(
+        list(range(10**6, 10**6 + GROUP_SIZE)),
+    ) as group:
+        state = group.serialize()
+
+        for household_count in HOUSEHOLD_COUNTS:
+            with tempfile.TemporaryDirectory() as directory:
+                run_households(Path(directory), state, household_count)
+
+
+def run_households(directory: Path, state: str, household_count: int) -> None:
+    """Store the state for the given number of households and load the last."""
+    store = StateStore(directory / "selection_groups")
+    single_file = directory / "selection_groups.json"
+
+    for household_id in range(household_count):
+        store.save(household_id, state)
+
+    with single_file.open("w", encoding="utf8") as file_handler:
+        json.dump(dict.fromkeys(map(str, range(household_count)), state), file_handler)
+
+    namespace: dict[str, Any] = {
+        "store": store,
+        "single_file": single_file,
+        "load_from_single_file": load_from_single_file,
+        "household_id": household_count - 1,
+    }
+
+    report(
+        f"single file, {household_count} households",
+        measure("load_from_single_file(single_file, household_id)", namespace, NUMBER),
+    )
+    report(
+        f"record per household, {household_count} households",
+        measure("store.load(household_id)", namespace, NUMBER),
+    )
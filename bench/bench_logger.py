@@ -0,0 +1,64 @@
+"""Throughput of debug messages written to a log file."""
+
+from __future__ import annotations
+
+import tempfile
+from pathlib import Path
+from typing import TextIO
+from unittest import mock
+
+from bench import measure, report
+from control_any_sim.util.logger import Logger, LogLevel
+
+NUMBER = 20_000
+MESSAGE = "added sim has household: %s, is none: %s"
+
+
+def flush_per_line(handler: TextIO, message: str, *args: object) -> None:
+    """Write a message like the logger did before, with a flush per line."""
+    handler.write(message % args + "\n")
+    handler.flush()
+
+
+def run() -> None:
+    """Compare a flush per line with the buffered and the disabled logger."""
+    with tempfile.TemporaryDirectory() as directory:
+        log_file = Path(directory, "debug.log")
+
+        with log_file.open("a") as handler, mock.patch.object(
+            Logger,
+            "handler",
+            handler,
+        ):
+            run_handler(handler)
+
+
+def run_handler(handler: TextIO) -> None:
+    """Measure the writes of a message to the given log file."""
+    namespace = {
+        "handler": handler,
+        "flush_per_line": flush_per_line,
+        "logger": Logger,
+        "message": MESSAGE,
+    }
+
+    report(
+        "flush per line",
+        measure("flush_per_line(handler, message, 1, True)", namespace, NUMBER),
+    )
+
+    Logger.set_level(LogLevel.DEBUG)
+
+    try:
+        report(
+            "buffered",
+            measure("logger.debug(message, 1, True)", namespace, NUMBER),
+        )
+    finally:
+        Logger.flush()
+        Logger.set_level(LogLevel.ERROR)
+
+    report(
+        "disabled level",
+        measure("logger.debug(message, 1, True)", namespace, NUMBER),
+    )
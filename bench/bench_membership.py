@@ -0,0 +1,43 @@
+"""Membership checks of the selection group for growing groups."""
+
+from __future__ import annotations
+
+from bench import fake_services, measure, report, selection_group
+from tests.fakes import OTHER_HOUSEHOLD_ID, FakeSimInfo
+
+NUMBER = 10_000
+GROUP_SIZES = (10, 100, 1_000, 10_000)
+
+
+def run() -> None:
+    """Compare list scans with the index lookups, for the last id of the group."""
+    with fake_services():
+        for group_size in GROUP_SIZES:
+            run_group(group_size)
+
+
+def run_group(group_size: int) -> None:
+    """Measure the checks for a group of the given size."""
+    sim_ids = list(range(10**6, 10**6 + group_size))
+
+    with selection_group(sim_ids, sim_ids) as group:
+        namespace = {
+            "group": group,
+            "sim_ids": sim_ids,
+            "sim_id": sim_ids[-1],
+            "sim_info": FakeSimInfo(sim_ids[-1], OTHER_HOUSEHOLD_ID),
+        }
+        number = max(NUMBER // group_size, 10)
+
+        report(
+            f"list scan, {group_size} ids",
+            measure("sim_id in sim_ids", namespace, number),
+        )
+        report(
+            f"is_custom_sim, {group_size} ids",
+            measure("group.is_custom_sim(sim_id)", namespace, NUMBER),
+        )
+        report(
+            f"is_household_npc, {group_size} ids",
+            measure("group.is_household_npc(sim_info)", namespace, NUMBER),
+        )
@@ -0,0 +1,56 @@
+"""SimInfo.is_npc override for 1000 sim infos."""
+
+from __future__ import annotations
+
+from typing import Any
+
+from bench import fake_services, measure, report, selection_group
+from control_any_sim import main
+from control_any_sim.services.selection_group import SelectionGroupService
+from tests.fakes import HOUSEHOLD_ID, OTHER_HOUSEHOLD_ID, FakeSimInfo
+
+NUMBER = 200
+SIM_COUNT = 1_000
+HOUSEHOLD_SIZE = 8
+
+
+def original(_sim_info: FakeSimInfo) -> bool:
+    """Stand-in for the game's field, the override does not reach it."""
+    return True
+
+
+def run() -> None:
+    """Compare active lookups per call with the cached NPC status."""
+    sim_infos = [
+        FakeSimInfo(
+            sim_id,
+            HOUSEHOLD_ID if sim_id < HOUSEHOLD_SIZE else OTHER_HOUSEHOLD_ID,
+        )
+        for sim_id in range(SIM_COUNT)
+    ]
+    namespace: dict[str, Any] = {
+        "override": main.canys_sim_info_is_npc,
+        "original": original,
+        "sim_infos": sim_infos,
+    }
+    statement = "for sim_info in sim_infos: override(original, sim_info)"
+
+    with fake_services() as (_client, services):
+        services.active_sim_info = lambda: sim_infos[0]
+
+        # without a selection group every call looks up the active sim
+        report(
+            f"active lookups, {SIM_COUNT} sims",
+            measure(statement, namespace, NUMBER),
+        )
+
+        with selection_group([], [HOUSEHOLD_SIZE - 1]) as group:
+            SelectionGroupService.instance = group
+
+            try:
+                report(
+                    f"cached NPC status, {SIM_COUNT} sims",
+                    measure(statement, namespace, NUMBER),
+                )
+            finally:
+                SelectionGroupService.instance = None
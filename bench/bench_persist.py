@@ -0,0 +1,111 @@
+"""Persistence of the selection group for growing groups and bursts of changes."""
+
+from __future__ import annotations
+
+import tempfile
+from pathlib import Path
+from typing import Any
+from unittest import mock
+
+from bench import fake_services, measure, report, selection_group
+from control_any_sim.services.selection_group import SelectionGroupService
+from control_any_sim.util.persistence import StateStore
+from tests.fakes import HOUSEHOLD_ID, FakeSimInfo
+
+NUMBER = 20
+GROUP_SIZES = (100, 1_000, 10_000)
+BURST_GROUP_SIZE = 1_000
+BURST_SIZE = 50
+
+
+def write_in_place(group: SelectionGroupService, path: Path) -> None:
+    """Write the state like the service did before, over the previous file."""
+    data = group.serialize()
+
+    with path.open("w", encoding="utf8") as file_handler:
+        file_handler.write(data)
+
+
+def run() -> None:
+    """Compare the writes in a temporary directory."""
+    with tempfile.TemporaryDirectory() as directory, fake_services():
+        store = StateStore(Path(directory, "selection_groups"))
+
+        with mock.patch.object(SelectionGroupService, "state_store", store):
+            for group_size in GROUP_SIZES:
+                run_group(Path(directory), group_size)
+
+            run_burst(Path(directory))
+
+
+def run_group(directory: Path, group_size: int) -> None:
+    """Measure a single write of a group of the given size."""
+    sim_ids = list(range(10**6, 10**6 + group_size))
+
+    with selection_group(sim_ids) as group:
+        namespace: dict[str, Any] = {
+            "group": group,
+            "path": directory / "selection_group.json",
+            "write_in_place": write_in_place,
+        }
+
+        report(
+            f"in place, {group_size} sims",
+            measure("write_in_place(group, path)", namespace, NUMBER),
+        )
+        report(
+            f"atomic, {group_size} sims",
+            measure(
+                "group.state_store.save(group.household_id, group.serialize())",
+                namespace,
+                NUMBER,
+            ),
+        )
+
+        group.persist_state()
+
+        report(
+            f"unchanged, {group_size} sims",
+            measure("group.persist_state()", namespace, NUMBER * 100),
+        )
+
+
+def run_burst(directory: Path) -> None:
+    """Measure a burst of household NPC changes, written per change or once."""
+    sim_ids = list(range(10**6, 10**6 + BURST_GROUP_SIZE))
+
+    with selection_group(sim_ids) as group:
+        namespace: dict[str, Any] = {
+            "group": group,
+            "path": directory / "selection_group.json",
+            "write_in_place": write_in_place,
+            "burst": [
+                FakeSimInfo(sim_id, HOUSEHOLD_ID) for sim_id in range(BURST_SIZE)
+            ],
+        }
+        name = f"{BURST_SIZE} changes, {BURST_GROUP_SIZE} sims"
+
+        report(
+            f"in place per change, {name}",
+            measure(
+                "for sim_info in burst:\n"
+                "    group.add_household_npc(sim_info)\n"
+                "    write_in_place(group, path)\n"
+                "    group.remove_household_npc(sim_info)\n"
+                "    write_in_place(group, path)",
+                namespace,
+                1,
+            ),
+        )
+        # the scheduled alarm fires once after the burst
+        report(
+            f"atomic debounced, {name}",
+            measure(
+                "for sim_info in burst:\n"
+                "    group.add_household_npc(sim_info)\n"
+                "    group.remove_household_npc(sim_info)\n"
+                "group.persist_state()",
+                namespace,
+                1,
+            ),
+        )
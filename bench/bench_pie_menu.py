@@ -0,0 +1,138 @@
+"""
+Checks of the mod's interactions while the pie menu of 50 sims is opened.
+
+The test method of the interactions is wrapped by a stand-in of the game's
+flexmethod here, so the checks are run like the test method runs them.
+"""
+
+from __future__ import annotations
+
+import functools
+from typing import Any
+
+from bench import fake_services, measure, report, selection_group
+from control_any_sim import canys_interactions
+from control_any_sim.canys_interactions import InteractionTestMemo
+from control_any_sim.services.roommate_cache import RoommateCacheService
+from control_any_sim.services.selection_group import SelectionGroupService
+from tests.fakes import HOUSEHOLD_ID, OTHER_HOUSEHOLD_ID, FakeSimInfo
+
+NUMBER = 100
+TARGET_COUNT = 50
+
+INTERACTIONS = (
+    canys_interactions.SimMakeSelectableInteraction,
+    canys_interactions.SimMakeNotSelectableInteraction,
+    canys_interactions.SimAddRoomMateInteraction,
+    canys_interactions.SimRemoveRoomMateInteraction,
+    canys_interactions.SimHouseholdNpcOnInteraction,
+    canys_interactions.SimHouseholdNpcOffInteraction,
+)
+
+
+class FakeSim:
+    """Sim instance of a sim info."""
+
+    def __init__(self, sim_info: FakeSimInfo) -> None:
+        """Create the instance of the sim info."""
+        self.sim_info = sim_info
+
+
+class FakeContext:
+    """Interaction context of the acting sim from the pie menu."""
+
+    def __init__(self, sim_info: FakeSimInfo) -> None:
+        """Create the context of the acting sim without a target sim id."""
+        self.sim = FakeSim(sim_info)
+        self.target_sim_id = None
+
+
+class RoommateService:
+    """Roommate service of the game without any roommates."""
+
+    def add_roommate(self, *_args: Any) -> None:  # noqa: ANN401
+        """Pretend to add a roommate."""
+
+    def remove_roommate(self, *_args: Any) -> None:  # noqa: ANN401
+        """Pretend to remove a roommate."""
+
+    def is_sim_info_roommate(self, _sim_info: FakeSimInfo, _household_id: int) -> bool:
+        """Check if a sim is a roommate of a household."""
+        return False
+
+
+def open_pie_menu(targets: list[FakeSim], context: FakeContext) -> None:
+    """Run the checks of every interaction for every target through the memo."""
+    actor = context.sim.sim_info
+
+    for target in targets:
+        info_target = target.sim_info
+
+        for interaction in INTERACTIONS:
+            InteractionTestMemo.test(
+                interaction,
+                info_target,
+                context,
+                functools.partial(
+                    interaction._test_predicates,  # noqa: SLF001
+                    info_target,
+                    actor,
+                ),
+            )
+
+
+def open_pie_menu_without_memo(targets: list[FakeSim], context: FakeContext) -> None:
+    """Run the checks of every interaction for every target."""
+    actor = context.sim.sim_info
+
+    for target in targets:
+        for interaction in INTERACTIONS:
+            interaction._test_predicates(target.sim_info, actor)  # noqa: SLF001
+
+
+def run() -> None:
+    """Compare pie menus without the memo and with a cold and a warm memo."""
+    roommate_service = RoommateService()
+
+    with fake_services() as (_client, services), selection_group([]) as group:
+        services.get_roommate_service = lambda: roommate_service
+        group.zone_is_setup = True
+        SelectionGroupService.instance = group
+
+        try:
+            namespace: dict[str, Any] = {
+                "open_pie_menu": open_pie_menu,
+                "open_pie_menu_without_memo": open_pie_menu_without_memo,
+                "memo": InteractionTestMemo,
+                "context": FakeContext(FakeSimInfo(10, HOUSEHOLD_ID)),
+                "targets": [
+                    FakeSim(FakeSimInfo(sim_id, OTHER_HOUSEHOLD_ID))
+                    for sim_id in range(TARGET_COUNT)
+                ],
+            }
+
+            report(
+                f"without memo, {TARGET_COUNT} sims",
+                measure(
+                    "open_pie_menu_without_memo(targets, context)",
+                    namespace,
+                    NUMBER,
+                ),
+            )
+            report(
+                f"cold memo, {TARGET_COUNT} sims",
+                measure(
+                    "memo.clear()\nopen_pie_menu(targets, context)",
+                    namespace,
+                    NUMBER,
+                ),
+            )
+            report(
+                f"warm memo, {TARGET_COUNT} sims",
+                measure("open_pie_menu(targets, context)", namespace, NUMBER),
+            )
+        finally:
+            SelectionGroupService.instance = None
+            InteractionTestMemo.clear()
+            RoommateCacheService.invalidate()
+            RoommateCacheService.injected_class = None
@@ -0,0 +1,63 @@
+"""SimInfo.is_selectable override for growing skewers."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+from bench import fake_services, measure, report, selection_group
+from control_any_sim import main
+from control_any_sim.services.selection_group import SelectionGroupService
+from tests.fakes import HOUSEHOLD_ID, OTHER_HOUSEHOLD_ID, FakeClient, FakeSimInfo
+
+if TYPE_CHECKING:
+    from unittest import mock
+
+NUMBER = 10_000
+SKEWER_SIZES = (8, 50, 200)
+
+
+def original(_sim_info: FakeSimInfo) -> bool:
+    """Stand-in for the game's property, the override does not reach it."""
+    return False
+
+
+def run() -> None:
+    """Compare the scan of the client's sims with the tracked ids."""
+    for skewer_size in SKEWER_SIZES:
+        with fake_services() as (client, services):
+            run_skewer(client, services, skewer_size)
+
+
+def run_skewer(client: FakeClient, services: mock.MagicMock, skewer_size: int) -> None:
+    """Measure the override for a skewer of the given size."""
+    client_manager = services.client_manager.return_value
+    client_manager.get_client_by_household_id.return_value = client
+
+    for sim_id in range(skewer_size):
+        client.add_selectable_sim_info(FakeSimInfo(sim_id, HOUSEHOLD_ID))
+
+    namespace: dict[str, Any] = {
+        "original": original,
+        "override": main.canys_sim_info_is_selectable,
+        # not selectable, so the scan has to visit every sim
+        "sim_info": FakeSimInfo(10**6, OTHER_HOUSEHOLD_ID),
+    }
+
+    # without a set up group the override scans the sims of the client
+    report(
+        f"client scan, {skewer_size} sims",
+        measure("override(original, sim_info)", namespace, NUMBER),
+    )
+
+    with selection_group([]) as group:
+        client.selectable_sims.add_watcher(group, group.on_selectable_sims_notified)
+        group.zone_is_setup = True
+        SelectionGroupService.instance = group
+
+        try:
+            report(
+                f"tracked ids, {skewer_size} sims",
+                measure("override(original, sim_info)", namespace, NUMBER),
+            )
+        finally:
+            SelectionGroupService.instance = None
@@ -0,0 +1,84 @@
+"""Serialization of a selection group with 10k sim ids."""
+
+from __future__ import annotations
+
+import json
+from typing import Any
+
+from typing_extensions import Self
+
+from bench import measure, report
+from control_any_sim.util.serialize import Serializable, SerializedField
+
+NUMBER = 20
+SIM_COUNT = 10_000
+
+
+class Group(Serializable):
+    """Selection group like state with a large list of sim ids."""
+
+    serialized_fields = (
+        SerializedField("household_id", int),
+        SerializedField("selectable_sims", list, int),
+    )
+
+    def __init__(self: Self, household_id: int, selectable_sims: list[int]) -> None:
+        """Create a new group, the transient attribute is not serialized."""
+        self.household_id = household_id
+        self.selectable_sims = selectable_sims
+        self.zone_is_setup = False
+
+
+def legacy_serialize(group: Group) -> str:
+    """Serialize like the mod did before the schema, with every attribute."""
+    return json.dumps(group, default=lambda obj: obj.__dict__, indent=4, sort_keys=True)
+
+
+def legacy_deserialize(data: str) -> Group:
+    """Deserialize like the mod did before the schema, through an object hook."""
+
+    def hook(our_dict: dict[str, Any]) -> Group:
+        our_dict.pop("zone_is_setup", None)
+
+        return Group(**our_dict)
+
+    return json.loads(data, object_hook=hook)
+
+
+def run() -> None:
+    """Compare the legacy JSON path with the schema JSON and binary paths."""
+    group = Group(1, list(range(10**15, 10**15 + SIM_COUNT)))
+    legacy_data = legacy_serialize(group)
+    json_data = group.serialize()
+    binary_data = group.serialize_binary()
+    namespace = {
+        "Group": Group,
+        "group": group,
+        "legacy_serialize": legacy_serialize,
+        "legacy_deserialize": legacy_deserialize,
+        "legacy_data": legacy_data,
+        "json_data": json_data,
+        "binary_data": binary_data,
+    }
+
+    report("legacy serialize", measure("legacy_serialize(group)", namespace, NUMBER))
+    report("schema json serialize", measure("group.serialize()", namespace, NUMBER))
+    report(
+        "schema binary serialize",
+        measure("group.serialize_binary()", namespace, NUMBER),
+    )
+    report(
+        "legacy deserialize",
+        measure("legacy_deserialize(legacy_data)", namespace, NUMBER),
+    )
+    report(
+        "schema json deserialize",
+        measure("Group.deserialize(json_data)", namespace, NUMBER),
+    )
+    report(
+        "schema binary deserialize",
+        measure("Group.deserialize(binary_data)", namespace, NUMBER),
+    )
+    report("legacy size", len(legacy_data), "B")
+    report("schema json size", len(json_data), "B")
+    report("schema binary size", len(binary_data), "B")
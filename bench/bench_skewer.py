@@ -0,0 +1,72 @@
+"""Selector visual types of a skewer refresh with 50 sims."""
+
+from __future__ import annotations
+
+from typing import Any
+
+from bench import debug_logging, fake_services, measure, report
+from control_any_sim import main
+from control_any_sim.main import SelectorVisualTypeMemo
+from control_any_sim.services.selection_group import SelectionGroupService
+from tests.fakes import OTHER_HOUSEHOLD_ID, FakeSimInfo
+
+NUMBER = 500
+SIM_COUNT = 50
+
+
+def original(_client: Any, _sim_info: FakeSimInfo) -> tuple[int, None]:  # noqa: ANN401
+    """Stand-in for the game's visual type of a sim in the current zone."""
+    return (0, None)
+
+
+def run() -> None:
+    """Compare refreshes without memo, with a cold and with a warm memo."""
+    with fake_services() as (client, _services):
+        group = SelectionGroupService(1)
+        SelectionGroupService.instance = group
+
+        try:
+            run_refresh(client)
+        finally:
+            SelectionGroupService.instance = None
+            SelectorVisualTypeMemo.invalidate()
+
+            for subscription in group._subscriptions:  # noqa: SLF001
+                subscription.cancel()
+
+
+def run_refresh(client: Any) -> None:  # noqa: ANN401
+    """Measure a refresh of the visual types of all sims in the skewer."""
+    namespace = {
+        "client": client,
+        "original": original,
+        "sim_infos": [
+            FakeSimInfo(sim_id, OTHER_HOUSEHOLD_ID) for sim_id in range(SIM_COUNT)
+        ],
+        "compute": main.get_selector_visual_type,
+        "override": main.canys_client_get_selector_visual_type,
+        "memo": SelectorVisualTypeMemo,
+    }
+
+    statements = (
+        (
+            "without memo",
+            "for sim_info in sim_infos: compute(original, client, sim_info)",
+        ),
+        (
+            "cold memo",
+            "memo.invalidate()\n"
+            "for sim_info in sim_infos: override(original, client, sim_info)",
+        ),
+        (
+            "warm memo",
+            "for sim_info in sim_infos: override(original, client, sim_info)",
+        ),
+    )
+
+    for name, statement in statements:
+        report(name, measure(statement, namespace, NUMBER))
+
+    with debug_logging():
+        for name, statement in statements:
+            report(f"{name}, debug log", measure(statement, namespace, NUMBER))
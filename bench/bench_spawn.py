@@ -0,0 +1,93 @@
+"""Affordance injection into 500 spawning sims, resolved per spawn or per zone."""
+
+from __future__ import annotations
+
+from typing import Any
+
+from bench import fake_services, measure, report
+from control_any_sim import ts4_services
+from control_any_sim.services.interactions_service import InteractionsService
+
+NUMBER = 5
+SPAWN_COUNT = 500
+AFFORDANCE_COUNT = 200
+
+
+class AffordanceManager(dict):
+    """Instance manager of the game that knows the mod's interactions."""
+
+
+def make_sim_class() -> type:
+    """Create a sim class with the affordance lists of the game."""
+    affordances = tuple(
+        type(f"GameInteraction{index}", (), {}) for index in range(AFFORDANCE_COUNT)
+    )
+
+    return type(
+        "Sim",
+        (),
+        {"_super_affordances": affordances, "_relation_panel_affordances": affordances},
+    )
+
+
+def resolve_per_spawn(sim: Any) -> None:  # noqa: ANN401
+    """Resolve and inject the interactions like both listeners did before."""
+    for attribute_name in ("_super_affordances", "_relation_panel_affordances"):
+        affordance_manager = ts4_services.affordance_manager()
+        injected_interactions = []
+
+        for interaction_id in InteractionsService.sim_interactions:
+            interaction_class = affordance_manager.get(interaction_id)
+
+            if interaction_class is None:
+                continue
+
+            injected_interactions.append(interaction_class)
+
+        setattr(
+            sim,
+            attribute_name,
+            getattr(sim, attribute_name) + tuple(injected_interactions),
+        )
+
+
+def resolve_per_zone(sim: Any) -> None:  # noqa: ANN401
+    """Inject the interactions through the listeners of the service."""
+    InteractionsService.inject_into_sim(sim)
+    InteractionsService.inject_into_relationship_panel(sim)
+
+
+def run() -> None:
+    """Compare both injections for the spawns of a zone."""
+    affordance_manager = AffordanceManager(
+        (interaction_id, type(f"ModInteraction{interaction_id}", (), {}))
+        for interaction_id in InteractionsService.sim_interactions
+    )
+
+    with fake_services() as (_client, services):
+        services.affordance_manager = lambda: affordance_manager
+
+        try:
+            for name, inject in (
+                ("per spawn", resolve_per_spawn),
+                ("per zone", resolve_per_zone),
+            ):
+                namespace: dict[str, Any] = {
+                    "inject": inject,
+                    "service": InteractionsService,
+                    "sim_class": make_sim_class(),
+                    "spawn_count": SPAWN_COUNT,
+                }
+
+                # every zone starts without resolved interactions
+                report(
+                    f"{name}, {SPAWN_COUNT} spawns",
+                    measure(
+                        "service.on_zone_teardown(None, None)\n"
+                        "for _ in range(spawn_count): inject(sim_class())",
+                        namespace,
+                        NUMBER,
+                    ),
+                )
+        finally:
+            InteractionsService.on_zone_teardown(None, None)
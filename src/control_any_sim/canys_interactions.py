@@ -3,206 +3,191 @@
 from __future__ import annotations
 
 import traceback
-from typing import TYPE_CHECKING, Any, TypeVar
+from typing import TYPE_CHECKING, Any, Callable, ClassVar, TypeVar
 
-import services
 from event_testing.results import TestResult
 from interactions.base.immediate_interaction import ImmediateSuperInteraction
 from sims4.utils import flexmethod
 from singletons import DEFAULT
 
+from control_any_sim import ts4_services
+from control_any_sim.services.roommate_cache import RoommateCacheService
 from control_any_sim.services.selection_group import SelectionGroupService
+from control_any_sim.util.game_events import GameEvents
 from control_any_sim.util.logger import Logger
 
 if TYPE_CHECKING:
     from interactions.context import InteractionContext
     from scheduling import Timeline
+    from server.client import Client
     from sims.sim_info import SimInfo
     from typing_extensions import Self
+    from zone import Zone
 
 
-class SimMakeSelectableInteraction(ImmediateSuperInteraction):
-    """New sim interaction to add a sim to the selection group."""
+# relative cost of the predicates, cheaper predicates are evaluated first
+COST_ATTRIBUTE = 0
+COST_LOOKUP = 1
 
-    C = TypeVar("C", bound="SimMakeSelectableInteraction")
 
-    @flexmethod
-    def test(
-        cls: type[C],  # noqa: N805
-        inst: C,
-        *args: Any,  # noqa: ANN401
-        target: DEFAULT = DEFAULT,
-        context: None = None,
-        **kwargs: Any,  # noqa: ANN401
-    ) -> TestResult:
-        """Test if interaction is available."""
-        try:
-            inst_or_cls = inst if inst is not None else cls
+class InteractionTestMemo:
+    """
+    Memo of the mod specific checks in the interaction tests.
 
-            Logger.log(
-                f"testing SimMakeSelectableInteraction, context: {args} {kwargs}",
-            )
+    The pie menu runs the test of every interaction for every target each time
+    it is opened. The reasons of failed checks are remembered until the
+    selection group, the roommates or the active household change, or the
+    zone is torn down. Roommate changes are tracked by the
+    RoommateCacheService.
+    """
 
-            if target:
-                info_target = target.sim_info
+    # (interaction class, target id, target household id, actor id,
+    # actor household id) -> fail reason
+    results: ClassVar[dict[tuple[type, int, int, int, int], str | None]] = {}
+    state: ClassVar[tuple[int, int, int, int] | None] = None
 
-            Logger.log(f"info_target: {info_target}")
+    @classmethod
+    def clear(cls: type[InteractionTestMemo]) -> None:
+        """Drop all remembered results."""
+        cls.results.clear()
+        cls.state = None
 
-            if context is not None and context.target_sim_id is not None:
-                target_id = context.target_sim_id
-                info_target = services.sim_info_manager().get(target_id)
+    @classmethod
+    def on_zone_teardown(
+        cls: type[InteractionTestMemo],
+        _zone: Zone,
+        _client: Client,
+    ) -> None:
+        """Event listener that drops the results with the zone."""
+        cls.clear()
 
-            Logger.log(f"info_target: {info_target}")
+    @classmethod
+    def test(
+        cls: type[InteractionTestMemo],
+        interaction_class: type,
+        info_target: SimInfo,
+        context: InteractionContext | None,
+        check: Callable[[], str | None],
+    ) -> str | None:
+        """Get the remembered fail reason of a check or run the check."""
+        selection_group = SelectionGroupService.get_existing()
+        state = (
+            ts4_services.active_household_id(),
+            selection_group.household_id if selection_group else 0,
+            # syncs pending changes of the selectable sims
+            selection_group.selection_generation if selection_group else 0,
+            RoommateCacheService.generation,
+        )
 
-            sim_is_selectable = SelectionGroupService.get(0).is_selectable(
-                info_target.id,
-            )
+        if state != cls.state:
+            cls.results.clear()
+            cls.state = state
 
-            Logger.log(f"sim_is_selectable: {sim_is_selectable}")
+        actor_id = 0
+        actor_household_id = 0
 
-            if sim_is_selectable:
-                fail = TestResult(False, "sim is already selectable", inst)  # noqa: FBT003
-                Logger.log(f"fail result: {fail!r}")
-                return fail
+        if context is not None and context.sim is not None:
+            actor_id = context.sim.sim_info.id
+            actor_household_id = context.sim.sim_info.household_id
 
-            if target is None or target.sim_info.id != info_target.id:
-                return TestResult.TRUE
+        key = (
+            interaction_class,
+            info_target.id,
+            info_target.household_id,
+            actor_id,
+            actor_household_id,
+        )
 
-            return super(SimMakeSelectableInteraction, inst_or_cls).test(
-                *args,
-                target=target,
-                context=context,
-                **kwargs,
-            )
+        if key in cls.results:
+            return cls.results[key]
 
-        except BaseException:
-            Logger.log(traceback.format_exc())
+        result = check()
+        cls.results[key] = result
 
-    def _run_interaction_gen(self: Self, timeline: Timeline) -> bool:
-        Logger.log("running make selectable interaction...")
-        try:
-            super()._run_interaction_gen(timeline)
+        return result
 
-            sim_info = self.target.sim_info
 
-            if self.context.target_sim_id is not None:
-                sim_info = services.sim_info_manager().get(self.context.target_sim_id)
+GameEvents.on_zone_teardown(InteractionTestMemo.on_zone_teardown)
 
-            Logger.log(
-                f"got sim info {sim_info.first_name} {sim_info.last_name}",
-            )
 
-            SelectionGroupService.get(
-                services.active_household_id(),
-            ).make_sim_selectable(sim_info)
+class TargetPredicate:
+    """A single condition the target of an interaction has to meet."""
 
-            Logger.log("sim is now selectable!")
+    __slots__ = ("check", "cost", "expected", "reason")
 
-            services.get_first_client().set_active_sim_by_id(sim_info.id)
+    def __init__(
+        self: Self,
+        check: Callable[[SimInfo, SimInfo | None], bool],
+        reason: str,
+        cost: int,
+        *,
+        expected: bool = True,
+    ) -> None:
+        """Declare a new predicate, reason is reported when it is not met."""
+        self.check = check
+        self.reason = reason
+        self.cost = cost
+        self.expected = expected
 
-            Logger.log("sim is now active!")
+    def is_met(self: Self, info_target: SimInfo, actor: SimInfo | None) -> bool:
+        """Check the predicate for the target and the acting sim."""
+        return bool(self.check(info_target, actor)) == self.expected
 
-            return True
 
-        except BaseException:
-            Logger.log(traceback.format_exc())
-            return False
+def predicate_pipeline(*predicates: TargetPredicate) -> tuple[TargetPredicate, ...]:
+    """Order predicates by their cost, predicates of equal cost keep their order."""
+    return tuple(sorted(predicates, key=lambda predicate: predicate.cost))
 
 
-class SimMakeNotSelectableInteraction(ImmediateSuperInteraction):
-    """New sim interaction to remove a sim from the interaction group."""
+def is_actor(info_target: SimInfo, actor: SimInfo | None) -> bool:
+    """Check if the target is the acting sim."""
+    return actor is not None and actor.id == info_target.id
 
-    C = TypeVar("C", bound="SimMakeNotSelectableInteraction")
 
-    @flexmethod
-    def test(
-        cls: type[C],  # noqa: N805
-        inst: C,
-        *args: Any,  # noqa: ANN401
-        target: DEFAULT = DEFAULT,
-        context: None = None,
-        **kwargs: Any,  # noqa: ANN401
-    ) -> TestResult:
-        """Test if interaction is available for this sim."""
-        inst_or_cls = inst if inst is not None else cls
+def is_in_active_household(info_target: SimInfo, _actor: SimInfo | None) -> bool:
+    """Check if the target is a member of the active household."""
+    return info_target.household_id == ts4_services.active_household_id()
 
-        Logger.log(
-            f"testing SimMakeNotSelectableInteraction, context: {args} {kwargs}",
-        )
 
-        if target:
-            info_target = target.sim_info
+def is_selectable(info_target: SimInfo, _actor: SimInfo | None) -> bool:
+    """Check if the target is part of the selection group."""
+    selection_group = SelectionGroupService.get(ts4_services.active_household_id())
 
-        Logger.log(f"info_target: {info_target}")
+    return selection_group.is_sim_info_selectable(info_target)
 
-        if context is not None and context.target_sim_id is not None:
-            target_id = context.target_sim_id
-            info_target = services.sim_info_manager().get(target_id)
 
-        Logger.log(f"info_target: {info_target}")
+def is_household_npc(info_target: SimInfo, _actor: SimInfo | None) -> bool:
+    """Check if the target is a household NPC."""
+    selection_group = SelectionGroupService.get(ts4_services.active_household_id())
 
-        if cls._must_be_selectable(info_target):
-            return TestResult(
-                False,  # noqa: FBT003
-                "sim is in active household and has to be selectable",
-            )
+    return selection_group.is_household_npc(info_target)
 
-        sim_is_selectable = SelectionGroupService.get(0).is_selectable(info_target.id)
 
-        Logger.log(f"sim_is_selectable: {sim_is_selectable}")
+def is_roommate(info_target: SimInfo, actor: SimInfo | None) -> bool:
+    """Check if the target is a roommate of the acting sim's household."""
+    if actor is None:
+        return False
 
-        if not sim_is_selectable:
-            return TestResult(False, "sim is not selectable", inst)  # noqa: FBT003
+    return RoommateCacheService.is_roommate(info_target, actor.household_id)
 
-        if target is None or target.sim_info.id != info_target.id:
-            return TestResult.TRUE
 
-        return super(SimMakeNotSelectableInteraction, inst_or_cls).test(
-            *args,
-            target=target,
-            context=context,
-            **kwargs,
-        )
+class CanysImmediateInteraction(ImmediateSuperInteraction):
+    """
+    Base class of the interactions added by the mod.
 
-    def _run_interaction_gen(self: Self, timeline: Timeline) -> bool:
-        Logger.log("running make not selectable interaction...")
-        try:
-            super()._run_interaction_gen(timeline)
+    Subclasses declare the predicates their target has to meet. The target is
+    resolved once per test, the predicates are evaluated cheapest first and
+    the first one that is not met fails the test. The results are remembered
+    by the InteractionTestMemo.
+    """
 
-            sim_info = self.target.sim_info
+    C = TypeVar("C", bound="CanysImmediateInteraction")
 
-            if self.context.target_sim_id is not None:
-                sim_info = services.sim_info_manager().get(self.context.target_sim_id)
-
-            Logger.log(
-                f"got sim info {sim_info.first_name} {sim_info.last_name}",
-            )
-
-            service: SelectionGroupService = SelectionGroupService.get(
-                services.active_household_id(),
-            )
-
-            service.remove_sim(
-                sim_info,
-            )
-
-            Logger.log("sim is now not selectable anymore!")
-
-            return True
-
-        except BaseException:
-            Logger.log(traceback.format_exc())
-            return False
-
-    @classmethod
-    def _must_be_selectable(cls, sim_info: SimInfo) -> bool:
-        return services.active_household_id() == sim_info.household_id
-
-
-class SimAddRoomMateInteraction(ImmediateSuperInteraction):
-    """New sim interaction to quickly add them as roommates."""
-
-    C = TypeVar("C", bound="SimAddRoomMateInteraction")
+    test_predicates: ClassVar[tuple[TargetPredicate, ...]] = ()
+    # the interaction can not be tested while the roommate service is missing
+    requires_roommate_service: ClassVar[bool] = False
+    # the interaction is also offered for targets that are not the sim itself
+    passes_foreign_targets: ClassVar[bool] = False
 
     @flexmethod
     def test(
@@ -210,318 +195,284 @@ class SimAddRoomMateInteraction(ImmediateSuperInteraction):
         inst: C,
         *args: Any,  # noqa: ANN401
         target: DEFAULT = DEFAULT,
-        context: InteractionContext,
+        context: InteractionContext | None = None,
         **kwargs: Any,  # noqa: ANN401
     ) -> TestResult:
-        """Test if the sim can be added as a roommate."""
+        """Test if interaction is available for the target."""
         try:
-            Logger.log(
-                f"testing SimAddRoomMateInteraction, context: {args} {kwargs}",
-            )
-
             inst_or_cls = inst if inst is not None else cls
-            roommate_service = services.get_roommate_service()
-            household_id = context.sim.sim_info.household_id
 
-            if roommate_service is None:
+            Logger.debug("testing %s, context: %s %s", cls.__name__, args, kwargs)
+
+            if (
+                cls.requires_roommate_service
+                and ts4_services.get_roommate_service() is None
+            ):
                 return TestResult.NONE
 
-            if target:
-                info_target = target.sim_info
+            info_target = cls._resolve_target(target, context)
 
-            if context.target_sim_id is not None:
-                target_id = context.target_sim_id
-                info_target = services.sim_info_manager().get(target_id)
+            Logger.debug("info_target: %s", info_target)
 
-            Logger.log(f"info_target: {info_target}")
+            if info_target is None:
+                return TestResult.NONE
 
-            if context.sim.sim_info.id == info_target.id:
-                return TestResult(False, "sim can not be it's own roommate", inst)  # noqa: FBT003
+            actor = None
 
-            if roommate_service.is_sim_info_roommate(info_target, household_id):
-                return TestResult(False, "sim is already roommate of this household")  # noqa: FBT003
+            if context is not None and context.sim is not None:
+                actor = context.sim.sim_info
 
-            return super(SimAddRoomMateInteraction, inst_or_cls).test(
-                *args,
-                target=target,
-                context=context,
-                **kwargs,
+            fail_reason = InteractionTestMemo.test(
+                cls,
+                info_target,
+                context,
+                lambda: cls._test_predicates(info_target, actor),
             )
-        except BaseException:
-            Logger.log(traceback.format_exc())
-
-    def _run_interaction_gen(self: Self, timeline: Timeline) -> bool:
-        try:
-            Logger.log("running turn into roommate interaction...")
 
-            super()._run_interaction_gen(timeline)
+            if fail_reason is not None:
+                Logger.debug("fail reason: %s", fail_reason)
+                return TestResult(False, fail_reason, inst)  # noqa: FBT003
 
-            sim_info = self.target.sim_info
-            home_zone_id = self.get_sim_info_home_zone_id(self.context.sim.sim_info)
-
-            if self.context.target_sim_id is not None:
-                sim_info = services.sim_info_manager().get(self.context.target_sim_id)
+            if cls.passes_foreign_targets and (
+                target is None or target.sim_info.id != info_target.id
+            ):
+                return TestResult.TRUE
 
-            Logger.log(
-                f"got sim info {sim_info.first_name} {sim_info.last_name}",
+            return super(CanysImmediateInteraction, inst_or_cls).test(
+                *args,
+                target=target,
+                context=context,
+                **kwargs,
             )
 
-            services.get_roommate_service().add_roommate(sim_info, home_zone_id)
-
-            Logger.log("sim is now a roommate!")
-
-            return True
-
         except BaseException:
-            Logger.log(traceback.format_exc())
-            return False
-
-    @staticmethod
-    def _get_sim_info_home_zone_id(sim_info: SimInfo) -> int:
-        if sim_info.household is None:
-            return 0
-
-        home_zone_id = sim_info.household.home_zone_id
-
-        if not home_zone_id:
-            return sim_info.roommate_zone_id
-
-        return home_zone_id
-
-
-class SimRemoveRoomMateInteraction(ImmediateSuperInteraction):
-    """New sim interaction to quickly remove roommates from the household."""
-
-    C = TypeVar("C", bound="SimRemoveRoomMateInteraction")
-
-    @flexmethod
-    def test(
-        cls: type[C],  # noqa: N805
-        inst: C,
-        *args: Any,  # noqa: ANN401
-        target: DEFAULT = DEFAULT,
-        context: InteractionContext,
-        **kwargs: Any,  # noqa: ANN401
-    ) -> TestResult:
-        """Test if the sim can be removed from the household roommates."""
-        try:
-            inst_or_cls = inst if inst is not None else cls
-            roommate_service = services.get_roommate_service()
-
-            if roommate_service is None:
-                return TestResult.NONE
-
-            Logger.log(
-                f"testing SimRemoveRoomMateInteraction, context: {args} {kwargs}",
-            )
-
-            if target:
-                info_target = target.sim_info
+            Logger.debug(traceback.format_exc)
 
-            if context.target_sim_id is not None:
-                target_id = context.target_sim_id
-                info_target = services.sim_info_manager().get(target_id)
+    @classmethod
+    def _resolve_target(
+        cls,
+        target: Any,  # noqa: ANN401
+        context: InteractionContext | None,
+    ) -> SimInfo | None:
+        if context is not None and context.target_sim_id is not None:
+            return ts4_services.sim_info_manager().get(context.target_sim_id)
 
-            household_id = context.sim.sim_info.household_id
+        if target:
+            return target.sim_info
 
-            Logger.log(f"info_target: {info_target}")
+        return None
 
-            if context.sim.sim_info.id == info_target.id:
-                return TestResult(False, "sim can not be it's own roommate", inst)  # noqa: FBT003
+    @classmethod
+    def _test_predicates(
+        cls,
+        info_target: SimInfo,
+        actor: SimInfo | None,
+    ) -> str | None:
+        for predicate in cls.test_predicates:
+            if not predicate.is_met(info_target, actor):
+                return predicate.reason
 
-            if not roommate_service.is_sim_info_roommate(info_target, household_id):
-                return TestResult(
-                    False,  # noqa: FBT003
-                    "sim is not a roommate of current household",
-                    inst,
-                )
-
-            return super(SimRemoveRoomMateInteraction, inst_or_cls).test(
-                *args,
-                target=target,
-                context=context,
-                **kwargs,
-            )
-        except BaseException:
-            Logger.log(traceback.format_exc())
+        return None
 
     def _run_interaction_gen(self: Self, timeline: Timeline) -> bool:
+        Logger.debug("running %s...", type(self).__name__)
         try:
-            Logger.log("running remove roommate interaction...")
-
             super()._run_interaction_gen(timeline)
 
             sim_info = self.target.sim_info
 
             if self.context.target_sim_id is not None:
-                sim_info = services.sim_info_manager().get(self.context.target_sim_id)
+                sim_info = ts4_services.sim_info_manager().get(
+                    self.context.target_sim_id,
+                )
 
-            Logger.log(
-                f"got sim info {sim_info.first_name} {sim_info.last_name}",
+            Logger.debug(
+                "got sim info %s %s",
+                sim_info.first_name,
+                sim_info.last_name,
             )
 
-            services.get_roommate_service().remove_roommate(sim_info)
-
-            Logger.log("sim is now not a roommate anymore!")
+            self._run_for_sim_info(sim_info)
 
             return True
 
         except BaseException:
-            Logger.log(traceback.format_exc())
+            Logger.debug(traceback.format_exc)
             return False
 
+    def _run_for_sim_info(self: Self, sim_info: SimInfo) -> None:
+        # every interaction of the mod implements this, reaching it is a bug
+        Logger.error(
+            "%s does not run for sim %s",
+            type(self).__name__,
+            sim_info.id,
+        )
 
-class SimHouseholdNpcOnInteraction(ImmediateSuperInteraction):
-    """New sim interaction to turn household members into autonomus NPCs."""
-
-    C = TypeVar("C", bound="SimHouseholdNpcOnInteraction")
 
-    @flexmethod
-    def test(
-        cls: type[C],  # noqa: N805
-        inst: C,
-        *args: Any,  # noqa: ANN401
-        target: DEFAULT = DEFAULT,
-        context: InteractionContext = None,
-        **kwargs: Any,  # noqa: ANN401
-    ) -> TestResult:
-        """Test if sim can be turned into a household NPC."""
-        try:
-            inst_or_cls = inst if inst is not None else cls
-            selection_group = SelectionGroupService.get(services.active_household_id())
+class SimMakeSelectableInteraction(CanysImmediateInteraction):
+    """New sim interaction to add a sim to the selection group."""
 
-            Logger.log(
-                f"testing SimHouseholdNpcOnInteraction, context: {args} {kwargs}",
-            )
+    test_predicates = predicate_pipeline(
+        TargetPredicate(
+            is_selectable,
+            "sim is already selectable",
+            COST_LOOKUP,
+            expected=False,
+        ),
+    )
+    passes_foreign_targets = True
 
-            if target:
-                info_target = target.sim_info
+    def _run_for_sim_info(self: Self, sim_info: SimInfo) -> None:
+        SelectionGroupService.get(
+            ts4_services.active_household_id(),
+        ).make_sim_selectable(sim_info)
 
-            if context.target_sim_id is not None:
-                target_id = context.target_sim_id
-                info_target = services.sim_info_manager().get(target_id)
+        Logger.debug("sim is now selectable!")
 
-            Logger.log(f"info_target: {info_target}")
+        ts4_services.get_first_client().set_active_sim_by_id(sim_info.id)
 
-            if selection_group.is_household_npc(info_target):
-                return TestResult(False, "sim is already a household npc", inst)  # noqa: FBT003
+        Logger.debug("sim is now active!")
 
-            if info_target.household_id != services.active_household_id():
-                return TestResult(
-                    False,  # noqa: FBT003
-                    "sim is not a member of the active household",
-                    inst,
-                )
 
-            return super(SimHouseholdNpcOnInteraction, inst_or_cls).test(
-                *args,
-                target=target,
-                context=context,
-                **kwargs,
-            )
-        except BaseException:
-            Logger.log(traceback.format_exc())
+class SimMakeNotSelectableInteraction(CanysImmediateInteraction):
+    """New sim interaction to remove a sim from the interaction group."""
 
-    def _run_interaction_gen(self: Self, timeline: Timeline) -> bool:
-        try:
-            Logger.log("running household npc on interaction...")
+    test_predicates = predicate_pipeline(
+        TargetPredicate(
+            is_in_active_household,
+            "sim is in active household and has to be selectable",
+            COST_ATTRIBUTE,
+            expected=False,
+        ),
+        TargetPredicate(is_selectable, "sim is not selectable", COST_LOOKUP),
+    )
+    passes_foreign_targets = True
+
+    def _run_for_sim_info(self: Self, sim_info: SimInfo) -> None:
+        SelectionGroupService.get(ts4_services.active_household_id()).remove_sim(
+            sim_info,
+        )
 
-            super()._run_interaction_gen(timeline)
+        Logger.debug("sim is now not selectable anymore!")
 
-            sim_info = self.target.sim_info
 
-            if self.context.target_sim_id is not None:
-                sim_info = services.sim_info_manager().get(self.context.target_sim_id)
+class SimAddRoomMateInteraction(CanysImmediateInteraction):
+    """New sim interaction to quickly add them as roommates."""
 
-            Logger.log(
-                f"got sim info {sim_info.first_name} {sim_info.last_name}",
-            )
+    test_predicates = predicate_pipeline(
+        TargetPredicate(
+            is_actor,
+            "sim can not be it's own roommate",
+            COST_ATTRIBUTE,
+            expected=False,
+        ),
+        TargetPredicate(
+            is_roommate,
+            "sim is already roommate of this household",
+            COST_LOOKUP,
+            expected=False,
+        ),
+    )
+    requires_roommate_service = True
 
-            selection_group = SelectionGroupService.get(services.active_household_id())
-            selection_group.add_household_npc(sim_info)
+    def _run_for_sim_info(self: Self, sim_info: SimInfo) -> None:
+        roommate_service = ts4_services.get_roommate_service()
 
-            Logger.log("sim is now a household npc!")
+        if roommate_service is None:
+            Logger.error("no roommate service to add sim %s", sim_info.id)
+            return
 
-            return True
+        home_zone_id = self._get_sim_info_home_zone_id(self.context.sim.sim_info)
 
-        except BaseException:
-            Logger.log(traceback.format_exc())
-            return False
+        roommate_service.add_roommate(sim_info, home_zone_id)
 
+        Logger.debug("sim is now a roommate!")
 
-class SimHouseholdNpcOffInteraction(ImmediateSuperInteraction):
-    """New sim interaction to remove a household member from the NPC list."""
+    @staticmethod
+    def _get_sim_info_home_zone_id(sim_info: SimInfo) -> int:
+        if sim_info.household is None:
+            return 0
 
-    C = TypeVar("C", bound="SimHouseholdNpcOffInteraction")
+        home_zone_id = sim_info.household.home_zone_id
 
-    @flexmethod
-    def test(
-        cls: type[C],  # noqa: N805
-        inst: C,
-        *args: Any,  # noqa: ANN401
-        target: DEFAULT = DEFAULT,
-        context: InteractionContext,
-        **kwargs: Any,  # noqa: ANN401
-    ) -> TestResult:
-        """Test if the sim is a household NPC and can be removed."""
-        try:
-            inst_or_cls = inst if inst is not None else cls
-            selection_group = SelectionGroupService.get(services.active_household_id())
+        if not home_zone_id:
+            return sim_info.roommate_zone_id
 
-            Logger.log(
-                f"testing SimHouseholdNpcOffInteraction, context: {args} {kwargs}",
-            )
+        return home_zone_id
 
-            if target:
-                info_target = target.sim_info
 
-            if context.target_sim_id is not None:
-                target_id = context.target_sim_id
-                info_target = services.sim_info_manager().get(target_id)
+class SimRemoveRoomMateInteraction(CanysImmediateInteraction):
+    """New sim interaction to quickly remove roommates from the household."""
 
-            Logger.log(f"info_target: {info_target}")
+    test_predicates = predicate_pipeline(
+        TargetPredicate(
+            is_actor,
+            "sim can not be it's own roommate",
+            COST_ATTRIBUTE,
+            expected=False,
+        ),
+        TargetPredicate(
+            is_roommate,
+            "sim is not a roommate of current household",
+            COST_LOOKUP,
+        ),
+    )
+    requires_roommate_service = True
 
-            if not selection_group.is_household_npc(info_target):
-                return TestResult(False, "sim is not a household npc", inst)  # noqa: FBT003
+    def _run_for_sim_info(self: Self, sim_info: SimInfo) -> None:
+        roommate_service = ts4_services.get_roommate_service()
 
-            if info_target.household_id != services.active_household_id():
-                return TestResult(
-                    False,  # noqa: FBT003
-                    "sim is not a member of the active household",
-                    inst,
-                )
+        if roommate_service is None:
+            Logger.error("no roommate service to remove sim %s", sim_info.id)
+            return
 
-            return super(SimHouseholdNpcOffInteraction, inst_or_cls).test(
-                *args,
-                target=target,
-                context=context,
-                **kwargs,
-            )
-        except BaseException:
-            Logger.log(traceback.format_exc())
+        roommate_service.remove_roommate(sim_info)
 
-    def _run_interaction_gen(self: Self, timeline: Timeline) -> bool:
-        try:
-            Logger.log("running household npc off interaction...")
+        Logger.debug("sim is now not a roommate anymore!")
 
-            super()._run_interaction_gen(timeline)
 
-            sim_info = self.target.sim_info
+class SimHouseholdNpcOnInteraction(CanysImmediateInteraction):
+    """New sim interaction to turn household members into autonomus NPCs."""
 
-            if self.context.target_sim_id is not None:
-                sim_info = services.sim_info_manager().get(self.context.target_sim_id)
+    test_predicates = predicate_pipeline(
+        TargetPredicate(
+            is_household_npc,
+            "sim is already a household npc",
+            COST_LOOKUP,
+            expected=False,
+        ),
+        TargetPredicate(
+            is_in_active_household,
+            "sim is not a member of the active household",
+            COST_ATTRIBUTE,
+        ),
+    )
 
-            Logger.log(
-                f"got sim info {sim_info.first_name} {sim_info.last_name}",
-            )
+    def _run_for_sim_info(self: Self, sim_info: SimInfo) -> None:
+        selection_group = SelectionGroupService.get(ts4_services.active_household_id())
+        selection_group.add_household_npc(sim_info)
 
-            selection_group = SelectionGroupService.get(services.active_household_id())
-            selection_group.remove_household_npc(sim_info)
+        Logger.debug("sim is now a household npc!")
 
-            Logger.log("sim is now a normal household member!")
 
-            return True
+class SimHouseholdNpcOffInteraction(CanysImmediateInteraction):
+    """New sim interaction to remove a household member from the NPC list."""
 
-        except BaseException:
-            Logger.log(traceback.format_exc())
-            return False
+    test_predicates = predicate_pipeline(
+        TargetPredicate(
+            is_household_npc,
+            "sim is not a household npc",
+            COST_LOOKUP,
+        ),
+        TargetPredicate(
+            is_in_active_household,
+            "sim is not a member of the active household",
+            COST_ATTRIBUTE,
+        ),
+    )
+
+    def _run_for_sim_info(self: Self, sim_info: SimInfo) -> None:
+        selection_group = SelectionGroupService.get(ts4_services.active_household_id())
+        selection_group.remove_household_npc(sim_info)
+
+        Logger.debug("sim is now a normal household member!")
@@ -2,12 +2,15 @@
 
 import traceback
 
-import services
 from sims4 import commands
 
 import control_any_sim
+from control_any_sim import ts4_services
+from control_any_sim.services.roommate_cache import RoommateCacheService
 from control_any_sim.services.selection_group import SelectionGroupService
-from control_any_sim.util.logger import Logger
+from control_any_sim.util.event_channel import EventChannel
+from control_any_sim.util.inject import InjectionProfiler
+from control_any_sim.util.logger import Logger, LogLevel
 
 
 @commands.Command("canys.make_selectable", command_type=(commands.CommandType.Live))
@@ -24,13 +27,13 @@ def set_active_sim(
             output("SetActiveSim; Status:ParamError")
             return False
 
-        tgt_client = services.client_manager().get(_connection)
+        tgt_client = ts4_services.client_manager().get(_connection)
 
         if tgt_client is None:
             output("SetActiveSim; Status:ClientError no client")
             return False
 
-        sim_info = services.sim_info_manager().get_sim_info_by_name(
+        sim_info = ts4_services.sim_info_manager().get_sim_info_by_name(
             first_name,
             last_name,
         )
@@ -39,7 +42,9 @@ def set_active_sim(
             output("SetActiveSim; Status:SimError no sim with this name found")
             return False
 
-        SelectionGroupService.get(services.active_household_id()).make_sim_selectable(
+        SelectionGroupService.get(
+            ts4_services.active_household_id(),
+        ).make_sim_selectable(
             sim_info,
         )
 
@@ -51,7 +56,7 @@ def set_active_sim(
         return True
     except BaseException as exception:
         output(f"Error: {exception}")
-        Logger.log(traceback.format_exc())
+        Logger.debug(traceback.format_exc)
         return False
 
 
@@ -59,7 +64,11 @@ def set_active_sim(
 def get_selectable_sims(_connection: commands.Output = None) -> bool:
     """List all selectable sims."""
     output = commands.CheatOutput(_connection)
-    tgt_client = services.client_manager().get(_connection)
+    tgt_client = ts4_services.client_manager().get(_connection)
+
+    if tgt_client is None:
+        output("SelectableSims; Status:ClientError no client")
+        return False
 
     for sim_info in tgt_client.selectable_sims:
         output(
@@ -72,7 +81,12 @@ def get_selectable_sims(_connection: commands.Output = None) -> bool:
 def log_sim_info(_connection: commands.Output = None) -> bool:
     """Print detailed sim info."""
     output = commands.CheatOutput(_connection)
-    tgt_client = services.client_manager().get(_connection)
+    tgt_client = ts4_services.client_manager().get(_connection)
+
+    if tgt_client is None:
+        output("SimInfo; Status:ClientError no client")
+        return False
+
     sim_info = tgt_client.active_sim_info
 
     sim_info.log_sim_info(output)
@@ -97,3 +111,143 @@ def canys_get_version_command(_connection: commands.Output = None) -> bool:
 
     output(f"you are currently running version {version} of Control Any Sim")
     return True
+
+
+@commands.Command("canys.log_level", command_type=(commands.CommandType.Live))
+def canys_log_level_command(
+    level: str = "",
+    _connection: commands.Output = None,
+) -> bool:
+    """Print or change the minimum level of messages written to the log."""
+    output = commands.CheatOutput(_connection)
+
+    if not level:
+        output(f"current log level is {Logger.level.name}")
+        return True
+
+    try:
+        new_level = LogLevel[level.upper()]
+    except KeyError:
+        levels = ", ".join(log_level.name for log_level in LogLevel)
+        output(f"unknown log level {level}, expected one of: {levels}")
+        return False
+
+    Logger.set_level(new_level)
+    output(f"log level is now {new_level.name}")
+    return True
+
+
+@commands.Command("canys.profile", command_type=(commands.CommandType.Live))
+def canys_profile_command(
+    action: str = "dump",
+    _connection: commands.Output = None,
+) -> bool:
+    """Control profiling of the injected overrides: on, off, reset or dump."""
+    output = commands.CheatOutput(_connection)
+
+    if action in ("on", "off"):
+        if action == "on":
+            skipped = InjectionProfiler.enable()
+        else:
+            skipped = InjectionProfiler.disable()
+
+        for injection in skipped:
+            output(f"skipped {injection.name}, it has been patched by another mod")
+
+        output(f"profiling of injected overrides is {action}")
+        return True
+
+    if action == "reset":
+        InjectionProfiler.reset()
+        output("profiling counters have been reset")
+        return True
+
+    if action != "dump":
+        output(f"unknown action {action}, expected one of: on, off, reset, dump")
+        return False
+
+    if not InjectionProfiler.enabled:
+        output("profiling is disabled, enable it with: canys.profile on")
+
+    output("calls | total ms | avg us | max us | errors | override")
+
+    for profile in InjectionProfiler.sorted_profiles():
+        output(
+            f"{profile.calls} | {profile.total_time * 1000:.2f}"
+            f" | {profile.total_time / profile.calls * 1000000:.1f}"
+            f" | {profile.max_time * 1000000:.1f}"
+            f" | {profile.exceptions} | {profile.name}",
+        )
+
+    return True
+
+
+@commands.Command("canys.events", command_type=(commands.CommandType.Live))
+def canys_events_command(
+    action: str = "dump",
+    _connection: commands.Output = None,
+) -> bool:
+    """Report event listeners and control their timing: on, off, reset or dump."""
+    output = commands.CheatOutput(_connection)
+
+    if action == "on":
+        EventChannel.timing_enabled = True
+        output("timing of event listeners is enabled")
+        return True
+
+    if action == "off":
+        EventChannel.timing_enabled = False
+        output("timing of event listeners is disabled")
+        return True
+
+    if action == "reset":
+        for channel in EventChannel.channels:
+            for subscription in channel.subscriptions:
+                subscription.reset_timing()
+
+        output("event listener timings have been reset")
+        return True
+
+    if action != "dump":
+        output(f"unknown action {action}, expected one of: on, off, reset, dump")
+        return False
+
+    for channel in EventChannel.channels:
+        output(f"{channel.name}: {len(channel)} listeners")
+
+        slowest = sorted(
+            (
+                subscription
+                for subscription in channel.subscriptions
+                if subscription.calls > 0
+            ),
+            key=lambda subscription: subscription.max_time,
+            reverse=True,
+        )
+
+        for subscription in slowest[:3]:
+            output(
+                f"    {subscription.name}: {subscription.calls} calls"
+                f", max {subscription.max_time * 1000:.2f} ms"
+                f", total {subscription.total_time * 1000:.2f} ms"
+                f", {subscription.errors} errors",
+            )
+
+    return True
+
+
+@commands.Command("canys.roommates_check", command_type=(commands.CommandType.Live))
+def canys_roommates_check_command(_connection: commands.Output = None) -> bool:
+    """Compare the cached roommate lookups with the game's roommate service."""
+    output = commands.CheatOutput(_connection)
+    inconsistencies = RoommateCacheService.find_inconsistencies()
+    cached = sum(len(lookups) for lookups in RoommateCacheService.roommates.values())
+
+    for household_id, sim_id, is_cached, is_live in inconsistencies:
+        output(
+            f"sim {sim_id} of household {household_id}: cached {is_cached}"
+            f", roommate service {is_live}",
+        )
+
+    output(f"{len(inconsistencies)} of {cached} cached roommate lookups are stale")
+    return not inconsistencies
@@ -3,15 +3,16 @@
 from __future__ import annotations
 
 import traceback
-from typing import TYPE_CHECKING, Callable
+from typing import TYPE_CHECKING, Any, Callable, ClassVar
 
-import services
+from careers.career_tracker import CareerTracker
 from distributor.ops import SetIsNpc
 from objects.components.sim_inventory_component import (
     SimInventoryComponent,
 )
 from protocolbuffers import Sims_pb2
 from server.client import Client
+from server.clientmanager import ClientManager
 from sims.sim import Sim
 from sims.sim_info import SimInfo
 from venues.zone_director_residential import (
@@ -23,6 +24,7 @@ import control_any_sim.patches.small_business_income_data
 from control_any_sim import ts4_services
 from control_any_sim.services.integrity import IntegrityService
 from control_any_sim.services.interactions_service import InteractionsService
+from control_any_sim.services.roommate_cache import RoommateCacheService
 from control_any_sim.services.selection_group import SelectionGroupService
 from control_any_sim.util.game_events import GameEvents
 from control_any_sim.util.inject import (
@@ -37,7 +39,7 @@ if TYPE_CHECKING:
     from zone import Zone
 
 
-@inject_field_to(SimInfo, "is_npc", (SetIsNpc))
+@inject_field_to(SimInfo, "is_npc", (SetIsNpc), fast=True)
 def canys_sim_info_is_npc(original: Callable[[SimInfo], bool], self: SimInfo) -> bool:
     """
     Override of the SimInfo::is_npc field.
@@ -47,24 +49,47 @@ def canys_sim_info_is_npc(original: Callable[[SimInfo], bool], self: SimInfo) ->
     Sims that have been marked as household NPCs also return False when they are not active.
     """
     try:
-        if services.active_sim_info() == self:
-            return False
+        selection_group = SelectionGroupService.get_existing()
 
-        if services.active_household_id() == self.household_id:
-            selection_group = SelectionGroupService.get_existing()
+        if selection_group is not None:
+            return selection_group.is_sim_info_npc(self)
 
-            if not selection_group:
-                return False
+        if ts4_services.active_sim_info() == self:
+            return False
 
-            return selection_group.is_household_npc(self)
+        return ts4_services.active_household_id() != self.household_id
     except BaseException:
-        Logger.error(traceback.format_exc())
+        Logger.error(traceback.format_exc)
         return original(self)
-    else:
-        return True
 
 
-@inject_property_to(SimInfo, "is_selectable")
+@inject_method_to(Client, "set_active_sim_info")
+def canys_client_set_active_sim_info(
+    original: Callable[..., Any],
+    self: Client,
+    *args: Any,  # noqa: ANN401
+    **kwargs: Any,  # noqa: ANN401
+) -> Any:  # noqa: ANN401
+    """
+    Override for Client::set_active_sim_info method.
+
+    Resets the NPC status of the selection group before the active sim changes,
+    so no active sim changed listener of the client sees the old status. It is
+    reset again afterwards, in case it has been looked up during the change.
+    """
+    selection_group = SelectionGroupService.get_existing()
+
+    if selection_group is not None:
+        selection_group.reset_npc_status()
+
+    try:
+        return original(self, *args, **kwargs)
+    finally:
+        if selection_group is not None:
+            selection_group.reset_npc_status()
+
+
+@inject_property_to(SimInfo, "is_selectable", fast=True)
 def canys_sim_info_is_selectable(
     original: Callable[[SimInfo], bool],
     self: SimInfo,
@@ -75,21 +100,23 @@ def canys_sim_info_is_selectable(
     Makes all sims selectable that have been added to the client.
     """
     try:
-        active_household_id = services.active_household_id()
-        client = services.client_manager().get_client_by_household_id(
-            active_household_id,
-        )
+        selection_group = SelectionGroupService.get_existing()
+
+        if selection_group is not None and selection_group.zone_is_setup:
+            return selection_group.is_sim_info_selectable(self)
+
+        client = ts4_services.active_client()
 
         if client is None:
             return False
 
         return self in client.selectable_sims
     except BaseException:
-        Logger.error(traceback.format_exc())
+        Logger.error(traceback.format_exc)
         return original(self)
 
 
-@inject_method_to(SimInfo, "get_is_enabled_in_skewer")
+@inject_method_to(SimInfo, "get_is_enabled_in_skewer", fast=True)
 def canys_sim_info_get_is_enabled_in_skewer(
     original: Callable[[SimInfo, bool], bool],
     self: SimInfo,
@@ -115,23 +142,23 @@ def canys_sim_info_get_is_enabled_in_skewer(
         return original(self, consider_active_sim and can_consider_active_sim())
 
     except BaseException:
-        Logger.error(traceback.format_exc())
+        Logger.error(traceback.format_exc)
         return original(self, consider_active_sim)
 
 
 def can_consider_active_sim() -> bool:
     """Check if the active sim is part of the current household."""
-    client = ts4_services.client_manager().get_active_client()
+    client = ts4_services.active_client()
 
     if client is None:
         return True
 
     active_sim_info: SimInfo = client.active_sim_info
 
-    return active_sim_info.household_id == services.active_household_id()
+    return active_sim_info.household_id == ts4_services.active_household_id()
 
 
-@inject_property_to(Sim, "is_selected")
+@inject_property_to(Sim, "is_selected", fast=True)
 def canys_sim_info_is_selected(original: Callable[[Sim], bool], self: Sim) -> bool:
     """
     Override for Sim::is_selected property.
@@ -139,7 +166,7 @@ def canys_sim_info_is_selected(original: Callable[[Sim], bool], self: Sim) -> bo
     Reduces the logic to wether the Sim is active in the client or not.
     """
     try:
-        client = ts4_services.client_manager().get_active_client()
+        client = ts4_services.active_client()
 
         if client is None:
             return False
@@ -147,16 +174,59 @@ def canys_sim_info_is_selected(original: Callable[[Sim], bool], self: Sim) -> bo
         return self is client.active_sim
 
     except BaseException:
-        Logger.log(traceback.format_exc())
+        Logger.debug(traceback.format_exc)
         return original(self)
 
 
-@GameEvents.on_zone_spin_up
+@inject_method_to(ClientManager, "create_client")
+def canys_client_manager_create_client(
+    original: Callable[..., Client],
+    self: ClientManager,
+    *args: Any,  # noqa: ANN401
+    **kwargs: Any,  # noqa: ANN401
+) -> Client:
+    """
+    Override for ClientManager::create_client method.
+
+    Drops the cached active client when a client connects.
+    """
+    try:
+        return original(self, *args, **kwargs)
+    finally:
+        ts4_services.invalidate_active_client()
+
+
+@inject_method_to(ClientManager, "remove")
+def canys_client_manager_remove(
+    original: Callable[..., None],
+    self: ClientManager,
+    *args: Any,  # noqa: ANN401
+    **kwargs: Any,  # noqa: ANN401
+) -> None:
+    """
+    Override for ClientManager::remove method.
+
+    Drops the cached active client when a client disconnects.
+    """
+    try:
+        return original(self, *args, **kwargs)
+    finally:
+        ts4_services.invalidate_active_client()
+
+
+# the service wrappers and the active client belong to the zone
+GameEvents.on_zone_teardown(ts4_services.reset)
+
+
 def canys_init_services(_zone: Zone, household_id: int, _active_sim_id: int) -> None:
     """Game event listener for when a zone has been spun up."""
     SelectionGroupService.get(household_id)
 
 
+# setting up the selection group is not required to finish the zone spin up
+GameEvents.on_zone_spin_up(canys_init_services, deferred=True)
+
+
 @inject_method_to(ZoneDirectorResidentialBase, "_is_any_sim_always_greeted")
 def canys_zone_director_residential_base_is_any_sim_always_greeted(
     original: Callable[[ZoneDirectorResidentialBase], bool],
@@ -168,25 +238,25 @@ def canys_zone_director_residential_base_is_any_sim_always_greeted(
     Allows all sims in the selection group to be always greeted if any of them belongs to the lot household.
     """
     try:
-        active_lot_household = services.current_zone().get_active_lot_owner_household()
-        selection_group = SelectionGroupService.get(services.active_household_id())
+        active_lot_household = (
+            ts4_services.current_zone().get_active_lot_owner_household()
+        )
 
         if active_lot_household is None:
             return original(self)
 
-        for sim_info in active_lot_household.sim_infos:
-            if sim_info.id not in selection_group.selectable_sims:
-                continue
+        selection_group = SelectionGroupService.get(ts4_services.active_household_id())
 
+        if selection_group.has_custom_sim_in_household(active_lot_household):
             return True
 
         return original(self)
     except BaseException:
-        Logger.error(traceback.format_exc())
+        Logger.error(traceback.format_exc)
         return original(self)
 
 
-@inject_method_to(SimInventoryComponent, "allow_ui")
+@inject_method_to(SimInventoryComponent, "allow_ui", fast=True)
 def tn_sim_inventory_component_allow_ui(
     original: Callable[[SimInventoryComponent], bool],
     self: SimInventoryComponent,
@@ -202,7 +272,7 @@ def tn_sim_inventory_component_allow_ui(
 
         return original(self)
     except BaseException:
-        Logger.error(traceback.format_exc())
+        Logger.error(traceback.format_exc)
         return original(self)
 
 
@@ -212,7 +282,109 @@ def canys_validate_version(_zone: Zone) -> None:
     IntegrityService.check_integrety(control_any_sim.__version__)
 
 
-@inject_method_to(Client, "_get_selector_visual_type")
+class SelectorVisualTypeMemo:
+    """
+    Memo of the selector visual types of the sims in the skewer.
+
+    Every skewer update asks for the visual type of every selectable sim. The
+    results are remembered across updates until the selection group or the
+    current zone change. They are dropped when sims spawn or travel, careers
+    change or the zone is torn down.
+    """
+
+    results: ClassVar[dict[int, tuple[int, CareerCategory | None]]] = {}
+    # (current zone id, household id and generation of the selection group)
+    state: ClassVar[tuple[int, int, int] | None] = None
+
+    @classmethod
+    def invalidate(
+        cls: type[SelectorVisualTypeMemo],
+        *_args: Any,  # noqa: ANN401
+    ) -> None:
+        """Drop all remembered results, accepts and ignores event arguments."""
+        cls.results.clear()
+        cls.state = None
+
+    @classmethod
+    def get(
+        cls: type[SelectorVisualTypeMemo],
+        sim_id: int,
+    ) -> tuple[int, CareerCategory | None] | None:
+        """Get the remembered visual type of a sim or None."""
+        selection_group = SelectionGroupService.get_existing()
+        state = (
+            ts4_services.current_zone_id(),
+            selection_group.household_id if selection_group else 0,
+            selection_group.selection_generation if selection_group else 0,
+        )
+
+        if state != cls.state:
+            cls.results.clear()
+            cls.state = state
+
+        return cls.results.get(sim_id)
+
+    @classmethod
+    def remember(
+        cls: type[SelectorVisualTypeMemo],
+        sim_id: int,
+        visual_type: tuple[int, CareerCategory | None],
+    ) -> None:
+        """Remember the visual type of a sim."""
+        cls.results[sim_id] = visual_type
+
+
+def canys_watch_spawned_sims(
+    _zone: Zone,
+    _household_id: int,
+    _active_sim_id: int,
+) -> None:
+    """Game event listener that registers with the sim spawner of a new zone."""
+    GameEvents.on_post_spawn_sim(SelectorVisualTypeMemo.invalidate)
+
+
+GameEvents.on_zone_spin_up(canys_watch_spawned_sims)
+GameEvents.on_travel_sim_out(SelectorVisualTypeMemo.invalidate)
+GameEvents.on_zone_teardown(SelectorVisualTypeMemo.invalidate)
+
+
+@inject_method_to(CareerTracker, "add_career")
+def canys_career_tracker_add_career(
+    original: Callable[..., None],
+    self: CareerTracker,
+    *args: Any,  # noqa: ANN401
+    **kwargs: Any,  # noqa: ANN401
+) -> None:
+    """
+    Override for CareerTracker::add_career method.
+
+    Drops the remembered selector visual types, they depend on the careers.
+    """
+    try:
+        return original(self, *args, **kwargs)
+    finally:
+        SelectorVisualTypeMemo.invalidate()
+
+
+@inject_method_to(CareerTracker, "remove_career")
+def canys_career_tracker_remove_career(
+    original: Callable[..., None],
+    self: CareerTracker,
+    *args: Any,  # noqa: ANN401
+    **kwargs: Any,  # noqa: ANN401
+) -> None:
+    """
+    Override for CareerTracker::remove_career method.
+
+    Drops the remembered selector visual types, they depend on the careers.
+    """
+    try:
+        return original(self, *args, **kwargs)
+    finally:
+        SelectorVisualTypeMemo.invalidate()
+
+
+@inject_method_to(Client, "_get_selector_visual_type", fast=True)
 def canys_client_get_selector_visual_type(
     original: Callable[[Client, SimInfo], tuple[int, CareerCategory]],
     self: Client,
@@ -221,36 +393,53 @@ def canys_client_get_selector_visual_type(
     """
     Override for Client::_get_selector_visual_type method.
 
-    Clear selector visual type override for controled sims.
+    Clear selector visual type override for controled sims. The results are
+    remembered by the SelectorVisualTypeMemo.
 
     """
     try:
-        Logger.log("getting selector visual type")
+        visual_type = SelectorVisualTypeMemo.get(sim_info.id)
 
-        selection_group = SelectionGroupService.get_existing()
+        if visual_type is None:
+            visual_type = get_selector_visual_type(original, self, sim_info)
+            SelectorVisualTypeMemo.remember(sim_info.id, visual_type)
 
-        (original_type, original_career_category) = original(self, sim_info)
+        return visual_type
+    except Exception as err:
+        Logger.error("%s", err)
+        Logger.error(traceback.format_exc)
 
-        if not selection_group:
-            return (original_type, original_career_category)
+        return original(self, sim_info)
 
-        if original_type == Sims_pb2.SimPB.OTHER:
-            Logger.log("original type is OTHER")
-            sim_zone_id = sim_info.zone_id
 
-            # Override default behavior if the sim is in the current zone.
-            if sim_zone_id == services.current_zone_id():
-                Logger.log("sim is in current zone so return NORMAL")
-                return (Sims_pb2.SimPB.NORMAL, None)
+def get_selector_visual_type(
+    original: Callable[[Client, SimInfo], tuple[int, CareerCategory]],
+    client: Client,
+    sim_info: SimInfo,
+) -> tuple[int, CareerCategory | None]:
+    """Get the selector visual type of a sim, with the override for controled sims."""
+    Logger.debug("getting selector visual type")
+
+    selection_group = SelectionGroupService.get_existing()
+
+    (original_type, original_career_category) = original(client, sim_info)
 
+    if not selection_group:
         return (original_type, original_career_category)
-    except Exception as err:
-        Logger.error(f"{err}")
-        Logger.error(traceback.format_exc())
 
-        return original(self, sim_info)
+    if original_type == Sims_pb2.SimPB.OTHER:
+        Logger.debug("original type is OTHER")
+        sim_zone_id = sim_info.zone_id
+
+        # Override default behavior if the sim is in the current zone.
+        if sim_zone_id == ts4_services.current_zone_id():
+            Logger.debug("sim is in current zone so return NORMAL")
+            return (Sims_pb2.SimPB.NORMAL, None)
+
+    return (original_type, original_career_category)
 
 
-Logger.log("starting control_any_sim...")
+Logger.debug("starting control_any_sim...")
 
 InteractionsService.bootstrap()
+RoommateCacheService.bootstrap()
@@ -2,17 +2,18 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
-
-import services
+from typing import TYPE_CHECKING, ClassVar
 
+from control_any_sim import ts4_services
 from control_any_sim.util.game_events import GameEvents
 from control_any_sim.util.logger import Logger
 
 if TYPE_CHECKING:
-    from interactions.interaction_instance_manager import InteractionInstanceManager
+    from interactions.base.super_interaction import SuperInteraction
+    from server.client import Client
     from sims.sim import Sim
     from type import Self
+    from zone import Zone
 
 
 class InteractionsService:
@@ -27,17 +28,35 @@ class InteractionsService:
         12276091593751358701,
     )
 
+    # resolved interaction classes, cached until the zone is torn down
+    injected_affordances: tuple[type[SuperInteraction], ...] | None = None
+    # affordance lists with the injected interactions, keyed by the original list
+    interned_affordances: ClassVar[
+        dict[
+            tuple[type[SuperInteraction], ...],
+            tuple[type[SuperInteraction], ...],
+        ]
+    ] = {}
+    # patched affordance lists of the sim classes, keyed by class and attribute
+    patched_class_affordances: ClassVar[
+        dict[tuple[type[Sim], str], tuple[type[SuperInteraction], ...]]
+    ] = {}
+
     @classmethod
     def bootstrap(cls: type[Self]) -> None:
         """Boostrap service and inject event listeners."""
-        Logger.log("bootstrapping interactions service...")
-        GameEvents.on_add_sim(cls.inject_into_sim)
-        GameEvents.on_add_sim(cls.inject_into_relationship_panel)
+        Logger.debug("bootstrapping interactions service...")
+        GameEvents.on_add_sim(cls.inject_into_sim, deferred=True)
+        GameEvents.on_add_sim(cls.inject_into_relationship_panel, deferred=True)
+        GameEvents.on_zone_teardown(cls.on_zone_teardown)
 
     @classmethod
-    def inject_into_sim(cls: type[Self], sim: Sim) -> None:
-        """Event listener that runs every time a new sim is added."""
-        affordance_manager: InteractionInstanceManager = services.affordance_manager()
+    def get_injected_affordances(cls: type[Self]) -> tuple[type[SuperInteraction], ...]:
+        """Get the interaction classes that are injected into every sim."""
+        if cls.injected_affordances is not None:
+            return cls.injected_affordances
+
+        affordance_manager = ts4_services.affordance_manager()
         injected_interactions = []
 
         for interaction_id in cls.sim_interactions:
@@ -45,31 +64,80 @@ class InteractionsService:
 
             if interaction_class is None:
                 Logger.error(
-                    f"interaction {interaction_id} not found in affordance_manager",
+                    "interaction %s not found in affordance_manager",
+                    interaction_id,
                 )
                 continue
 
             injected_interactions.append(interaction_class)
 
-        sim._super_affordances = sim._super_affordances + tuple(injected_interactions)  # noqa: SLF001
+        cls.injected_affordances = tuple(injected_interactions)
+
+        return cls.injected_affordances
+
+    @classmethod
+    def on_zone_teardown(cls: type[Self], _zone: Zone, _client: Client) -> None:
+        """Event listener that drops the resolved interactions with the zone."""
+        cls.injected_affordances = None
+        cls.interned_affordances.clear()
+        cls.patched_class_affordances.clear()
+
+    @classmethod
+    def inject_into_sim(cls: type[Self], sim: Sim) -> None:
+        """Event listener that runs every time a new sim is added."""
+        cls._inject_affordances(sim, "_super_affordances")
 
     @classmethod
     def inject_into_relationship_panel(cls: type[Self], sim: Sim) -> None:
         """Event listener that adds interactions to the relationship panel everytime a sim is loaded."""
-        affordance_manager = services.affordance_manager()
-        injected_interactions = []
+        cls._inject_affordances(sim, "_relation_panel_affordances")
 
-        for interaction_id in cls.sim_interactions:
-            interaction_class = affordance_manager.get(interaction_id)
+    @classmethod
+    def _inject_affordances(cls: type[Self], sim: Sim, attribute_name: str) -> None:
+        """
+        Add the injected interactions to an affordance list of a sim.
 
-            if interaction_class is None:
-                Logger.error(
-                    f"interaction {interaction_id} not found in affordance_manager",
-                )
-                continue
+        The list is patched on the sim class, so it is only extended once and
+        shared by all sims of that class. Sims that carry their own list get an
+        interned tuple that is shared by all sims with the same list.
+        """
+        instance_affordances = vars(sim).get(attribute_name)
 
-            injected_interactions.append(interaction_class)
+        if instance_affordances is not None:
+            setattr(
+                sim,
+                attribute_name,
+                cls._with_injected_affordances(instance_affordances),
+            )
+            return
+
+        key = (type(sim), attribute_name)
+        class_affordances = getattr(key[0], attribute_name)
+
+        # every later sim of a patched class only needs this lookup
+        if cls.patched_class_affordances.get(key) is class_affordances:
+            return
+
+        patched_affordances = cls._with_injected_affordances(class_affordances)
+        cls.patched_class_affordances[key] = patched_affordances
+
+        if patched_affordances is not class_affordances:
+            setattr(key[0], attribute_name, patched_affordances)
+
+    @classmethod
+    def _with_injected_affordances(
+        cls: type[Self],
+        affordances: tuple[type[SuperInteraction], ...],
+    ) -> tuple[type[SuperInteraction], ...]:
+        injected_affordances = cls.get_injected_affordances()
+
+        if not injected_affordances or injected_affordances[0] in affordances:
+            return affordances
+
+        patched_affordances = cls.interned_affordances.get(affordances)
+
+        if patched_affordances is None:
+            patched_affordances = affordances + injected_affordances
+            cls.interned_affordances[affordances] = patched_affordances
 
-        sim._relation_panel_affordances = sim._relation_panel_affordances + tuple(  # noqa: SLF001
-            injected_interactions,
-        )
+        return patched_affordances
@@ -0,0 +1,168 @@
+"""Service that caches roommate lookups of the game's roommate service."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, Callable, ClassVar
+
+from control_any_sim import ts4_services
+from control_any_sim.util.game_events import GameEvents
+from control_any_sim.util.inject import inject_method_to
+from control_any_sim.util.logger import Logger
+
+if TYPE_CHECKING:
+    from server.client import Client
+    from sims.sim_info import SimInfo
+    from zone import Zone
+
+
+class RoommateCacheService:
+    """
+    Caches the roommate status of sims per household.
+
+    Lookups are answered by the game's roommate service once and remembered
+    afterwards. The add_roommate and remove_roommate methods of the roommate
+    service are wrapped to drop the cache every time the roommates change.
+    """
+
+    # household id -> sim id -> is roommate of the household
+    roommates: ClassVar[dict[int, dict[int, bool]]] = {}
+    # changes every time the cache is dropped
+    generation = 0
+    # class of the roommate service the wrappers have been injected into
+    injected_class: type | None = None
+
+    @classmethod
+    def bootstrap(cls: type[RoommateCacheService]) -> None:
+        """Boostrap service and inject event listeners."""
+        Logger.debug("bootstrapping roommate cache service...")
+        GameEvents.on_zone_teardown(cls.on_zone_teardown)
+
+    @classmethod
+    def on_zone_teardown(
+        cls: type[RoommateCacheService],
+        _zone: Zone,
+        _client: Client,
+    ) -> None:
+        """Event listener that drops the cache with the zone."""
+        cls.invalidate()
+
+    @classmethod
+    def invalidate(cls: type[RoommateCacheService]) -> None:
+        """Drop all cached roommate lookups."""
+        cls.roommates.clear()
+        cls.generation += 1
+
+    @classmethod
+    def is_roommate(
+        cls: type[RoommateCacheService],
+        sim_info: SimInfo,
+        household_id: int,
+    ) -> bool:
+        """Check if a sim is a roommate of the given household."""
+        household_roommates = cls.roommates.get(household_id)
+
+        if household_roommates is None:
+            household_roommates = {}
+            cls.roommates[household_id] = household_roommates
+
+        is_roommate = household_roommates.get(sim_info.id)
+
+        if is_roommate is not None:
+            return is_roommate
+
+        roommate_service = ts4_services.get_roommate_service()
+
+        if roommate_service is None:
+            return False
+
+        cls._inject_into(type(roommate_service))
+
+        is_roommate = bool(
+            roommate_service.is_sim_info_roommate(sim_info, household_id),
+        )
+        household_roommates[sim_info.id] = is_roommate
+
+        return is_roommate
+
+    @classmethod
+    def find_inconsistencies(
+        cls: type[RoommateCacheService],
+    ) -> list[tuple[int, int, bool, bool]]:
+        """
+        Compare all cached lookups with the game's roommate service.
+
+        Returns
+        -------
+            A list of (household id, sim id, cached, live) for every lookup
+            that does not match the roommate service.
+
+        """
+        roommate_service = ts4_services.get_roommate_service()
+        sim_info_manager = ts4_services.sim_info_manager()
+        inconsistencies: list[tuple[int, int, bool, bool]] = []
+
+        if roommate_service is None:
+            return inconsistencies
+
+        for household_id, household_roommates in cls.roommates.items():
+            for sim_id, cached in household_roommates.items():
+                sim_info = sim_info_manager.get(sim_id)
+                live = sim_info is not None and bool(
+                    roommate_service.is_sim_info_roommate(sim_info, household_id),
+                )
+
+                if live != cached:
+                    inconsistencies.append((household_id, sim_id, cached, live))
+
+        return inconsistencies
+
+    @classmethod
+    def _inject_into(
+        cls: type[RoommateCacheService],
+        roommate_service_class: type,
+    ) -> None:
+        if cls.injected_class is roommate_service_class:
+            return
+
+        cls.injected_class = roommate_service_class
+
+        inject_method_to(roommate_service_class, "add_roommate")(
+            canys_roommate_service_add_roommate,
+        )
+        inject_method_to(roommate_service_class, "remove_roommate")(
+            canys_roommate_service_remove_roommate,
+        )
+
+
+def canys_roommate_service_add_roommate(
+    original: Callable[..., Any],
+    self: Any,  # noqa: ANN401
+    *args: Any,  # noqa: ANN401
+    **kwargs: Any,  # noqa: ANN401
+) -> Any:  # noqa: ANN401
+    """
+    Override for RoommateService::add_roommate method.
+
+    Drops the cached roommate lookups after the roommates have changed.
+    """
+    try:
+        return original(self, *args, **kwargs)
+    finally:
+        RoommateCacheService.invalidate()
+
+
+def canys_roommate_service_remove_roommate(
+    original: Callable[..., Any],
+    self: Any,  # noqa: ANN401
+    *args: Any,  # noqa: ANN401
+    **kwargs: Any,  # noqa: ANN401
+) -> Any:  # noqa: ANN401
+    """
+    Override for RoommateService::remove_roommate method.
+
+    Drops the cached roommate lookups after the roommates have changed.
+    """
+    try:
+        return original(self, *args, **kwargs)
+    finally:
+        RoommateCacheService.invalidate()
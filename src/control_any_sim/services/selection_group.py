@@ -7,27 +7,37 @@ Handles all the patching to make selectable NPC sims possible.
 from __future__ import annotations
 
 import traceback
+from collections import deque
 from pathlib import Path
-from typing import TYPE_CHECKING, TypeVar
+from typing import TYPE_CHECKING, ClassVar, TypeVar
 
-import services
+import alarms
+import clock
 from objects import ALL_HIDDEN_REASONS
 from objects.components.types import (
     INVENTORY_COMPONENT,
 )
 from sims.sim_info_lod import SimInfoLODLevel
 
+from control_any_sim import ts4_services
 from control_any_sim.util.game_events import GameEvents
 from control_any_sim.util.logger import Logger
-from control_any_sim.util.serialize import Serializable
+from control_any_sim.util.persistence import StateStore
+from control_any_sim.util.serialize import Serializable, SerializedField
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from alarms import AlarmHandle
     from server.client import Client
+    from sims.household import Household
     from sims.sim import Sim
     from sims.sim_info import SimInfo
     from typing_extensions import Self
     from zone import Zone
 
+    from control_any_sim.util.event_channel import Subscription
+
 
 def get_home_dir() -> str:
     """Get path to mods install dir."""
@@ -38,6 +48,9 @@ def get_home_dir() -> str:
 
 HOME_DIR = get_home_dir()
 
+# selection groups used to be stored in a single file for the last household
+LEGACY_STATE_FILE = Path(HOME_DIR) / "selection_group.json"
+
 
 C = TypeVar("C", bound="SelectionGroupService")
 
@@ -45,11 +58,41 @@ C = TypeVar("C", bound="SelectionGroupService")
 class SelectionGroupService(Serializable):
     """Service to manage the selection group."""
 
-    instance: Self | None = None
+    PERSIST_DELAY = 2.0
+    SKEWER_UPDATE_DELAY = 0.05
+    CHANGE_LOG_SIZE = 256
+
+    state_store = StateStore(Path(HOME_DIR) / "selection_groups")
+
+    schema_version = 1
+    serialized_fields = (
+        SerializedField("household_id", int),
+        SerializedField("selectable_sims", list, int, required=False),
+        SerializedField("household_npcs", list, int, required=False),
+    )
+
+    instance: ClassVar[SelectionGroupService | None] = None
     zone_is_setup = False
     household_id: int
-    selectable_sims: list[int]
     household_npcs: list[int]
+    # ordered sets of sim ids, values are always None
+    _selectable_sims_index: dict[int, None]
+    _client_selectable_ids: dict[int, None]
+    _client_selectable_ids_stale: bool
+    # watcher notifications that have not been followed by a selectable sim event
+    _unmatched_notifications: int
+    _household_npcs_index: set[int]
+    # (active sim id, active household id) used by the is_npc override
+    _npc_status: tuple[int | None, int] | None
+    _household_npcs_dirty: bool
+    _selection_generation: int
+    # (generation, sim id, added) for every change of the custom sims
+    _selection_changes: deque[tuple[int, int, bool]]
+    _selection_changes_floor: int
+    _persisted_generation: int
+    _persist_alarm: AlarmHandle | None
+    _skewer_update_alarm: AlarmHandle | None
+    _subscriptions: list[Subscription]
 
     @classmethod
     def get(
@@ -81,16 +124,17 @@ class SelectionGroupService(Serializable):
         if cls.instance is not None:
             return cls.instance
 
-        Logger.log(f"selection group: no instance, {household_id}")
+        Logger.debug("selection group: no instance, %s", household_id)
 
         # restore state
         try:
-            with Path(HOME_DIR + "/selection_group.json").open(
-                encoding="utf8",
-            ) as file_handler:
-                state = file_handler.read()
+            state = cls.state_store.load(household_id)
 
-            Logger.log(f"restored state: {state}")
+            if state is None and LEGACY_STATE_FILE.is_file():
+                with LEGACY_STATE_FILE.open(encoding="utf8") as file_handler:
+                    state = file_handler.read()
+
+            Logger.debug("restored state: %s", state)
         except BaseException:
             state = None
 
@@ -106,53 +150,342 @@ class SelectionGroupService(Serializable):
 
             return instance
         except BaseException as err:
-            Logger.error(f"Failed to deserialize state: {err}")
+            Logger.error("Failed to deserialize state: %s", err)
             return cls(household_id)
 
     @property
     def client(self: Self) -> Client:
         """Get the current game client."""
-        return services.get_first_client()
+        return ts4_services.get_first_client()
 
     def __init__(
         self: Self,
         household_id: int,
         selectable_sims: list[int] | None = None,
-        zone_is_setup: bool | None = None,  # noqa: ARG002
         household_npcs: list[int] | None = None,
     ) -> None:
         """Create a new instance if the service."""
         self.household_id = household_id
-        self.selectable_sims = selectable_sims if selectable_sims is not None else []
         self.household_npcs = household_npcs if household_npcs is not None else []
-
-        if self.selectable_sims is None or len(self.selectable_sims) == 0:
+        self._selectable_sims_index = dict.fromkeys(selectable_sims or ())
+        self._client_selectable_ids = {}
+        self._client_selectable_ids_stale = True
+        self._unmatched_notifications = 0
+        self._household_npcs_index = set(self.household_npcs)
+        self._npc_status = None
+        self._household_npcs_dirty = False
+        self._selection_generation = 0
+        self._selection_changes = deque(maxlen=self.CHANGE_LOG_SIZE)
+        self._selection_changes_floor = 0
+        self._persisted_generation = -1
+        self._persist_alarm = None
+        self._skewer_update_alarm = None
+
+        if not self._selectable_sims_index:
             self.update_selectable_sims()
 
-        GameEvents.on_zone_teardown(self.on_zone_teardown)
-        GameEvents.on_active_sim_changed(self.on_active_sim_changed)
-        GameEvents.on_post_spawn_sim(self.on_spawn_sim)
-        GameEvents.on_travel_sim_out(self.on_sim_travel_out)
+        self._subscriptions = [
+            GameEvents.on_zone_teardown(self.on_zone_teardown),
+            GameEvents.on_active_sim_changed(self.on_active_sim_changed),
+            GameEvents.on_post_spawn_sim(self.on_spawn_sim),
+            GameEvents.on_travel_sim_out(self.on_sim_travel_out),
+            GameEvents.on_selectable_sim_added(self.on_selectable_sim_added),
+            GameEvents.on_selectable_sim_removed(self.on_selectable_sim_removed),
+        ]
+
+    @property
+    def selectable_sims(self: Self) -> list[int]:
+        """Ids of the selectable sims outside of the household, in insertion order."""
+        self._sync_client_selectable_ids()
+
+        return list(self._selectable_sims_index)
+
+    @property
+    def selection_generation(self: Self) -> int:
+        """Generation counter that changes every time the selection group changes."""
+        self._sync_client_selectable_ids()
+
+        return self._selection_generation
+
+    def invalidate_selectable_sims(self: Self) -> None:
+        """Mark all cached information about the selectable sims as stale."""
+        self._selection_generation += 1
+
+    def changes_since(
+        self: Self,
+        generation: int,
+    ) -> tuple[list[int], list[int]] | None:
+        """
+        Get the net changes of the custom sims since a generation.
+
+        Sims that have been added and removed again in the meantime are not
+        part of the result.
+
+        Returns
+        -------
+            The ids of the added and of the removed sims or None if the change
+            log does not reach back to the generation anymore.
+
+        """
+        self._sync_client_selectable_ids()
+
+        if generation < self._selection_changes_floor:
+            return None
+
+        # sim id -> (custom sim before the generation, custom sim now)
+        states: dict[int, tuple[bool, bool]] = {}
+
+        for change_generation, sim_id, added in reversed(self._selection_changes):
+            if change_generation <= generation:
+                break
+
+            now = states[sim_id][1] if sim_id in states else added
+            states[sim_id] = (not added, now)
+
+        added_ids = [sim_id for sim_id, (before, now) in states.items() if now > before]
+        removed_ids = [
+            sim_id for sim_id, (before, now) in states.items() if now < before
+        ]
+
+        return (added_ids, removed_ids)
+
+    def _record_selection_change(self: Self, sim_id: int, *, added: bool) -> None:
+        self.invalidate_selectable_sims()
+
+        if len(self._selection_changes) == self._selection_changes.maxlen:
+            # the oldest change is about to be dropped from the log
+            self._selection_changes_floor = self._selection_changes[0][0]
+
+        self._selection_changes.append((self._selection_generation, sim_id, added))
 
     def persist_state(self: Self) -> None:
-        """Write current state of the service to disk."""
-        data = self.serialize()
+        """
+        Write current state of the service to disk.
+
+        Any scheduled write is performed right away. Nothing is written if
+        neither the custom sims nor the household NPCs changed since the state
+        has been persisted the last time.
+        """
+        self._sync_client_selectable_ids()
+        self._cancel_persist_alarm()
+
+        changes = self.changes_since(self._persisted_generation)
+
+        if changes == ([], []) and not self._household_npcs_dirty:
+            self._persisted_generation = self._selection_generation
+            return
+
+        self.state_store.save(self.household_id, self.serialize())
+        self._household_npcs_dirty = False
+        self._persisted_generation = self._selection_generation
+
+    def schedule_persist_state(self: Self) -> None:
+        """
+        Persist the current state after a short delay.
+
+        Repeated calls within the delay are coalesced into a single write.
+        """
+        self._cancel_persist_alarm()
+
+        self._persist_alarm = alarms.add_alarm_real_time(
+            self,
+            clock.interval_in_real_seconds(self.PERSIST_DELAY),
+            self._on_persist_alarm,
+        )
 
-        with (Path(HOME_DIR) / "selection_group.json").open(
-            "w",
-            encoding="utf8",
-        ) as file_handler:
-            file_handler.write(data)
+    def _on_persist_alarm(self: Self, _handle: AlarmHandle) -> None:
+        self._persist_alarm = None
+
+        try:
+            self.persist_state()
+        except BaseException:
+            Logger.error(traceback.format_exc)
+
+    def _cancel_persist_alarm(self: Self) -> None:
+        if self._persist_alarm is None:
+            return
+
+        alarms.cancel_alarm(self._persist_alarm)
+        self._persist_alarm = None
+
+    def schedule_selectable_sims_update(self: Self) -> None:
+        """
+        Send the selectable sims to the skewer after a short delay.
+
+        All requests within the delay are coalesced into a single update.
+        """
+        if self._skewer_update_alarm is not None:
+            return
+
+        # without an active service nobody would send the pending update
+        if self.__class__.instance is not self:
+            self.send_selectable_sims_update()
+            return
+
+        self._skewer_update_alarm = alarms.add_alarm_real_time(
+            self,
+            clock.interval_in_real_seconds(self.SKEWER_UPDATE_DELAY),
+            self._on_skewer_update_alarm,
+        )
+
+    def send_selectable_sims_update(self: Self) -> None:
+        """Send the selectable sims to the skewer right away."""
+        self._cancel_skewer_update_alarm()
+        self.client.send_selectable_sims_update()
+
+    def _on_skewer_update_alarm(self: Self, _handle: AlarmHandle) -> None:
+        self._skewer_update_alarm = None
+
+        try:
+            self.client.send_selectable_sims_update()
+        except BaseException:
+            Logger.error(traceback.format_exc)
+
+    def _cancel_skewer_update_alarm(self: Self) -> None:
+        if self._skewer_update_alarm is None:
+            return
+
+        alarms.cancel_alarm(self._skewer_update_alarm)
+        self._skewer_update_alarm = None
 
     def update_selectable_sims(self: Self) -> None:
-        """Set selection group to all currently selectable sims."""
-        selectable_sims: list[SimInfo] = self.client.selectable_sims
+        """
+        Set selection group to all currently selectable sims.
 
-        self.selectable_sims = [
-            sim_info.id
-            for sim_info in selectable_sims
-            if sim_info.household_id != self.household_id
-        ]
+        This is a full rebuild from the client. Regular changes are tracked
+        incrementally through the selectable sim events, the rebuild only
+        runs when the client changed without emitting them.
+        """
+        selectable_sims: dict[int, SimInfo] = {
+            sim_info.id: sim_info for sim_info in self.client.selectable_sims
+        }
+
+        self._rebuild_client_selectable_ids(selectable_sims)
+        self._client_selectable_ids_stale = False
+        self._unmatched_notifications = 0
+
+        if self._rebuild_custom_sims(selectable_sims) and self.zone_is_setup:
+            self.schedule_persist_state()
+
+    def _rebuild_client_selectable_ids(
+        self: Self,
+        selectable_sims: dict[int, SimInfo],
+    ) -> None:
+        for sim_id in tuple(self._client_selectable_ids):
+            if sim_id in selectable_sims:
+                continue
+
+            del self._client_selectable_ids[sim_id]
+            self.invalidate_selectable_sims()
+
+        for sim_id in selectable_sims:
+            if sim_id not in self._client_selectable_ids:
+                self._client_selectable_ids[sim_id] = None
+                self.invalidate_selectable_sims()
+
+    def _rebuild_custom_sims(self: Self, selectable_sims: dict[int, SimInfo]) -> bool:
+        selection_changed = False
+
+        for sim_id, sim_info in selectable_sims.items():
+            is_custom_sim = sim_info.household_id != self.household_id
+
+            if is_custom_sim == (sim_id in self._selectable_sims_index):
+                continue
+
+            if is_custom_sim:
+                self._selectable_sims_index[sim_id] = None
+            else:
+                del self._selectable_sims_index[sim_id]
+
+            self._record_selection_change(sim_id, added=is_custom_sim)
+            selection_changed = True
+
+        for sim_id in tuple(self._selectable_sims_index):
+            if sim_id not in selectable_sims:
+                del self._selectable_sims_index[sim_id]
+                self._record_selection_change(sim_id, added=False)
+                selection_changed = True
+
+        return selection_changed
+
+    def on_selectable_sims_notified(self: Self) -> None:
+        """
+        Watcher for every change of the client selectable sims.
+
+        The changes themselves arrive through the selectable sim events after
+        the watchers have been notified. Every event matches one notification,
+        notifications without an event make the service rebuild the tracked
+        sims before they are used the next time.
+        """
+        self._unmatched_notifications += 1
+
+    def on_selectable_sim_added(self: Self, sim_info: SimInfo) -> None:
+        """Event handler for when a sim has been added to the client."""
+        if self._match_notification():
+            return
+
+        if sim_info.id in self._client_selectable_ids:
+            return
+
+        self._client_selectable_ids[sim_info.id] = None
+        self.invalidate_selectable_sims()
+
+        if sim_info.household_id == self.household_id:
+            return
+
+        self._selectable_sims_index[sim_info.id] = None
+        self._record_selection_change(sim_info.id, added=True)
+
+        if self.zone_is_setup:
+            self.schedule_persist_state()
+
+    def on_selectable_sim_removed(self: Self, sim_info: SimInfo) -> None:
+        """Event handler for when a sim has been removed from the client."""
+        if self._match_notification():
+            return
+
+        if sim_info.id not in self._client_selectable_ids:
+            return
+
+        del self._client_selectable_ids[sim_info.id]
+        self.invalidate_selectable_sims()
+
+        if sim_info.id not in self._selectable_sims_index:
+            return
+
+        del self._selectable_sims_index[sim_info.id]
+        self._record_selection_change(sim_info.id, added=False)
+
+        if self.zone_is_setup:
+            self.schedule_persist_state()
+
+    def _match_notification(self: Self) -> bool:
+        """
+        Match a selectable sim event with the notification that preceded it.
+
+        Returns
+        -------
+            True if the tracked sims have been rebuilt, the rebuild already
+            contains the change of the event.
+
+        """
+        if self._unmatched_notifications > 0:
+            self._unmatched_notifications -= 1
+
+        if not self._is_client_selectable_ids_stale() or not self.zone_is_setup:
+            return False
+
+        self.update_selectable_sims()
+
+        return True
+
+    def _is_client_selectable_ids_stale(self: Self) -> bool:
+        return self._client_selectable_ids_stale or self._unmatched_notifications > 0
+
+    def _sync_client_selectable_ids(self: Self) -> None:
+        # before the zone is set up the client does not know the stored sims yet
+        if self._is_client_selectable_ids_stale() and self.zone_is_setup:
+            self.update_selectable_sims()
 
     def on_zone_teardown(self: Self, _zone: Zone, _client: Client) -> None:
         """
@@ -160,42 +493,91 @@ class SelectionGroupService(Serializable):
 
         Performs cleanup actions and removes all modifications from the game.
         """
-        Logger.log("on_zone_teardown: tearing down SelectionGroupService")
+        Logger.debug("on_zone_teardown: tearing down SelectionGroupService")
 
         if not self.zone_is_setup:
-            Logger.log("SelectionGroupService is already teared down")
+            Logger.debug("SelectionGroupService is already teared down")
             return
 
         self.persist_state()
         self.cleanup_sims()
+        # removing the sims from the skewer must not be persisted
+        self._cancel_persist_alarm()
+        self._cancel_skewer_update_alarm()
+
+        for subscription in self._subscriptions:
+            subscription.cancel()
 
-        GameEvents.remove_zone_teardown(self.on_zone_teardown)
+        self._subscriptions = []
 
+        self.invalidate_selectable_sims()
         self.zone_is_setup = False
         self.__class__.instance = None
 
     def make_sim_selectable(self: Self, sim_info: SimInfo) -> None:
         """Make the game add the provided sim info to the skewer."""
-        if sim_info.is_selectable:
-            return
+        self.make_sims_selectable((sim_info,))
 
-        # request lod before adding to make sure everything is loaded
-        sim_info.request_lod(SimInfoLODLevel.ACTIVE)
+    def make_sims_selectable(self: Self, sim_infos: Iterable[SimInfo]) -> list[SimInfo]:
+        """
+        Make the game add all provided sim infos to the skewer.
 
-        self.client.add_selectable_sim_info(sim_info)
+        All sims are added before the tracker information of each added NPC is
+        published and a single skewer update is sent. The active sim is kept.
 
-        currently_active_sim: SimInfo = self.client.active_sim_info
+        Returns
+        -------
+            The sim infos that have been added to the skewer.
 
-        # potentially load sims household here via the household_manager.
-        Logger.log(
-            f"added sim has household: {sim_info.household_id}, is none: {sim_info.household is None}",
-        )
+        """
+        pending_sim_infos: list[SimInfo] = []
+
+        for sim_info in sim_infos:
+            try:
+                if sim_info.is_selectable:
+                    continue
+
+                # request lod before adding to make sure everything is loaded
+                sim_info.request_lod(SimInfoLODLevel.ACTIVE)
+            except BaseException:
+                Logger.error("failed to load sim for skewer: %s", sim_info.id)
+                Logger.error(traceback.format_exc)
+                continue
+
+            pending_sim_infos.append(sim_info)
+
+        added_sim_infos: list[SimInfo] = []
+
+        for sim_info in pending_sim_infos:
+            try:
+                self.client.add_selectable_sim_info(sim_info)
+            except BaseException:
+                Logger.error("failed to add sim to skewer: %s", sim_info.id)
+                Logger.error(traceback.format_exc)
+                continue
+
+            # potentially load sims household here via the household_manager.
+            Logger.debug(
+                "added sim has household: %s, is none: %s",
+                sim_info.household_id,
+                sim_info.household is None,
+            )
+
+            added_sim_infos.append(sim_info)
+
+        if not added_sim_infos:
+            return added_sim_infos
+
+        # send the tracker information of every now selectable NPC, switching
+        # the active sim would only publish the one sim switched to
+        for sim_info in added_sim_infos:
+            if sim_info.household_id != self.household_id:
+                self.publish_sim_info(sim_info)
 
-        # force the game to update now selectable NPC tracker information
-        self.client.set_active_sim_by_id(sim_info.id)
-        self.client.set_active_sim_by_id(currently_active_sim.id)
         # send update to skewer for good measure
-        self.client.send_selectable_sims_update()
+        self.schedule_selectable_sims_update()
+
+        return added_sim_infos
 
     def remove_sim(self: Self, sim_info: SimInfo) -> None:
         """Remove a sim info from the skewer."""
@@ -206,46 +588,110 @@ class SelectionGroupService(Serializable):
 
     def setup_zone(self: Self) -> None:
         """Perform setup operations when the zone spins up."""
-        if len(self.household_npcs) > 0:
-            self.client.send_selectable_sims_update()
+        sim_info_manager = ts4_services.sim_info_manager()
+        sim_infos: list[SimInfo] = []
 
         for sim_info_id in self.selectable_sims:
-            try:
-                sim_info = services.sim_info_manager().get(sim_info_id)
+            sim_info = sim_info_manager.get(sim_info_id)
 
-                self.make_sim_selectable(sim_info)
-            except BaseException:  # noqa: PERF203
-                Logger.error(f"failed to add sim to skewer: {sim_info_id}")
-                Logger.error(traceback.format_exc())
+            if sim_info is None:
+                Logger.error("failed to add sim to skewer: %s", sim_info_id)
+                continue
 
-        self.client.selectable_sims.add_watcher(self, self.update_selectable_sims)
+            sim_infos.append(sim_info)
+
+        try:
+            added_sim_infos = self.make_sims_selectable(sim_infos)
+        except BaseException:
+            Logger.error(traceback.format_exc)
+            added_sim_infos = []
+
+        # the skewer update has already been scheduled if any sims have been added
+        if len(self.household_npcs) > 0 and not added_sim_infos:
+            self.schedule_selectable_sims_update()
+
+        self.client.selectable_sims.add_watcher(self, self.on_selectable_sims_notified)
         self.update_selectable_sims()
         self.zone_is_setup = True
 
     def is_selectable(self: Self, sim_id: int) -> bool:
         """Check if the sim id is currently selectable."""
-        selectable_sims: list[SimInfo] = self.client.selectable_sims
+        self._sync_client_selectable_ids()
+
+        return sim_id in self._client_selectable_ids
+
+    def is_sim_info_selectable(self: Self, sim_info: SimInfo) -> bool:
+        """
+        Check if a sim info is currently selectable in the client.
+
+        The selectable sim ids are tracked incrementally and only rebuilt when
+        the client changed without notifying the service.
+        """
+        return self.is_selectable(sim_info.id)
+
+    def is_sim_info_npc(self: Self, sim_info: SimInfo) -> bool:
+        """
+        Check if a sim info is an NPC for the is_npc field.
+
+        Sims are NPCs if they are not active and not a member of the current
+        household, household NPCs are also NPCs when they are not active. The
+        active sim and household are looked up once and kept until the client
+        changes the active sim.
+        """
+        npc_status = self._npc_status
+
+        if npc_status is None:
+            active_sim_info = ts4_services.active_sim_info()
+            npc_status = (
+                active_sim_info.id if active_sim_info is not None else None,
+                ts4_services.active_household_id(),
+            )
+            self._npc_status = npc_status
+
+        (active_sim_id, active_household_id) = npc_status
+        sim_id = sim_info.id
 
-        test = any(sim_info.sim_id == sim_id for sim_info in selectable_sims)
+        if sim_id == active_sim_id:
+            return False
 
-        Logger.log(f"is sim {sim_id} in selectable list: {test}")
+        if sim_info.household_id != active_household_id:
+            return True
 
-        return test
+        return sim_id in self._household_npcs_index
+
+    def reset_npc_status(self: Self) -> None:
+        """Drop the active sim used by the is_npc override."""
+        self._npc_status = None
+
+    def has_custom_sim_in_household(self: Self, household: Household) -> bool:
+        """
+        Check if any member of a household is a custom sim of the group.
+
+        Every member is looked up once in the index of the custom sims, the
+        lookups stop at the first custom sim.
+        """
+        self._sync_client_selectable_ids()
+
+        return not self._selectable_sims_index.keys().isdisjoint(
+            sim_info.id for sim_info in household.sim_infos
+        )
 
     def is_custom_sim(self: Self, sim_info_id: int) -> bool:
         """Test if a sim is one of the custom sims in the group."""
-        return sim_info_id in self.selectable_sims
+        self._sync_client_selectable_ids()
+
+        return sim_info_id in self._selectable_sims_index
 
     def on_active_sim_changed(self: Self, _old_sim: Sim, _new_sim: Sim) -> None:
         """Event handler for when the active sim changes."""
         if self.client is None:
-            Logger.log("active sim changed but we have no client, yet?")
+            Logger.debug("active sim changed but we have no client, yet?")
             return
 
         sim_info: SimInfo = self.client.active_sim_info
 
         if sim_info is None:
-            Logger.log("sim selection changed but no sim is selected")
+            Logger.debug("sim selection changed but no sim is selected")
             return
 
         if sim_info.household_id == self.household_id:
@@ -254,10 +700,19 @@ class SelectionGroupService(Serializable):
         try:
             sim_info.request_lod(SimInfoLODLevel.ACTIVE)
 
-            Logger.log(f"sim {sim_info!r} lod is now: {sim_info.lod}")
+            Logger.debug("sim %r lod is now: %s", sim_info, sim_info.lod)
+        except BaseException:
+            Logger.error("updating newly active sim: %r", sim_info)
+            Logger.error(traceback.format_exc)
+            return
+
+        self.publish_sim_info(sim_info)
 
+    def publish_sim_info(self: Self, sim_info: SimInfo) -> None:
+        """Send the tracker information of a NPC sim to the client."""
+        try:
             if sim_info.zone_id > 0:
-                Logger.log(f"Sim zone id is set: {sim_info.zone_id!r}")
+                Logger.debug("Sim zone id is set: %r", sim_info.zone_id)
                 sim_info.away_action_tracker.refresh(on_travel_away=True)
 
             sim_info.relationship_tracker.clean_and_send_remaining_relationship_info()
@@ -271,28 +726,30 @@ class SelectionGroupService(Serializable):
                 inventory = sim_instance.get_component(INVENTORY_COMPONENT)
                 inventory.publish_inventory_items()
             else:
-                Logger.log(f"there is no sim instance for {sim_info!r}")
+                Logger.debug("there is no sim instance for %r", sim_info)
 
         except BaseException:
-            Logger.error(f"updating newly active sim: {sim_info!r}")
-            Logger.error(traceback.format_exc())
+            Logger.error("publishing sim info: %r", sim_info)
+            Logger.error(traceback.format_exc)
 
     def cleanup_sims(self: Self) -> None:
         """Remove non household sims from the skewer."""
         for sim_info_id in self.selectable_sims:
-            sim_info = services.sim_info_manager().get(sim_info_id)
+            sim_info = ts4_services.sim_info_manager().get(sim_info_id)
 
             if sim_info is None:
-                Logger.log(
-                    f"sim with id {sim_info_id} does not exist and shouldn't apear here",
+                Logger.debug(
+                    "sim with id %s does not exist and shouldn't apear here",
+                    sim_info_id,
                 )
                 continue
 
             if sim_info.household_id == self.household_id:
                 continue
 
-            Logger.log(
-                f"{sim_info} is not in household, removing to avoid teardown issues",
+            Logger.debug(
+                "%s is not in household, removing to avoid teardown issues",
+                sim_info,
             )
 
             self.remove_sim(sim_info)
@@ -302,17 +759,27 @@ class SelectionGroupService(Serializable):
         if sim_info == self.client.active_sim_info:
             self.client.set_next_sim()
 
-        self.household_npcs.append(sim_info.id)
-        self.client.send_selectable_sims_update()
+        if sim_info.id not in self._household_npcs_index:
+            self.household_npcs.append(sim_info.id)
+            self._household_npcs_index.add(sim_info.id)
+            self._household_npcs_dirty = True
+            self.invalidate_selectable_sims()
+            self.schedule_persist_state()
+
+        self.schedule_selectable_sims_update()
 
     def remove_household_npc(self: Self, sim_info: SimInfo) -> None:
         """Remove a sim from household NPCs list."""
         self.household_npcs.remove(sim_info.id)
-        self.client.send_selectable_sims_update()
+        self._household_npcs_index.discard(sim_info.id)
+        self._household_npcs_dirty = True
+        self.invalidate_selectable_sims()
+        self.schedule_persist_state()
+        self.schedule_selectable_sims_update()
 
     def is_household_npc(self: Self, sim_info: SimInfo) -> bool:
         """Check if a given SimInfo is a household NPC."""
-        return sim_info.id in self.household_npcs
+        return sim_info.id in self._household_npcs_index
 
     def on_spawn_sim(
         self: Self,
@@ -326,11 +793,15 @@ class SelectionGroupService(Serializable):
         if not self.is_custom_sim(sim.id):
             return
 
-        Logger.log(
-            f'Sending selectable sim update for spawned NPC "{sim.first_name} {sim.last_name}"',
+        Logger.debug(
+            'Scheduling selectable sim update for spawned NPC "%s %s"',
+            sim.first_name,
+            sim.last_name,
         )
-        Logger.log("".join(traceback.format_list(traceback.extract_stack())))
-        self.client.send_selectable_sims_update()
+        Logger.debug(
+            lambda: "".join(traceback.format_list(traceback.extract_stack())),
+        )
+        self.schedule_selectable_sims_update()
 
     def on_sim_travel_out(
         self: Self,
@@ -342,7 +813,7 @@ class SelectionGroupService(Serializable):
         Send selectable sim update if the leaving sim is a controlled NPC.
         """
         if not self.is_custom_sim(sim_info.id):
-            Logger.log(
+            Logger.debug(
                 "Traveling a sim out of the current zone, but it's not a custom selection NPC.",
             )
             return
@@ -352,14 +823,16 @@ class SelectionGroupService(Serializable):
         )
 
         if not sim_instance:
-            Logger.log("there is no sim instance during travel")
+            Logger.debug("there is no sim instance during travel")
         if not sim_instance:
-            Logger.log("there is no sim instance during travel")
+            Logger.debug("there is no sim instance during travel")
 
-        Logger.log(
-            f'Sending selectable sim update for traveling NPC "{sim_info.first_name} {sim_info.last_name}"',
+        Logger.debug(
+            'Sending selectable sim update for traveling NPC "%s %s"',
+            sim_info.first_name,
+            sim_info.last_name,
         )
 
         sim_instance.schedule_destroy_asap(
-            post_delete_func=self.client.send_selectable_sims_update,
+            post_delete_func=self.schedule_selectable_sims_update,
         )
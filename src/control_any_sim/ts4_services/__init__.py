@@ -1,31 +1,169 @@
-"""Wrapper for service module to add types."""
+"""
+Wrapper for service module to add types.
+
+All accessors are bound to a single Ts4Services facade, so repeated calls
+do not allocate new wrappers. The mod only reaches the game's services
+through these accessors, so the facade can be replaced with one that is
+backed by a stand-in services module via use().
+"""
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 import services
 
 from .clientmanager import ClientManager
 
 if TYPE_CHECKING:
-    import server
+    from types import ModuleType
+
+    from interactions.interaction_instance_manager import InteractionInstanceManager
+    from roommate_service_utils.roommate_service import RoommateService
+    from server.client import Client
+    from sims.sim_info import SimInfo
     from sims.sim_info_manager import SimInfoManager
     from sims.sim_spawner_service import SimSpawnerService
+    from time_service import TimeService
+    from typing_extensions import Self
+    from zone import Zone
+
+
+class Ts4Services:
+    """
+    Typed facade for the game's services module.
+
+    Wrappers are created once and kept until the zone is torn down. The
+    client of the active household is cached until a client connects or
+    disconnects. A missing client is not cached, as the household of a new
+    client is only known after it connected.
+    """
+
+    __slots__ = ("_active_client", "_client_manager", "services")
+
+    def __init__(self: Self, services_module: ModuleType = services) -> None:
+        """Create a new facade for the given services module."""
+        self.services = services_module
+        self._client_manager: ClientManager | None = None
+        self._active_client: Client | None = None
+
+    def client_manager(self: Self) -> ClientManager:
+        """Typed version of services.client_manager."""
+        if self._client_manager is None:
+            self._client_manager = ClientManager(
+                self.services.client_manager(),
+                self.services,
+            )
+
+        return self._client_manager
+
+    def sim_info_manager(self: Self) -> SimInfoManager:
+        """Typed version of services.sim_info_manager."""
+        return self.services.sim_info_manager()
+
+    def sim_spawner_service(
+        self: Self,
+        zone_id: int | None = None,
+    ) -> SimSpawnerService:
+        """Typed version of services.sim_spawner_manager."""
+        return self.services.sim_spawner_service(zone_id)
+
+    def active_household_id(self: Self) -> int:
+        """Typed version of services.active_household_id."""
+        return self.services.active_household_id()
+
+    def active_sim_info(self: Self) -> SimInfo | None:
+        """Typed version of services.active_sim_info."""
+        return self.services.active_sim_info()
+
+    def current_zone(self: Self) -> Zone:
+        """Typed version of services.current_zone."""
+        return self.services.current_zone()
+
+    def current_zone_id(self: Self) -> int:
+        """Typed version of services.current_zone_id."""
+        return self.services.current_zone_id()
+
+    def get_first_client(self: Self) -> Client:
+        """Typed version of services.get_first_client."""
+        return self.services.get_first_client()
+
+    def get_roommate_service(self: Self) -> RoommateService | None:
+        """Typed version of services.get_roommate_service."""
+        return self.services.get_roommate_service()
+
+    def time_service(self: Self) -> TimeService:
+        """Typed version of services.time_service."""
+        return self.services.time_service()
+
+    def affordance_manager(self: Self) -> InteractionInstanceManager:
+        """Typed version of services.affordance_manager."""
+        return self.services.affordance_manager()
+
+    def active_client(self: Self) -> Client | None:
+        """Get the client of the active household, cached until it is invalidated."""
+        if self._active_client is None:
+            self._active_client = self.client_manager().get_active_client()
+
+        return self._active_client
+
+    def invalidate_active_client(self: Self) -> None:
+        """Drop the cached client of the active household."""
+        self._active_client = None
+
+    def reset(self: Self) -> None:
+        """Drop all wrappers and cached objects of the current zone."""
+        self._client_manager = None
+        self._active_client = None
+
+
+facade = Ts4Services()
+
+client_manager = facade.client_manager
+sim_info_manager = facade.sim_info_manager
+sim_spawner_service = facade.sim_spawner_service
+active_household_id = facade.active_household_id
+active_sim_info = facade.active_sim_info
+current_zone = facade.current_zone
+current_zone_id = facade.current_zone_id
+get_first_client = facade.get_first_client
+get_roommate_service = facade.get_roommate_service
+time_service = facade.time_service
+affordance_manager = facade.affordance_manager
+active_client = facade.active_client
+
+
+def use(services_module: ModuleType) -> Ts4Services:
+    """Back all accessors by a new facade for the given services module."""
+    global facade, client_manager, sim_info_manager  # noqa: PLW0603
+    global sim_spawner_service, active_household_id, active_sim_info  # noqa: PLW0603
+    global current_zone, current_zone_id, get_first_client  # noqa: PLW0603
+    global get_roommate_service, time_service, affordance_manager  # noqa: PLW0603
+    global active_client  # noqa: PLW0603
 
+    facade = Ts4Services(services_module)
 
-def client_manager() -> ClientManager:
-    """Typed version of services.client_manager."""
-    manager: server.clientmanager.ClientManager = services.client_manager()
+    client_manager = facade.client_manager
+    sim_info_manager = facade.sim_info_manager
+    sim_spawner_service = facade.sim_spawner_service
+    active_household_id = facade.active_household_id
+    active_sim_info = facade.active_sim_info
+    current_zone = facade.current_zone
+    current_zone_id = facade.current_zone_id
+    get_first_client = facade.get_first_client
+    get_roommate_service = facade.get_roommate_service
+    time_service = facade.time_service
+    affordance_manager = facade.affordance_manager
+    active_client = facade.active_client
 
-    return ClientManager(manager)
+    return facade
 
 
-def sim_info_manager() -> SimInfoManager:
-    """Typed version of services.sim_info_manager."""
-    return services.sim_info_manager()
+def invalidate_active_client(*_args: Any) -> None:  # noqa: ANN401
+    """Drop the cached active client, accepts and ignores event arguments."""
+    facade.invalidate_active_client()
 
 
-def sim_spawner_service(zone_id: int | None = None) -> SimSpawnerService:
-    """Typed version of services.sim_spawner_manager."""
-    return services.sim_spawner_service(zone_id)
+def reset(*_args: Any) -> None:  # noqa: ANN401
+    """Drop all zone scoped wrappers, accepts and ignores event arguments."""
+    facade.reset()
@@ -7,6 +7,8 @@ from typing import TYPE_CHECKING
 import services
 
 if TYPE_CHECKING:
+    from types import ModuleType
+
     from server import clientmanager
     from server.client import Client
     from typing_extensions import Self
@@ -15,11 +17,23 @@ if TYPE_CHECKING:
 class ClientManager:
     """Wrapper for server.clientmanager."""
 
+    __slots__ = ("inner", "services")
+
     inner: clientmanager.ClientManager
+    services: ModuleType
 
-    def __init__(self: Self, inner: clientmanager.ClientManager) -> None:
+    def __init__(
+        self: Self,
+        inner: clientmanager.ClientManager,
+        services_module: ModuleType = services,
+    ) -> None:
         """Create a new wrapper instance."""
         self.inner = inner
+        self.services = services_module
+
+    def get(self: Self, connection_id: int) -> Client | None:
+        """Get a game client by its connection."""
+        return self.inner.get(connection_id)
 
     def get_client_by_household_id(self: Self, household_id: int) -> Client | None:
         """Get a game client by household id."""
@@ -27,4 +41,4 @@ class ClientManager:
 
     def get_active_client(self: Self) -> Client | None:
         """Get the client of the active household."""
-        return self.get_client_by_household_id(services.active_household_id())
+        return self.get_client_by_household_id(self.services.active_household_id())
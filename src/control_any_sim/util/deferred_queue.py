@@ -0,0 +1,126 @@
+"""Work queue to run non-critical work outside of the game's hot paths."""
+
+from __future__ import annotations
+
+import time
+import traceback
+from collections import deque
+from typing import TYPE_CHECKING, Callable
+
+import alarms
+import clock
+
+from control_any_sim.util.logger import Logger
+
+if TYPE_CHECKING:
+    from alarms import AlarmHandle
+    from typing_extensions import Self
+
+
+class DeferredQueue:
+    """
+    Queue of work that is run after the event that produced it.
+
+    The queue is drained by a repeating real time alarm while it contains
+    work. Every drain only runs work until the time budget is used up, the
+    remaining work waits for the next alarm. Work always runs in the order it
+    has been queued and at least one item runs per drain.
+    """
+
+    DRAIN_INTERVAL = 0.05
+
+    def __init__(
+        self: Self,
+        budget: float = 0.002,
+        timer: Callable[[], float] = time.perf_counter,
+    ) -> None:
+        """Create a new queue with the given time budget per drain in seconds."""
+        self.budget = budget
+        self.timer = timer
+        self.work: deque[Callable[[], None]] = deque()
+        self.alarm_handle: AlarmHandle | None = None
+
+    def __len__(self: Self) -> int:
+        """Get the number of queued work items."""
+        return len(self.work)
+
+    def push(self: Self, work: Callable[[], None]) -> None:
+        """Queue work and make sure the queue will be drained."""
+        self.work.append(work)
+
+        if self.alarm_handle is not None:
+            return
+
+        try:
+            self.alarm_handle = alarms.add_alarm_real_time(
+                self,
+                clock.interval_in_real_seconds(self.DRAIN_INTERVAL),
+                self._on_drain_alarm,
+                repeating=True,
+            )
+        except BaseException:
+            # without an alarm nobody would drain the queue, so run the work now
+            Logger.error(traceback.format_exc)
+            self.drain_all()
+
+    def drain(self: Self) -> int:
+        """
+        Run queued work until the time budget is used up.
+
+        Returns
+        -------
+            The number of work items that have been run.
+
+        """
+        deadline = self.timer() + self.budget
+        processed = 0
+
+        while self.work:
+            self._run(self.work.popleft())
+            processed += 1
+
+            if self.timer() >= deadline:
+                break
+
+        return processed
+
+    def drain_all(self: Self) -> int:
+        """
+        Run all queued work regardless of the time budget.
+
+        Returns
+        -------
+            The number of work items that have been run.
+
+        """
+        processed = 0
+
+        while self.work:
+            self._run(self.work.popleft())
+            processed += 1
+
+        return processed
+
+    def clear(self: Self) -> None:
+        """Drop all queued work and stop draining."""
+        self.work.clear()
+        self._cancel_alarm()
+
+    def _run(self: Self, work: Callable[[], None]) -> None:
+        try:
+            work()
+        except Exception:
+            Logger.error(traceback.format_exc)
+
+    def _on_drain_alarm(self: Self, _handle: AlarmHandle) -> None:
+        self.drain()
+
+        if not self.work:
+            self._cancel_alarm()
+
+    def _cancel_alarm(self: Self) -> None:
+        if self.alarm_handle is None:
+            return
+
+        alarms.cancel_alarm(self.alarm_handle)
+        self.alarm_handle = None
@@ -0,0 +1,226 @@
+"""Registry for event handlers with subscription handles."""
+
+from __future__ import annotations
+
+import time
+import traceback
+import weakref
+from typing import TYPE_CHECKING, Any, Callable, ClassVar, Generic, Optional, TypeVar
+
+from control_any_sim.util.deferred_queue import DeferredQueue
+from control_any_sim.util.logger import Logger
+
+if TYPE_CHECKING:
+    from typing_extensions import Self, TypeAlias
+
+
+Handler: TypeAlias = Callable[..., None]
+
+H = TypeVar("H", bound=Handler)
+
+HandlerRef: TypeAlias = Callable[[], Optional[H]]
+
+
+def handler_ref(handler: H) -> HandlerRef[H]:
+    """
+    Create a reference to an event handler.
+
+    Bound methods are only referenced weakly, so registering a handler of an
+    object does not keep the object alive. All other callables are kept.
+    """
+    if getattr(handler, "__self__", None) is not None and hasattr(
+        handler,
+        "__func__",
+    ):
+        return weakref.WeakMethod(handler)
+
+    return lambda: handler
+
+
+def handler_name(handler: Handler) -> str:
+    """Get a readable name of an event handler."""
+    return getattr(handler, "__qualname__", repr(handler))
+
+
+class Subscription(Generic[H]):
+    """Handle of a handler that has been registered with an event channel."""
+
+    def __init__(
+        self: Self,
+        channel: EventChannel[H],
+        handler: H,
+        priority: int,
+        *,
+        deferred: bool,
+    ) -> None:
+        """Create a new subscription handle."""
+        self.channel = channel
+        self.ref = handler_ref(handler)
+        self.name = handler_name(handler)
+        self.priority = priority
+        self.deferred = deferred
+        self.calls = 0
+        self.errors = 0
+        self.total_time = 0.0
+        self.max_time = 0.0
+
+    @property
+    def handler(self: Self) -> H | None:
+        """The subscribed handler or None if it has been garbage collected."""
+        return self.ref()
+
+    @property
+    def active(self: Self) -> bool:
+        """Check if the subscription is still registered with its channel."""
+        return self in self.channel.subscriptions
+
+    def cancel(self: Self) -> None:
+        """Remove the handler from its channel."""
+        self.channel.remove(self)
+
+    def reset_timing(self: Self) -> None:
+        """Reset the collected timing information."""
+        self.calls = 0
+        self.errors = 0
+        self.total_time = 0.0
+        self.max_time = 0.0
+
+
+class EventChannel(Generic[H]):
+    """
+    List of handlers for a single event.
+
+    Registering the same handler more than once returns the existing
+    subscription. Handlers of objects that have been garbage collected are
+    dropped automatically.
+
+    Handlers with a higher priority are called first. Exceptions raised by a
+    handler are logged and do not prevent the remaining handlers from being
+    called. While timing is enabled, the duration of every handler call is
+    recorded on its subscription.
+
+    Deferred handlers are not called while the event is emitted, instead they
+    are queued and called in time-sliced chunks shortly after.
+    """
+
+    timing_enabled = False
+    channels: ClassVar[list[EventChannel[Any]]] = []
+    deferred_queue: ClassVar[DeferredQueue] = DeferredQueue()
+
+    def __init__(self: Self, name: str) -> None:
+        """Create a new channel for the named event."""
+        self.name = name
+        self.subscriptions: list[Subscription[H]] = []
+        self.channels.append(self)
+
+    def __len__(self: Self) -> int:
+        """Get the number of live handlers."""
+        return len(self._live_subscriptions())
+
+    def subscribe(
+        self: Self,
+        handler: H,
+        priority: int = 0,
+        *,
+        deferred: bool = False,
+    ) -> Subscription[H]:
+        """Register a handler, returns the subscription handle."""
+        for subscription, registered_handler in self._live_subscriptions():
+            if registered_handler == handler:
+                return subscription
+
+        subscription = Subscription(self, handler, priority, deferred=deferred)
+        index = len(self.subscriptions)
+
+        # keep the subscriptions sorted by priority, equal priorities keep their order
+        while index > 0 and self.subscriptions[index - 1].priority < priority:
+            index -= 1
+
+        self.subscriptions.insert(index, subscription)
+
+        return subscription
+
+    def unsubscribe(self: Self, handler: H) -> None:
+        """Remove a handler from the channel, if it is registered."""
+        for subscription, registered_handler in self._live_subscriptions():
+            if registered_handler == handler:
+                self.remove(subscription)
+                return
+
+    def remove(self: Self, subscription: Subscription[H]) -> None:
+        """Remove a subscription from the channel, if it is registered."""
+        if subscription not in self.subscriptions:
+            return
+
+        self.subscriptions.remove(subscription)
+
+    def handlers(self: Self) -> list[H]:
+        """Get all live handlers and drop the ones that have been collected."""
+        return [handler for (_subscription, handler) in self._live_subscriptions()]
+
+    def emit(self: Self, *args: Any) -> None:  # noqa: ANN401
+        """Call all live handlers with the given arguments."""
+        for subscription, handler in self._live_subscriptions():
+            if subscription.deferred:
+                self.deferred_queue.push(self._deferred_call(subscription, args))
+                continue
+
+            self._call(subscription, handler, args)
+
+    def _deferred_call(
+        self: Self,
+        subscription: Subscription[H],
+        args: tuple[Any, ...],
+    ) -> Callable[[], None]:
+        def call() -> None:
+            # the handler might have been cancelled or collected in the meantime
+            handler = subscription.handler
+
+            if handler is None or not subscription.active:
+                return
+
+            self._call(subscription, handler, args)
+
+        return call
+
+    def _call(
+        self: Self,
+        subscription: Subscription[H],
+        handler: H,
+        args: tuple[Any, ...],
+    ) -> None:
+        timing_enabled = self.timing_enabled
+        start = time.perf_counter() if timing_enabled else 0.0
+
+        try:
+            handler(*args)
+        except Exception:
+            subscription.errors += 1
+            Logger.error(
+                "handler %s of event %s failed",
+                subscription.name,
+                self.name,
+            )
+            Logger.error(traceback.format_exc)
+
+        if not timing_enabled:
+            return
+
+        elapsed = time.perf_counter() - start
+        subscription.calls += 1
+        subscription.total_time += elapsed
+        subscription.max_time = max(elapsed, subscription.max_time)
+
+    def _live_subscriptions(self: Self) -> list[tuple[Subscription[H], H]]:
+        live: list[tuple[Subscription[H], H]] = []
+
+        for subscription in tuple(self.subscriptions):
+            handler = subscription.handler
+
+            if handler is None:
+                self.remove(subscription)
+                continue
+
+            live.append((subscription, handler))
+
+        return live
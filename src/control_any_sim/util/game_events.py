@@ -3,9 +3,9 @@
 from __future__ import annotations
 
 import traceback
-from typing import TYPE_CHECKING, Callable, ClassVar, TypeVar
+import weakref
+from typing import TYPE_CHECKING, Any, Callable, ClassVar, TypeVar
 
-import services
 from server.client import Client
 from sims.self_interactions import TravelInteraction
 from sims.sim import Sim
@@ -14,15 +14,30 @@ from zone import Zone
 from zone_types import ZoneState
 
 from control_any_sim import ts4_services
+from control_any_sim.util.event_channel import EventChannel
 from control_any_sim.util.inject import inject_method_to
 from control_any_sim.util.logger import Logger
 
 if TYPE_CHECKING:
+    from sims.sim_spawner_service import SimSpawnerService
     from typing_extensions import TypeAlias
 
+    from control_any_sim.util.event_channel import Subscription
+
 
 class GameEvents:
-    """Game event bus to listen to events in the game."""
+    """
+    Game event bus to listen to events in the game.
+
+    Every listener registration returns a subscription handle that can be
+    cancelled. Registering the same listener twice has no effect and bound
+    methods are only referenced weakly. Listeners with a higher priority are
+    called first and a failing listener does not affect the others.
+
+    Listeners that are not critical for the event can register as deferred,
+    they are then called shortly after the event outside of the game's hot
+    path.
+    """
 
     OnZoneTeardown: TypeAlias = Callable[[Zone, Client], None]
     OnZoneSpinUp: TypeAlias = Callable[[Zone, int, int], None]
@@ -31,44 +46,69 @@ class GameEvents:
     OnActiveSimChanged: TypeAlias = Callable[[Sim, Sim], None]
     OnTravelSimOut: TypeAlias = Callable[[SimInfo], None]
     OnPostSpawnSim: TypeAlias = Callable[[Sim], None]
+    OnSelectableSimChanged: TypeAlias = Callable[[SimInfo], None]
 
     C = TypeVar("C", bound="GameEvents")
 
-    zone_teardown_handlers: ClassVar[list[OnZoneTeardown]] = []
-    zone_spin_up_handlers: ClassVar[list[OnZoneSpinUp]] = []
-    add_sim_handlers: ClassVar[list[OnAddSim]] = []
-    loading_screen_animation_finished_handlers: ClassVar[
-        list[OnLoadingScreenAnimationFinished]
-    ] = []
-    travel_sim_out_handlers: ClassVar[list[OnTravelSimOut]] = []
+    zone_teardown: ClassVar[EventChannel[OnZoneTeardown]] = EventChannel(
+        "zone_teardown",
+    )
+    zone_spin_up: ClassVar[EventChannel[OnZoneSpinUp]] = EventChannel("zone_spin_up")
+    add_sim: ClassVar[EventChannel[OnAddSim]] = EventChannel("add_sim")
+    loading_screen_animation_finished: ClassVar[
+        EventChannel[OnLoadingScreenAnimationFinished]
+    ] = EventChannel("loading_screen_animation_finished")
+    active_sim_changed: ClassVar[EventChannel[OnActiveSimChanged]] = EventChannel(
+        "active_sim_changed",
+    )
+    travel_sim_out: ClassVar[EventChannel[OnTravelSimOut]] = EventChannel(
+        "travel_sim_out",
+    )
+    post_spawn_sim: ClassVar[EventChannel[OnPostSpawnSim]] = EventChannel(
+        "post_spawn_sim",
+    )
+    selectable_sim_added: ClassVar[EventChannel[OnSelectableSimChanged]] = EventChannel(
+        "selectable_sim_added",
+    )
+    selectable_sim_removed: ClassVar[EventChannel[OnSelectableSimChanged]] = (
+        EventChannel("selectable_sim_removed")
+    )
+
+    # game objects the event dispatchers have been registered with
+    active_sim_changed_source: ClassVar[weakref.ref[Client] | None] = None
+    post_spawn_sim_source: ClassVar[weakref.ref[SimSpawnerService] | None] = None
 
     @classmethod
-    def on_zone_teardown(cls, handler: OnZoneTeardown) -> None:
+    def on_zone_teardown(
+        cls,
+        handler: OnZoneTeardown,
+        priority: int = 0,
+        *,
+        deferred: bool = False,
+    ) -> Subscription:
         """Add a listener for the zone_teardown event."""
-        cls.zone_teardown_handlers.append(handler)
-
-    @classmethod
-    def remove_zone_teardown(cls, handler: OnZoneTeardown) -> None:
-        """Remove a listener for the zone_teardown event."""
-        if handler not in cls.zone_teardown_handlers:
-            return
-
-        cls.zone_teardown_handlers.remove(handler)
+        return cls.zone_teardown.subscribe(handler, priority, deferred=deferred)
 
     @classmethod
     def emit_zone_teardown(cls, current_zone: Zone, client: Client) -> None:
         """Emit a zone teardown event."""
-        Logger.log(
-            f"registered zone teardown handlers: {len(cls.zone_teardown_handlers)}",
+        Logger.debug(
+            "registered zone teardown handlers: %s",
+            len(cls.zone_teardown),
         )
 
-        for handler in cls.zone_teardown_handlers:
-            handler(current_zone, client)
+        cls.zone_teardown.emit(current_zone, client)
 
     @classmethod
-    def on_zone_spin_up(cls, handler: OnZoneSpinUp) -> None:
+    def on_zone_spin_up(
+        cls,
+        handler: OnZoneSpinUp,
+        priority: int = 0,
+        *,
+        deferred: bool = False,
+    ) -> Subscription:
         """Add a listener for the zone_spin_up event."""
-        cls.zone_spin_up_handlers.append(handler)
+        return cls.zone_spin_up.subscribe(handler, priority, deferred=deferred)
 
     @classmethod
     def emit_zone_spin_up(
@@ -78,32 +118,66 @@ class GameEvents:
         active_sim_id: int,
     ) -> None:
         """Emit a zone spin up event."""
-        for handler in cls.zone_spin_up_handlers:
-            handler(current_zone, household_id, active_sim_id)
+        cls.zone_spin_up.emit(current_zone, household_id, active_sim_id)
 
     @classmethod
-    def on_add_sim(cls, handler: OnAddSim) -> None:
+    def on_add_sim(
+        cls,
+        handler: OnAddSim,
+        priority: int = 0,
+        *,
+        deferred: bool = False,
+    ) -> Subscription:
         """Add a listener for the add_sim event."""
-        cls.add_sim_handlers.append(handler)
+        return cls.add_sim.subscribe(handler, priority, deferred=deferred)
 
     @classmethod
     def emit_add_sim(cls, sim: Sim) -> None:
         """Emit the add sim event."""
-        for handler in cls.add_sim_handlers:
-            handler(sim)
+        cls.add_sim.emit(sim)
 
-    @staticmethod
-    def on_active_sim_changed(handler: OnActiveSimChanged) -> None:
+    @classmethod
+    def on_active_sim_changed(
+        cls,
+        handler: OnActiveSimChanged,
+        priority: int = 0,
+        *,
+        deferred: bool = False,
+    ) -> Subscription:
         """Add a listener for the active_sim_changed event."""
-        services.get_first_client().register_active_sim_changed(handler)
+        client = ts4_services.get_first_client()
+        source = cls.active_sim_changed_source
+
+        # the client only knows about our dispatcher, which is registered once
+        if source is None or source() is not client:
+            client.register_active_sim_changed(cls.emit_active_sim_changed)
+            cls.active_sim_changed_source = weakref.ref(client)
+
+        return cls.active_sim_changed.subscribe(
+            handler,
+            priority,
+            deferred=deferred,
+        )
+
+    @classmethod
+    def emit_active_sim_changed(cls, old_sim: Sim, new_sim: Sim) -> None:
+        """Emit the active sim changed event."""
+        cls.active_sim_changed.emit(old_sim, new_sim)
 
     @classmethod
     def on_loading_screen_animation_finished(
         cls,
         handler: OnLoadingScreenAnimationFinished,
-    ) -> None:
+        priority: int = 0,
+        *,
+        deferred: bool = False,
+    ) -> Subscription:
         """Add a listener for the loading_screen_animation_finished event."""
-        cls.loading_screen_animation_finished_handlers.append(handler)
+        return cls.loading_screen_animation_finished.subscribe(
+            handler,
+            priority,
+            deferred=deferred,
+        )
 
     @classmethod
     def emit_loading_screen_animation_finished(
@@ -111,24 +185,83 @@ class GameEvents:
         current_zone: Zone,
     ) -> None:
         """Emit the loading screen finished event."""
-        for handler in cls.loading_screen_animation_finished_handlers:
-            handler(current_zone)
+        cls.loading_screen_animation_finished.emit(current_zone)
 
     @classmethod
-    def on_travel_sim_out(cls, handler: OnTravelSimOut) -> None:
+    def on_travel_sim_out(
+        cls,
+        handler: OnTravelSimOut,
+        priority: int = 0,
+        *,
+        deferred: bool = False,
+    ) -> Subscription:
         """Add a listener for the travel_sim_out event."""
-        cls.travel_sim_out_handlers.append(handler)
+        return cls.travel_sim_out.subscribe(handler, priority, deferred=deferred)
 
     @classmethod
     def emit_travel_sim_out(cls, sim_info: SimInfo) -> None:
         """Emit the travel sim out event."""
-        for handler in cls.travel_sim_out_handlers:
-            handler(sim_info)
+        cls.travel_sim_out.emit(sim_info)
 
-    @staticmethod
-    def on_post_spawn_sim(handler: OnPostSpawnSim) -> None:
+    @classmethod
+    def on_post_spawn_sim(
+        cls,
+        handler: OnPostSpawnSim,
+        priority: int = 0,
+        *,
+        deferred: bool = False,
+    ) -> Subscription:
         """Adda listener for the post spawn sim event."""
-        ts4_services.sim_spawner_service().register_sim_spawned_callback(handler)
+        spawner_service = ts4_services.sim_spawner_service()
+        source = cls.post_spawn_sim_source
+
+        # the spawner service only knows about our dispatcher, which is registered once
+        if source is None or source() is not spawner_service:
+            spawner_service.register_sim_spawned_callback(cls.emit_post_spawn_sim)
+            cls.post_spawn_sim_source = weakref.ref(spawner_service)
+
+        return cls.post_spawn_sim.subscribe(handler, priority, deferred=deferred)
+
+    @classmethod
+    def emit_post_spawn_sim(cls, sim: Sim) -> None:
+        """Emit the post spawn sim event."""
+        cls.post_spawn_sim.emit(sim)
+
+    @classmethod
+    def on_selectable_sim_added(
+        cls,
+        handler: OnSelectableSimChanged,
+        priority: int = 0,
+        *,
+        deferred: bool = False,
+    ) -> Subscription:
+        """Add a listener for the selectable_sim_added event."""
+        return cls.selectable_sim_added.subscribe(handler, priority, deferred=deferred)
+
+    @classmethod
+    def emit_selectable_sim_added(cls, sim_info: SimInfo) -> None:
+        """Emit the selectable sim added event."""
+        cls.selectable_sim_added.emit(sim_info)
+
+    @classmethod
+    def on_selectable_sim_removed(
+        cls,
+        handler: OnSelectableSimChanged,
+        priority: int = 0,
+        *,
+        deferred: bool = False,
+    ) -> Subscription:
+        """Add a listener for the selectable_sim_removed event."""
+        return cls.selectable_sim_removed.subscribe(
+            handler,
+            priority,
+            deferred=deferred,
+        )
+
+    @classmethod
+    def emit_selectable_sim_removed(cls, sim_info: SimInfo) -> None:
+        """Emit the selectable sim removed event."""
+        cls.selectable_sim_removed.emit(sim_info)
 
 
 @inject_method_to(Zone, "on_teardown")
@@ -139,10 +272,14 @@ def canys_zone_on_teardown(
 ) -> None:
     """Wrap around the Zone::on_teardown method to emit the coresponding event."""
     try:
-        Logger.log("Zone.on_teardown event occurred")
+        Logger.debug("Zone.on_teardown event occurred")
         GameEvents.emit_zone_teardown(self, client)
     except BaseException:
-        Logger.error(traceback.format_exc())
+        Logger.error(traceback.format_exc)
+    finally:
+        # deferred work belongs to the zone that is going away
+        EventChannel.deferred_queue.clear()
+        Logger.flush()
 
     return original(self, client)
 
@@ -160,30 +297,30 @@ def canys_zone_do_zone_spin_up(
 
         def callback() -> None:
             try:
-                Logger.log("zone_spin_up event occurred")
+                Logger.debug("zone_spin_up event occurred")
                 GameEvents.emit_zone_spin_up(self, household_id, active_sim_id)
             except BaseException:
-                Logger.error(traceback.format_exc())
+                Logger.error(traceback.format_exc)
 
         self.register_callback(ZoneState.RUNNING, callback)
 
         return result
     except BaseException:
-        Logger.error(traceback.format_exc())
+        Logger.error(traceback.format_exc)
 
 
 @inject_method_to(Sim, "on_add")
 def canys_sim_on_add(original: Callable[[Sim], None], self: Sim) -> None:
     """Wrap the Sim::on_add method to emit the corresponding event."""
     try:
-        Logger.log("Sim.on_add event occurred")
+        Logger.debug("Sim.on_add event occurred")
         result = original(self)
 
         GameEvents.emit_add_sim(self)
 
         return result
     except BaseException:
-        Logger.error(traceback.format_exc())
+        Logger.error(traceback.format_exc)
 
 
 @inject_method_to(Zone, "on_loading_screen_animation_finished")
@@ -193,10 +330,10 @@ def canys_zone_on_loading_screen_animation_finished(
 ) -> None:
     """Wrap around Zone::on_loading_screen_animation_finished to emit corresponding event."""
     try:
-        Logger.log("Zone.on_loading_screen_animation_finished event occurred")
+        Logger.debug("Zone.on_loading_screen_animation_finished event occurred")
         GameEvents.emit_loading_screen_animation_finished(self)
     except BaseException:
-        Logger.error(traceback.format_exc())
+        Logger.error(traceback.format_exc)
 
     return original(self)
 
@@ -214,7 +351,45 @@ def canys_travel_internaction_save_and_destroy_sim(
 
         GameEvents.emit_travel_sim_out(sim_info)
     except Exception as err:
-        Logger.error(f"{err}")
-        Logger.error(traceback.format_exc())
+        Logger.error("%s", err)
+        Logger.error(traceback.format_exc)
+
+    return result
+
+
+@inject_method_to(Client, "add_selectable_sim_info")
+def canys_client_add_selectable_sim_info(
+    original: Callable[..., Any],
+    self: Client,
+    sim_info: SimInfo,
+    *args: Any,  # noqa: ANN401
+    **kwargs: Any,  # noqa: ANN401
+) -> Any:  # noqa: ANN401
+    """Wrap the Client::add_selectable_sim_info method to emit the corresponding event."""
+    result = original(self, sim_info, *args, **kwargs)
+
+    try:
+        GameEvents.emit_selectable_sim_added(sim_info)
+    except BaseException:
+        Logger.error(traceback.format_exc)
+
+    return result
+
+
+@inject_method_to(Client, "remove_selectable_sim_info")
+def canys_client_remove_selectable_sim_info(
+    original: Callable[..., Any],
+    self: Client,
+    sim_info: SimInfo,
+    *args: Any,  # noqa: ANN401
+    **kwargs: Any,  # noqa: ANN401
+) -> Any:  # noqa: ANN401
+    """Wrap the Client::remove_selectable_sim_info method to emit the corresponding event."""
+    result = original(self, sim_info, *args, **kwargs)
+
+    try:
+        GameEvents.emit_selectable_sim_removed(sim_info)
+    except BaseException:
+        Logger.error(traceback.format_exc)
 
     return result
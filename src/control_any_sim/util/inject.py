@@ -2,28 +2,91 @@
 
 from __future__ import annotations
 
-from functools import wraps
-from typing import TYPE_CHECKING, Any, Callable, TypeVar
+import inspect
+import time
+from functools import update_wrapper, wraps
+from typing import TYPE_CHECKING, Any, Callable, ClassVar, TypeVar
 
 import distributor
 
+from control_any_sim.util.logger import Logger
+
 if TYPE_CHECKING:
-    from typing_extensions import TypeAlias
+    from typing_extensions import Self, TypeAlias
 
 T = TypeVar("T")
 NewFun: TypeAlias = Callable[..., T]
 
 
+FAST_WRAPPER_TEMPLATE = """
+def factory(_new_function_, _original_):
+    def _fast_inject({parameters}):
+        return _new_function_(_original_, {arguments})
+
+    return _fast_inject
+"""
+
+
+def compile_fast_wrapper(
+    target_function: Callable[..., T],
+    new_function: Callable[..., T],
+) -> Callable[..., T] | None:
+    """
+    Generate a wrapper with the exact positional signature of new_function.
+
+    The first parameter of new_function receives the original function and is
+    not part of the generated signature. The original function and
+    new_function are bound as closure cells, so calling the wrapper does not
+    pack the arguments into *args and **kwargs.
+
+    Returns
+    -------
+        The generated wrapper or None if the signature is not supported.
+
+    """
+    parameters = list(inspect.signature(new_function).parameters.values())[1:]
+
+    if any(
+        parameter.kind is not inspect.Parameter.POSITIONAL_OR_KEYWORD
+        for parameter in parameters
+    ):
+        return None
+
+    arguments = ", ".join(parameter.name for parameter in parameters)
+    defaults = tuple(
+        parameter.default
+        for parameter in parameters
+        if parameter.default is not inspect.Parameter.empty
+    )
+
+    namespace: dict[str, Any] = {}
+    source = FAST_WRAPPER_TEMPLATE.format(parameters=arguments, arguments=arguments)
+    exec(source, namespace)  # noqa: S102
+
+    wrapper = namespace["factory"](new_function, target_function)
+    wrapper.__defaults__ = defaults or None
+
+    return update_wrapper(wrapper, target_function)
+
+
 # method calling injection
 def inject(
     target_function: Callable[..., T],
     new_function: Callable[..., T],
+    *,
+    fast: bool = False,
 ) -> Callable[..., T]:
     """
     Inject a wrapper method into an existing class.
 
-    Replaces the original method.
+    Replaces the original method. In fast mode the wrapper is generated with
+    the exact signature of new_function, if possible.
     """
+    if fast:
+        fast_wrapper = compile_fast_wrapper(target_function, new_function)
+
+        if fast_wrapper is not None:
+            return fast_wrapper
 
     @wraps(target_function)
     def _inject(*args: list[Any], **kwargs: list[Any]) -> T:
@@ -32,23 +95,225 @@ def inject(
     return _inject
 
 
+class InjectionProfile:
+    """Call statistics of a single injected override."""
+
+    __slots__ = ("calls", "exceptions", "max_time", "name", "total_time")
+
+    def __init__(self: Self, name: str) -> None:
+        """Create a new empty profile."""
+        self.name = name
+        self.calls = 0
+        self.exceptions = 0
+        self.total_time = 0.0
+        self.max_time = 0.0
+
+    def reset(self: Self) -> None:
+        """Reset all collected statistics."""
+        self.calls = 0
+        self.exceptions = 0
+        self.total_time = 0.0
+        self.max_time = 0.0
+
+
+class Injection:
+    """A single override that has been injected into a game class."""
+
+    def __init__(
+        self: Self,
+        name: str,
+        target_object: object,
+        target_name: str,
+        wrapper: Callable[..., Any],
+        to_attribute: Callable[[Callable[..., Any]], object],
+    ) -> None:
+        """Record a new injection."""
+        self.name = name
+        self.target_object = target_object
+        self.target_name = target_name
+        self.wrapper = wrapper
+        self.to_attribute = to_attribute
+        self.installed: object | None = None
+
+    @property
+    def is_current(self: Self) -> bool:
+        """Check that the installed attribute has not been replaced since."""
+        return vars(self.target_object).get(self.target_name) is self.installed
+
+    def install(self: Self, *, profile: InjectionProfile | None = None) -> None:
+        """Install the injected wrapper, optionally with profiling."""
+        function = self.wrapper
+
+        if profile is not None:
+            function = profiled(function, profile)
+
+        self.installed = self.to_attribute(function)
+        setattr(self.target_object, self.target_name, self.installed)
+
+
+class InjectionProfiler:
+    """
+    Opt-in profiler for all injected overrides.
+
+    Profiling re-installs every injected override with a timing wrapper and
+    restores the plain wrappers when it is disabled again, so there is no
+    overhead while the profiler is off. Overrides that have been patched
+    again by someone else since they have been installed are left alone, so
+    the other patch is not removed.
+    """
+
+    enabled = False
+    injections: ClassVar[list[Injection]] = []
+    profiles: ClassVar[dict[str, InjectionProfile]] = {}
+
+    @classmethod
+    def register(cls: type[InjectionProfiler], injection: Injection) -> None:
+        """Register and install a new injection."""
+        cls.injections.append(injection)
+
+        profile = cls._profile_for(injection) if cls.enabled else None
+        injection.install(profile=profile)
+
+    @classmethod
+    def enable(cls: type[InjectionProfiler]) -> list[Injection]:
+        """
+        Start collecting call statistics for all injections.
+
+        Returns
+        -------
+            The injections that have been patched by someone else and are
+            not profiled.
+
+        """
+        if cls.enabled:
+            return []
+
+        cls.enabled = True
+
+        return cls._reinstall(with_profile=True)
+
+    @classmethod
+    def disable(cls: type[InjectionProfiler]) -> list[Injection]:
+        """
+        Stop collecting call statistics.
+
+        Returns
+        -------
+            The injections that have been patched by someone else and have
+            not been restored.
+
+        """
+        if not cls.enabled:
+            return []
+
+        cls.enabled = False
+
+        return cls._reinstall(with_profile=False)
+
+    @classmethod
+    def _reinstall(
+        cls: type[InjectionProfiler],
+        *,
+        with_profile: bool,
+    ) -> list[Injection]:
+        skipped: list[Injection] = []
+
+        for injection in cls.injections:
+            if not injection.is_current:
+                Logger.warn(
+                    "%s.%s has been patched by someone else, skipping %s",
+                    getattr(
+                        injection.target_object,
+                        "__name__",
+                        injection.target_object,
+                    ),
+                    injection.target_name,
+                    injection.name,
+                )
+                skipped.append(injection)
+                continue
+
+            profile = cls._profile_for(injection) if with_profile else None
+            injection.install(profile=profile)
+
+        return skipped
+
+    @classmethod
+    def reset(cls: type[InjectionProfiler]) -> None:
+        """Reset all collected call statistics."""
+        for profile in cls.profiles.values():
+            profile.reset()
+
+    @classmethod
+    def sorted_profiles(cls: type[InjectionProfiler]) -> list[InjectionProfile]:
+        """Get all profiles that have been called, most expensive first."""
+        return sorted(
+            (profile for profile in cls.profiles.values() if profile.calls > 0),
+            key=lambda profile: profile.total_time,
+            reverse=True,
+        )
+
+    @classmethod
+    def _profile_for(
+        cls: type[InjectionProfiler],
+        injection: Injection,
+    ) -> InjectionProfile:
+        profile = cls.profiles.get(injection.name)
+
+        if profile is None:
+            profile = InjectionProfile(injection.name)
+            cls.profiles[injection.name] = profile
+
+        return profile
+
+
+def profiled(
+    function: Callable[..., T],
+    profile: InjectionProfile,
+) -> Callable[..., T]:
+    """Wrap a function to record its calls in the given profile."""
+
+    @wraps(function)
+    def _profiled(*args: list[Any], **kwargs: list[Any]) -> T:
+        start = time.perf_counter()
+
+        try:
+            return function(*args, **kwargs)
+        except BaseException:
+            profile.exceptions += 1
+            raise
+        finally:
+            elapsed = time.perf_counter() - start
+            profile.calls += 1
+            profile.total_time += elapsed
+            profile.max_time = max(elapsed, profile.max_time)
+
+    return _profiled
+
+
 def inject_method_to(
     target_object: object,
     target_function_name: str,
+    *,
+    fast: bool = False,
 ) -> Callable[[NewFun], NewFun]:
     """
     Inject a wrapper method into an existing class.
 
-    Replaces the original method.
+    Replaces the original method. Hot methods can opt into the fast wrapper.
     """
 
     def _inject_to(new_function: NewFun) -> NewFun:
         target_function = getattr(target_object, target_function_name)
 
-        setattr(
-            target_object,
-            target_function_name,
-            inject(target_function, new_function),
+        InjectionProfiler.register(
+            Injection(
+                new_function.__name__,
+                target_object,
+                target_function_name,
+                inject(target_function, new_function, fast=fast),
+                lambda function: function,
+            ),
         )
 
         return new_function
@@ -61,21 +326,29 @@ def inject_field_to(
     target_object: object,
     target_function: str,
     operator: str,
+    *,
+    fast: bool = False,
 ) -> Callable[[NewFun], NewFun]:
     """
     Inject a wrapper field into an existing class.
 
-    Replaces the existing field getter with the new one.
+    Replaces the existing field getter with the new one. Hot fields can opt
+    into the fast wrapper.
     """
 
     def _inject_to(new_getter: NewFun) -> NewFun:
         target_field = getattr(target_object, target_function)
         target_getter = target_field.getter
 
-        injected_getter = inject(target_getter, new_getter)
-        new_field = distributor.fields.Field(getter=injected_getter, op=operator)
-
-        setattr(target_object, target_function, new_field)
+        InjectionProfiler.register(
+            Injection(
+                new_getter.__name__,
+                target_object,
+                target_function,
+                inject(target_getter, new_getter, fast=fast),
+                lambda getter: distributor.fields.Field(getter=getter, op=operator),
+            ),
+        )
 
         return new_getter
 
@@ -86,21 +359,29 @@ def inject_field_to(
 def inject_property_to(
     target_object: object,
     target_function: str,
+    *,
+    fast: bool = False,
 ) -> Callable[[NewFun], NewFun]:
     """
     Inject a wrapper property into an existing class.
 
-    Replaces the existing property getter with the new one.
+    Replaces the existing property getter with the new one. Hot properties can
+    opt into the fast wrapper.
     """
 
     def _inject_to(new_getter: NewFun) -> NewFun:
         target_property = getattr(target_object, target_function)
         target_getter = target_property.__get__
 
-        injected_getter = inject(target_getter, new_getter)
-        new_property = property(injected_getter)
-
-        setattr(target_object, target_function, new_property)
+        InjectionProfiler.register(
+            Injection(
+                new_getter.__name__,
+                target_object,
+                target_function,
+                inject(target_getter, new_getter, fast=fast),
+                property,
+            ),
+        )
 
         return new_getter
 
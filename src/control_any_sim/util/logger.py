@@ -2,7 +2,22 @@
 
 from __future__ import annotations
 
+import atexit
+import time
+from collections import deque
+from enum import IntEnum
 from pathlib import Path
+from typing import TYPE_CHECKING, Any, Callable, ClassVar, Union
+
+import alarms
+import clock
+
+if TYPE_CHECKING:
+    from alarms import AlarmHandle
+    from typing_extensions import TypeAlias
+
+
+Message: TypeAlias = Union[str, Callable[[], str]]
 
 
 def get_logfile_name() -> str:
@@ -13,24 +28,165 @@ def get_logfile_name() -> str:
     return str(log_dir / "debug.log")
 
 
+class LogLevel(IntEnum):
+    """Severity of a log message."""
+
+    DEBUG = 10
+    INFO = 20
+    WARN = 30
+    ERROR = 40
+
+
 class Logger:
-    """Static logger class to write to log file."""
+    """
+    Static logger class to write to log file.
+
+    Messages are collected in a bounded buffer and written to disk in batches,
+    either when the buffer is full or when the flush interval has passed.
+    Inside a zone a real time alarm flushes the buffer after the interval,
+    outside of it flushing is opportunistic and happens on the next write.
+    Errors are always written immediately.
+
+    Messages can either be a format string with arguments or a callable
+    returning the message. Formatting only happens if the message level is
+    enabled, so disabled log lines cost nothing but the level check.
+    """
 
     PRODUCTION = False
 
+    BUFFER_SIZE = 256
+    FLUSH_INTERVAL = 2.0
+
+    level = LogLevel.ERROR if PRODUCTION else LogLevel.DEBUG
+
     handler = Path(get_logfile_name()).open("a")  # noqa: SIM115
+    buffer: ClassVar[deque[str]] = deque(maxlen=BUFFER_SIZE)
+    last_flush = time.monotonic()
+    flush_alarm: ClassVar[AlarmHandle | None] = None
 
     @classmethod
-    def log(cls: type[Logger], message: str) -> None:
-        """Write generic message to log."""
-        if cls.PRODUCTION:
+    def set_level(cls: type[Logger], level: LogLevel) -> None:
+        """Change the minimum level of messages that are written to the log."""
+        cls.level = level
+
+    @classmethod
+    def is_enabled_for(cls: type[Logger], level: LogLevel) -> bool:
+        """Check if messages of the given level are currently written."""
+        return level >= cls.level
+
+    @classmethod
+    def debug(cls: type[Logger], message: Message, *args: Any) -> None:  # noqa: ANN401
+        """Write debug message to log."""
+        if cls.level > LogLevel.DEBUG:
             return
 
-        cls.handler.write(message + "\n")
-        cls.handler.flush()
+        cls._write(LogLevel.DEBUG, message, args)
 
     @classmethod
-    def error(cls: type[Logger], message: str) -> None:
+    def info(cls: type[Logger], message: Message, *args: Any) -> None:  # noqa: ANN401
+        """Write info message to log."""
+        if cls.level > LogLevel.INFO:
+            return
+
+        cls._write(LogLevel.INFO, message, args)
+
+    @classmethod
+    def warn(cls: type[Logger], message: Message, *args: Any) -> None:  # noqa: ANN401
+        """Write warning message to log."""
+        if cls.level > LogLevel.WARN:
+            return
+
+        cls._write(LogLevel.WARN, message, args)
+
+    @classmethod
+    def error(cls: type[Logger], message: Message, *args: Any) -> None:  # noqa: ANN401
         """Write error message to log."""
-        cls.handler.write("ERROR: " + message + "\n")
+        cls._write(LogLevel.ERROR, message, args)
+
+    # generic messages are logged as debug messages
+    log = debug
+
+    @classmethod
+    def flush(cls: type[Logger]) -> None:
+        """Write all buffered messages to the log file."""
+        cls.last_flush = time.monotonic()
+        cls._cancel_flush_alarm()
+
+        if not cls.buffer:
+            return
+
+        lines = "".join(cls.buffer)
+        cls.buffer.clear()
+
+        cls.handler.write(lines)
         cls.handler.flush()
+
+    @classmethod
+    def _write(
+        cls: type[Logger],
+        level: LogLevel,
+        message: Message,
+        args: tuple[Any, ...],
+    ) -> None:
+        if callable(message):
+            message = message()
+        elif args:
+            message = message % args
+
+        if level == LogLevel.ERROR:
+            cls.buffer.append("ERROR: " + message + "\n")
+            cls.flush()
+            return
+
+        if level > LogLevel.DEBUG:
+            message = f"{level.name}: {message}"
+
+        cls.buffer.append(message + "\n")
+
+        if (
+            len(cls.buffer) >= cls.BUFFER_SIZE
+            or time.monotonic() - cls.last_flush >= cls.FLUSH_INTERVAL
+        ):
+            cls.flush()
+            return
+
+        # the first message of a batch makes sure the batch gets written
+        if len(cls.buffer) == 1:
+            cls._schedule_flush()
+
+    @classmethod
+    def _schedule_flush(cls: type[Logger]) -> None:
+        if cls.flush_alarm is not None:
+            return
+
+        try:
+            cls.flush_alarm = alarms.add_alarm_real_time(
+                cls,
+                clock.interval_in_real_seconds(cls.FLUSH_INTERVAL),
+                cls._on_flush_alarm,
+            )
+        except BaseException:
+            # there are no alarms outside of a zone, the next write flushes
+            cls.flush_alarm = None
+
+    @classmethod
+    def _on_flush_alarm(cls: type[Logger], _handle: AlarmHandle) -> None:
+        cls.flush_alarm = None
+        cls.flush()
+
+    @classmethod
+    def _cancel_flush_alarm(cls: type[Logger]) -> None:
+        if cls.flush_alarm is None:
+            return
+
+        flush_alarm = cls.flush_alarm
+        cls.flush_alarm = None
+
+        try:
+            alarms.cancel_alarm(flush_alarm)
+        except BaseException:
+            # the alarm is gone with its zone already
+            return
+
+
+atexit.register(Logger.flush)
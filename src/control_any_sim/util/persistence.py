@@ -0,0 +1,61 @@
+"""Helpers to safely persist mod state to disk."""
+
+from __future__ import annotations
+
+import os
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from typing_extensions import Self
+
+
+def write_atomic(path: Path, data: str) -> None:
+    """
+    Write data to a file without ever leaving a partially written file behind.
+
+    The data is written to a temporary file next to the target first, which is
+    then renamed over the target. Readers either see the old or the new state.
+    """
+    temp_path = path.with_name(path.name + ".tmp")
+
+    with temp_path.open("w", encoding="utf8") as file_handler:
+        file_handler.write(data)
+        file_handler.flush()
+        os.fsync(file_handler.fileno())
+
+    temp_path.replace(path)
+
+
+class StateStore:
+    """
+    Keyed store that keeps one compact record file per key.
+
+    Loading a record only reads the file of the requested key, records of all
+    other keys are left untouched.
+    """
+
+    def __init__(self: Self, directory: Path, suffix: str = ".json") -> None:
+        """Create a new store that keeps its records in the given directory."""
+        self.directory = directory
+        self.suffix = suffix
+
+    def path_for(self: Self, key: int | str) -> Path:
+        """Get the path of the record file for a key."""
+        return self.directory / f"{key}{self.suffix}"
+
+    def load(self: Self, key: int | str) -> str | None:
+        """Read the record of a key or None if there is no record."""
+        path = self.path_for(key)
+
+        if not path.is_file():
+            return None
+
+        with path.open(encoding="utf8") as file_handler:
+            return file_handler.read()
+
+    def save(self: Self, key: int | str, data: str) -> None:
+        """Atomically write the record of a key."""
+        self.directory.mkdir(parents=True, exist_ok=True)
+        write_atomic(self.path_for(key), data)
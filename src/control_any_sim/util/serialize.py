@@ -3,52 +3,157 @@
 from __future__ import annotations
 
 import json
-from typing import Any, Callable, TypeVar
+import struct
+from typing import Any, ClassVar, cast
 
 from typing_extensions import Self
 
-C = TypeVar("C")
+BINARY_MAGIC = b"CANYS"
+BINARY_HEADER = struct.Struct("<5sH")
+BINARY_INT = struct.Struct("<Q")
+BINARY_COUNT = struct.Struct("<I")
 
 
-def dict_to_obj(cls: type[C]) -> Callable[[dict[str, Any]], C]:
-    """
-    Convert a dict into an object.
+class SerializationError(ValueError):
+    """Serialized data does not match the schema of the class."""
 
-    Returns
-    -------
-        A function that converts an object into a dictionary.
 
-    """
+def is_of_type(value: Any, value_type: type) -> bool:  # noqa: ANN401
+    """Check the type of a value, booleans are not accepted as integers."""
+    if isinstance(value, bool) and value_type is not bool:
+        return False
 
-    def hook(our_dict: dict[str, Any]) -> C:
-        our_dict.pop("__class__", None)
+    return isinstance(value, value_type)
 
-        our_dict.pop("__module__", None)
 
-        # Use dictionary unpacking to initialize the object
-        return cls(**our_dict)
+class SerializedField:
+    """Declaration of a field that is part of the serialized data."""
 
-    return hook
+    __slots__ = ("item_type", "name", "required", "value_type")
 
+    def __init__(
+        self: Self,
+        name: str,
+        value_type: type,
+        item_type: type | None = None,
+        *,
+        required: bool = True,
+    ) -> None:
+        """Declare a new field, list fields also declare the type of their items."""
+        self.name = name
+        self.value_type = value_type
+        self.item_type = item_type
+        self.required = required
 
-def object_to_dict(obj: object) -> dict[str, Any]:
-    """
-    Convert object to dict.
+    def validate(self: Self, value: Any) -> None:  # noqa: ANN401
+        """Check that a value matches the declared type of the field."""
+        if not is_of_type(value, self.value_type):
+            msg = f"field {self.name} must be of type {self.value_type.__name__}"
+            raise SerializationError(msg)
 
-    Takes in a custom object
+        if self.item_type is None:
+            return
 
-    Returns
-    -------
-        A dictionary representation of the object.
+        items = cast("list[Any]", value)
+        item_type = self.item_type
 
-    """
-    return obj.__dict__
+        # exact types are the common case and never booleans for int items
+        if set(map(type, items)) <= {item_type}:
+            return
+
+        for item in items:
+            if not is_of_type(item, self.item_type):
+                msg = f"items of {self.name} must be of type {self.item_type.__name__}"
+                raise SerializationError(msg)
+
+    def pack(self: Self, value: Any) -> bytes:  # noqa: ANN401
+        """Encode a value of the field into its binary representation."""
+        if self.value_type is int:
+            return BINARY_INT.pack(value)
+
+        if self.value_type is list and self.item_type is int:
+            return BINARY_COUNT.pack(len(value)) + struct.pack(
+                f"<{len(value)}Q",
+                *value,
+            )
+
+        msg = f"field {self.name} has no binary representation"
+        raise SerializationError(msg)
+
+    def unpack(self: Self, data: bytes, offset: int) -> tuple[Any, int]:
+        """Decode a value of the field, returns the value and the new offset."""
+        if self.value_type is int:
+            (value,) = BINARY_INT.unpack_from(data, offset)
+            return value, offset + BINARY_INT.size
+
+        if self.value_type is list and self.item_type is int:
+            (count,) = BINARY_COUNT.unpack_from(data, offset)
+            offset += BINARY_COUNT.size
+            items = list(struct.unpack_from(f"<{count}Q", data, offset))
+            return items, offset + count * BINARY_INT.size
+
+        msg = f"field {self.name} has no binary representation"
+        raise SerializationError(msg)
 
 
 class Serializable:
-    """Class that can be serialized to JSON."""
+    """
+    Class that can be serialized to JSON.
+
+    Subclasses declare the fields that are part of the serialized data and a
+    schema version. Only declared fields are stored, all other attributes are
+    considered transient. When restoring, the declared fields are validated
+    and passed as keyword arguments to the constructor.
+    """
+
+    schema_version: ClassVar[int] = 1
+    serialized_fields: ClassVar[tuple[SerializedField, ...]] = ()
+
+    def to_dict(self: Self) -> dict[str, Any]:
+        """Get the serialized fields of the object as a dictionary."""
+        data: dict[str, Any] = {
+            field.name: getattr(self, field.name) for field in self.serialized_fields
+        }
+        data["version"] = self.schema_version
+
+        return data
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> Self:
+        """Create a new instance from a dictionary of serialized fields."""
+        version = data.get("version", 1)
+
+        if not is_of_type(version, int) or version > cls.schema_version:
+            msg = f"unsupported schema version {version} for {cls.__name__}"
+            raise SerializationError(msg)
+
+        data = cls.migrate(data, version)
+        arguments: dict[str, Any] = {}
 
-    def serialize(self: object) -> str:
+        for field in cls.serialized_fields:
+            if field.name not in data:
+                if field.required:
+                    msg = f"missing required field {field.name}"
+                    raise SerializationError(msg)
+
+                continue
+
+            value = data[field.name]
+            field.validate(value)
+            arguments[field.name] = value
+
+        return cls(**arguments)
+
+    @classmethod
+    def migrate(
+        cls,
+        data: dict[str, Any],
+        version: int,  # noqa: ARG003
+    ) -> dict[str, Any]:
+        """Upgrade data of an older schema version to the current version."""
+        return data
+
+    def serialize(self: Self) -> str:
         """
         Serialize an object into a JSON string.
 
@@ -57,16 +162,60 @@ class Serializable:
             A JSON string of the serialized data.
 
         """
-        return json.dumps(self, default=object_to_dict, indent=4, sort_keys=True)
+        return json.dumps(self.to_dict(), separators=(",", ":"), sort_keys=True)
+
+    def serialize_binary(self: Self) -> bytes:
+        """
+        Serialize an object into a compact binary representation.
+
+        Integer fields are stored as unsigned 64 bit values and integer lists
+        as packed arrays of them.
+
+        Returns
+        -------
+            The binary serialized data.
+
+        """
+        chunks = [BINARY_HEADER.pack(BINARY_MAGIC, self.schema_version)]
+
+        chunks.extend(
+            field.pack(getattr(self, field.name)) for field in self.serialized_fields
+        )
+
+        return b"".join(chunks)
 
     @classmethod
-    def deserialize(cls, data: str) -> Self:
+    def deserialize(cls, data: str | bytes) -> Self:
         """
-        Deserialize an object from a JSON string.
+        Deserialize an object from a JSON string or its binary representation.
 
         Returns
         -------
             A new instance of Self.
 
         """
-        return json.loads(data, object_hook=dict_to_obj(cls))
+        if isinstance(data, bytes) and data.startswith(BINARY_MAGIC):
+            return cls._deserialize_binary(data)
+
+        parsed = json.loads(data)
+
+        if not isinstance(parsed, dict):
+            msg = f"serialized {cls.__name__} must be an object"
+            raise SerializationError(msg)
+
+        return cls.from_dict(parsed)
+
+    @classmethod
+    def _deserialize_binary(cls, data: bytes) -> Self:
+        try:
+            (_magic, version) = BINARY_HEADER.unpack_from(data, 0)
+            offset = BINARY_HEADER.size
+            fields: dict[str, Any] = {"version": version}
+
+            for field in cls.serialized_fields:
+                (fields[field.name], offset) = field.unpack(data, offset)
+        except struct.error as err:
+            msg = f"truncated binary data for {cls.__name__}"
+            raise SerializationError(msg) from err
+
+        return cls.from_dict(fields)
@@ -0,0 +1,127 @@
+"""
+Tests of the mod that run outside of the game.
+
+The game's modules are not available here, they are replaced by stand-in
+modules that are created on import. Classes of the stand-in modules accept
+any arguments and answer every missing attribute with another stand-in
+class, so the mod's injections can be installed on them.
+"""
+
+from __future__ import annotations
+
+import sys
+from importlib.abc import Loader, MetaPathFinder
+from importlib.machinery import ModuleSpec
+from pathlib import Path
+from types import ModuleType
+from typing import Any, Sequence
+
+SRC_DIR = Path(__file__).resolve().parent.parent / "src"
+
+if str(SRC_DIR) not in sys.path:
+    sys.path.insert(0, str(SRC_DIR))
+
+# top level modules of the game that are replaced by stand-ins
+GAME_MODULES = frozenset(
+    (
+        "alarms",
+        "careers",
+        "clock",
+        "distributor",
+        "event_testing",
+        "interactions",
+        "objects",
+        "protocolbuffers",
+        "server",
+        "services",
+        "sims",
+        "sims4",
+        "singletons",
+        "small_business",
+        "ui",
+        "venues",
+        "zone",
+        "zone_types",
+    ),
+)
+
+
+class StubType(type):
+    """Metaclass of stand-in classes, missing attributes are stand-in classes."""
+
+    def __getattr__(cls, name: str) -> type:
+        """Answer a missing attribute with a new stand-in class."""
+        if name.startswith("__"):
+            raise AttributeError(name)
+
+        value = StubType(name, (StubObject,), {})
+        setattr(cls, name, value)
+
+        return value
+
+
+class StubObject(metaclass=StubType):
+    """
+    Base class of all stand-in classes.
+
+    Instances can be called, a single callable argument is returned as is so
+    instances also work as decorators. The classes also look like properties
+    to the property injection.
+    """
+
+    def __get__(self, _instance: Any, _owner: Any = None) -> Any:  # noqa: ANN401
+        """Return the value of the stand-in property."""
+        return self
+
+    def __init__(self, *_args: Any, **_kwargs: Any) -> None:  # noqa: ANN401
+        """Accept and ignore any arguments."""
+
+    def __call__(self, *args: Any, **_kwargs: Any) -> Any:  # noqa: ANN401
+        """Return a decorated function, ignore all other calls."""
+        if len(args) == 1 and callable(args[0]):
+            return args[0]
+
+        return None
+
+
+class StubModule(ModuleType):
+    """Stand-in module, missing attributes are created as stand-in classes."""
+
+    def __getattr__(self, name: str) -> type:
+        """Answer a missing attribute with a new stand-in class."""
+        if name.startswith("__"):
+            raise AttributeError(name)
+
+        value = StubType(name, (StubObject,), {})
+        setattr(self, name, value)
+
+        return value
+
+
+class StubFinder(MetaPathFinder, Loader):
+    """Import hook that creates a stand-in module for every game module."""
+
+    def find_spec(
+        self,
+        fullname: str,
+        _path: Sequence[str] | None,
+        _target: ModuleType | None = None,
+    ) -> ModuleSpec | None:
+        """Create the spec of a stand-in module for modules of the game."""
+        if fullname.split(".")[0] not in GAME_MODULES:
+            return None
+
+        return ModuleSpec(fullname, self, is_package=True)
+
+    def create_module(self, spec: ModuleSpec) -> ModuleType:
+        """Create an empty stand-in module."""
+        module = StubModule(spec.name)
+        module.__path__ = []
+
+        return module
+
+    def exec_module(self, module: ModuleType) -> None:
+        """Stand-in modules have no code to run."""
+
+
+sys.meta_path.append(StubFinder())
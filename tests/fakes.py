@@ -0,0 +1,188 @@
+"""Stand-ins for the game objects the services of the mod work with."""
+
+from __future__ import annotations
+
+import unittest
+from typing import Any, Callable
+from unittest import mock
+
+import services
+
+from control_any_sim import ts4_services
+from control_any_sim.services.selection_group import SelectionGroupService
+
+HOUSEHOLD_ID = 1
+OTHER_HOUSEHOLD_ID = 2
+
+
+class FakeRelationshipTracker:
+    """Relationship tracker that counts how often it sent its information."""
+
+    def __init__(self) -> None:
+        """Create a new tracker that has not sent anything."""
+        self.sends = 0
+
+    def clean_and_send_remaining_relationship_info(self) -> None:
+        """Count the relationship information sent to the client."""
+        self.sends += 1
+
+
+class FakeSimInfo:
+    """Sim info with an id and a household."""
+
+    def __init__(self, sim_id: int, household_id: int) -> None:
+        """Create a new sim info of the given household."""
+        self.id = sim_id
+        self.sim_id = sim_id
+        self.household_id = household_id
+        self.is_selectable = False
+        self.first_name = f"sim {sim_id}"
+        self.last_name = ""
+        self.household: Any = None
+        self.zone_id = 0
+        self.relationship_tracker = FakeRelationshipTracker()
+        self.commodity_publishes = 0
+
+    def request_lod(self, _lod: Any) -> None:  # noqa: ANN401
+        """Pretend to load the sim."""
+
+    def publish_all_commodities(self) -> None:
+        """Count the commodity publications."""
+        self.commodity_publishes += 1
+
+    def get_sim_instance(self, **_kwargs: Any) -> None:  # noqa: ANN401
+        """Pretend the sim is not instanced."""
+
+
+class FakeSelectableSims(list):
+    """List of selectable sims of the client that notifies its watchers."""
+
+    def __init__(self) -> None:
+        """Create an empty list without watchers."""
+        super().__init__()
+        self.watchers: dict[Any, Callable[[], None]] = {}
+
+    def add_watcher(self, owner: Any, watcher: Callable[[], None]) -> None:  # noqa: ANN401
+        """Register a watcher for changes of the list."""
+        self.watchers[owner] = watcher
+
+    def notify_dirty(self) -> None:
+        """Notify all watchers about a change."""
+        for watcher in tuple(self.watchers.values()):
+            watcher()
+
+
+class FakeClient:
+    """Game client with selectable sims and an active sim."""
+
+    def __init__(self) -> None:
+        """Create a new client without selectable sims."""
+        self.selectable_sims = FakeSelectableSims()
+        self.active_sim_info: FakeSimInfo | None = None
+        self.active_sim: Any = None
+        self.skewer_updates = 0
+        self.active_sim_switches = 0
+
+    def add_selectable_sim_info(self, sim_info: FakeSimInfo) -> None:
+        """Add a sim to the skewer and notify the watchers."""
+        sim_info.is_selectable = True
+        self.selectable_sims.append(sim_info)
+        self.selectable_sims.notify_dirty()
+
+    def remove_selectable_sim_info(self, sim_info: FakeSimInfo) -> None:
+        """Remove a sim from the skewer and notify the watchers."""
+        sim_info.is_selectable = False
+        self.selectable_sims.remove(sim_info)
+        self.selectable_sims.notify_dirty()
+
+    def remove_selectable_sim_by_id(self, sim_id: int) -> None:
+        """Remove the selectable sim with the given id from the skewer."""
+        for sim_info in tuple(self.selectable_sims):
+            if sim_info.id == sim_id:
+                self.remove_selectable_sim_info(sim_info)
+
+    def send_selectable_sims_update(self) -> None:
+        """Count the skewer updates."""
+        self.skewer_updates += 1
+
+    def set_active_sim_by_id(self, sim_id: int) -> None:
+        """Make the selectable sim with the given id active."""
+        self.active_sim_switches += 1
+
+        for sim_info in self.selectable_sims:
+            if sim_info.id == sim_id:
+                self.active_sim_info = sim_info
+
+    def register_active_sim_changed(self, _callback: Callable[..., None]) -> None:
+        """Accept the dispatcher of the active sim changed event."""
+
+
+def fake_services_module(client: FakeClient) -> mock.MagicMock:
+    """
+    Create a stand-in services module for the given client.
+
+    Returns
+    -------
+        The stand-in services module, its services can be configured.
+
+    """
+    fake_services = mock.MagicMock()
+    fake_services.get_first_client.return_value = client
+    fake_services.active_household_id.return_value = HOUSEHOLD_ID
+    fake_services.active_sim_info.return_value = None
+
+    return fake_services
+
+
+def patch_services(
+    test: unittest.TestCase,
+    client: FakeClient,
+) -> mock.MagicMock:
+    """
+    Back the mod's service accessors by mocks for the duration of a test.
+
+    Returns
+    -------
+        The stand-in services module, its services can be configured.
+
+    """
+    fake_services = fake_services_module(client)
+
+    ts4_services.use(fake_services)
+    test.addCleanup(ts4_services.use, services)
+
+    return fake_services
+
+
+class SelectionGroupTestCase(unittest.TestCase):
+    """Test case with a selection group of a fake client."""
+
+    def setUp(self) -> None:
+        """Create a selection group of a client with one household member."""
+        self.client = FakeClient()
+        self.services = patch_services(self, self.client)
+        self.member = FakeSimInfo(10, HOUSEHOLD_ID)
+        self.client.add_selectable_sim_info(self.member)
+
+        self.group = SelectionGroupService(HOUSEHOLD_ID)
+        self.client.selectable_sims.add_watcher(
+            self.group,
+            self.group.on_selectable_sims_notified,
+        )
+        self.group.zone_is_setup = True
+        self.addCleanup(self.cancel_subscriptions)
+
+    def cancel_subscriptions(self) -> None:
+        """Remove the event listeners of the selection group."""
+        for subscription in self.group._subscriptions:  # noqa: SLF001
+            subscription.cancel()
+
+    def add_with_event(self, sim_info: FakeSimInfo) -> None:
+        """Add a sim to the client like the injected method does."""
+        self.client.add_selectable_sim_info(sim_info)
+        self.group.on_selectable_sim_added(sim_info)
+
+    def remove_with_event(self, sim_info: FakeSimInfo) -> None:
+        """Remove a sim from the client like the injected method does."""
+        self.client.remove_selectable_sim_info(sim_info)
+        self.group.on_selectable_sim_removed(sim_info)
@@ -0,0 +1,153 @@
+"""Tests of the time budget and ordering of the deferred work queue."""
+
+from __future__ import annotations
+
+import unittest
+from typing import Callable
+from unittest import mock
+
+from control_any_sim.util import deferred_queue
+from control_any_sim.util.deferred_queue import DeferredQueue
+
+
+class FakeClock:
+    """Timer that only advances when work tells it to."""
+
+    def __init__(self) -> None:
+        """Create a new clock at time zero."""
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        """Get the current time."""
+        return self.now
+
+    def work(self, log: list[int], item: int, cost: float) -> Callable[[], None]:
+        """Create work that records its item and takes the given time."""
+
+        def run() -> None:
+            log.append(item)
+            self.now += cost
+
+        return run
+
+
+class TestBudget(unittest.TestCase):
+    """A drain stops once the time budget is used up."""
+
+    def setUp(self) -> None:
+        """Create a queue with a fake clock and a 2ms budget."""
+        self.clock = FakeClock()
+        self.queue = DeferredQueue(budget=0.002, timer=self.clock)
+        self.log: list[int] = []
+
+    def test_drain_stops_at_budget(self) -> None:
+        """Work that fits into the budget runs, the rest waits."""
+        for item in range(5):
+            self.queue.work.append(self.clock.work(self.log, item, 0.001))
+
+        self.assertEqual(self.queue.drain(), 2)
+        self.assertEqual(self.log, [0, 1])
+        self.assertEqual(len(self.queue), 3)
+
+    def test_drain_runs_at_least_one_item(self) -> None:
+        """Work that is larger than the budget still makes progress."""
+        for item in range(2):
+            self.queue.work.append(self.clock.work(self.log, item, 0.01))
+
+        self.assertEqual(self.queue.drain(), 1)
+        self.assertEqual(self.log, [0])
+
+    def test_order_is_kept_across_drains(self) -> None:
+        """Work runs in the order it has been queued."""
+        for item in range(7):
+            self.queue.work.append(self.clock.work(self.log, item, 0.0015))
+
+        while self.queue.drain():
+            pass
+
+        self.assertEqual(self.log, list(range(7)))
+
+    def test_failing_work_does_not_stop_drain(self) -> None:
+        """An exception of one work item does not drop the others."""
+
+        def fail() -> None:
+            message = "work failed"
+            raise RuntimeError(message)
+
+        self.queue.work.append(fail)
+        self.queue.work.append(self.clock.work(self.log, 1, 0.0))
+
+        self.assertEqual(self.queue.drain(), 2)
+        self.assertEqual(self.log, [1])
+
+    def test_drain_all_ignores_budget(self) -> None:
+        """drain_all runs all work regardless of the time budget."""
+        for item in range(5):
+            self.queue.work.append(self.clock.work(self.log, item, 0.01))
+
+        self.assertEqual(self.queue.drain_all(), 5)
+        self.assertEqual(self.log, list(range(5)))
+
+
+class TestAlarm(unittest.TestCase):
+    """The queue is drained by a single repeating alarm."""
+
+    def setUp(self) -> None:
+        """Replace the game's alarms with a mock."""
+        patcher = mock.patch.object(deferred_queue, "alarms")
+        self.alarms = patcher.start()
+        self.addCleanup(patcher.stop)
+
+        self.clock = FakeClock()
+        self.queue = DeferredQueue(budget=0.002, timer=self.clock)
+        self.log: list[int] = []
+
+    def test_push_schedules_one_alarm(self) -> None:
+        """Only the first push of a busy queue adds an alarm."""
+        for item in range(3):
+            self.queue.push(self.clock.work(self.log, item, 0.0015))
+
+        self.assertEqual(self.alarms.add_alarm_real_time.call_count, 1)
+        self.assertEqual(self.log, [])
+
+    def test_alarm_drains_and_stops(self) -> None:
+        """The alarm drains the queue and is cancelled once it is empty."""
+        for item in range(3):
+            self.queue.push(self.clock.work(self.log, item, 0.0015))
+
+        handle = self.queue.alarm_handle
+        callback = self.alarms.add_alarm_real_time.call_args[0][2]
+
+        callback(handle)
+
+        self.assertEqual(self.log, [0, 1])
+        self.alarms.cancel_alarm.assert_not_called()
+
+        callback(handle)
+
+        self.assertEqual(self.log, [0, 1, 2])
+        self.alarms.cancel_alarm.assert_called_once_with(handle)
+        self.assertIsNone(self.queue.alarm_handle)
+
+    def test_work_runs_without_alarm(self) -> None:
+        """Work runs right away if no alarm can be added."""
+        self.alarms.add_alarm_real_time.side_effect = RuntimeError("no zone")
+
+        self.queue.push(self.clock.work(self.log, 0, 0.0))
+
+        self.assertEqual(self.log, [0])
+        self.assertEqual(len(self.queue), 0)
+
+    def test_clear_drops_work_and_alarm(self) -> None:
+        """Clearing the queue drops the work and cancels the alarm."""
+        self.queue.push(self.clock.work(self.log, 0, 0.0))
+        handle = self.queue.alarm_handle
+
+        self.queue.clear()
+
+        self.assertEqual(len(self.queue), 0)
+        self.alarms.cancel_alarm.assert_called_once_with(handle)
+
+
+if __name__ == "__main__":
+    unittest.main()
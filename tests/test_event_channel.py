@@ -0,0 +1,87 @@
+"""Tests of the handler registry of the game events."""
+
+from __future__ import annotations
+
+import gc
+import unittest
+from typing import Callable
+
+from control_any_sim.util.event_channel import EventChannel
+
+
+class Listener:
+    """Object that listens to an event with a bound method."""
+
+    def __init__(self) -> None:
+        """Create a new listener without any calls."""
+        self.calls: list[int] = []
+
+    def on_event(self, value: int) -> None:
+        """Record the value of the event."""
+        self.calls.append(value)
+
+
+class TestLeakCycling(unittest.TestCase):
+    """Handlers of collected objects do not keep piling up."""
+
+    def test_collected_listeners_are_dropped(self) -> None:
+        """Subscribing many short lived listeners leaves no subscription behind."""
+        channel: EventChannel[Callable[[int], None]] = EventChannel("test")
+
+        for cycle in range(100):
+            listener = Listener()
+            channel.subscribe(listener.on_event)
+            channel.emit(cycle)
+
+            self.assertEqual(listener.calls, [cycle])
+
+            del listener
+            gc.collect()
+
+        self.assertEqual(len(channel), 0)
+        self.assertEqual(channel.subscriptions, [])
+
+    def test_subscription_does_not_keep_listener_alive(self) -> None:
+        """A bound method handler only references its object weakly."""
+        channel: EventChannel[Callable[[int], None]] = EventChannel("test")
+        listener = Listener()
+        subscription = channel.subscribe(listener.on_event)
+
+        del listener
+        gc.collect()
+
+        self.assertIsNone(subscription.handler)
+        self.assertEqual(channel.handlers(), [])
+        self.assertFalse(subscription.active)
+
+    def test_resubscribing_returns_existing_subscription(self) -> None:
+        """Subscribing the same handler again does not add a second entry."""
+        channel: EventChannel[Callable[[int], None]] = EventChannel("test")
+        listener = Listener()
+
+        for _ in range(10):
+            subscription = channel.subscribe(listener.on_event)
+
+        self.assertIs(channel.subscribe(listener.on_event), subscription)
+        self.assertEqual(len(channel), 1)
+
+        channel.emit(1)
+
+        self.assertEqual(listener.calls, [1])
+
+    def test_cancel_and_subscribe_cycles(self) -> None:
+        """Repeatedly cancelling and subscribing keeps a single subscription."""
+        channel: EventChannel[Callable[[int], None]] = EventChannel("test")
+        listener = Listener()
+
+        for cycle in range(10):
+            channel.subscribe(listener.on_event).cancel()
+            channel.subscribe(listener.on_event)
+            channel.emit(cycle)
+
+        self.assertEqual(len(channel), 1)
+        self.assertEqual(listener.calls, list(range(10)))
+
+
+if __name__ == "__main__":
+    unittest.main()
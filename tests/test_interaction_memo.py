@@ -0,0 +1,143 @@
+"""Invalidation of the memo of the interaction tests."""
+
+from __future__ import annotations
+
+import unittest
+from typing import Any
+
+from control_any_sim.canys_interactions import InteractionTestMemo
+from control_any_sim.services.roommate_cache import RoommateCacheService
+from control_any_sim.services.selection_group import SelectionGroupService
+from tests.fakes import (
+    HOUSEHOLD_ID,
+    OTHER_HOUSEHOLD_ID,
+    FakeSimInfo,
+    SelectionGroupTestCase,
+)
+
+
+class FakeSim:
+    """Sim instance of a sim info."""
+
+    def __init__(self, sim_info: FakeSimInfo) -> None:
+        """Create the instance of the sim info."""
+        self.sim_info = sim_info
+
+
+class FakeContext:
+    """Interaction context of an acting sim."""
+
+    def __init__(self, sim_info: FakeSimInfo) -> None:
+        """Create the context of the acting sim."""
+        self.sim = FakeSim(sim_info)
+
+
+class TestInteractionTestMemo(SelectionGroupTestCase):
+    """Remembered fail reasons are dropped whenever the checks may change."""
+
+    def setUp(self) -> None:
+        """Make the group current and count the checks that are run."""
+        super().setUp()
+
+        SelectionGroupService.instance = self.group
+        self.addCleanup(setattr, SelectionGroupService, "instance", None)
+        InteractionTestMemo.clear()
+        self.addCleanup(InteractionTestMemo.clear)
+
+        self.target = FakeSimInfo(20, OTHER_HOUSEHOLD_ID)
+        self.context: Any = FakeContext(self.member)
+        self.checks = 0
+
+    def check(self) -> str | None:
+        """Fail like a check of the selection group does."""
+        self.checks += 1
+
+        if self.group.is_custom_sim(self.target.id):
+            return "sim is already selectable"
+
+        return None
+
+    def run_check(self) -> str | None:
+        """Run the memoized check for the target."""
+        return InteractionTestMemo.test(
+            type(self),
+            self.target,
+            self.context,
+            self.check,
+        )
+
+    def test_result_is_remembered(self) -> None:
+        """Repeated tests of the same target run the check once."""
+        self.assertIsNone(self.run_check())
+        self.assertIsNone(self.run_check())
+        self.assertEqual(self.checks, 1)
+
+    def test_actor_is_part_of_the_key(self) -> None:
+        """Another acting sim runs the check again."""
+        self.run_check()
+        self.context = FakeContext(FakeSimInfo(11, HOUSEHOLD_ID))
+        self.run_check()
+
+        self.assertEqual(self.checks, 2)
+
+    def test_selection_change_invalidates(self) -> None:
+        """A new custom sim drops the remembered result."""
+        self.assertIsNone(self.run_check())
+
+        self.add_with_event(self.target)
+
+        self.assertEqual(self.run_check(), "sim is already selectable")
+        self.assertEqual(self.checks, 2)
+
+    def test_silent_selection_change_invalidates(self) -> None:
+        """A change without an event is synced before the memo is used."""
+        self.assertIsNone(self.run_check())
+
+        self.client.add_selectable_sim_info(self.target)
+
+        self.assertEqual(self.run_check(), "sim is already selectable")
+
+    def test_roommate_change_invalidates(self) -> None:
+        """Dropping the roommate cache drops the remembered result."""
+        self.run_check()
+        RoommateCacheService.invalidate()
+        self.run_check()
+
+        self.assertEqual(self.checks, 2)
+
+    def test_active_household_change_invalidates(self) -> None:
+        """Switching the active household drops the remembered result."""
+        self.run_check()
+        self.services.active_household_id.return_value = OTHER_HOUSEHOLD_ID
+        self.run_check()
+
+        self.assertEqual(self.checks, 2)
+
+    def test_target_household_change_invalidates(self) -> None:
+        """A target that moved to another household is checked again."""
+        self.run_check()
+        self.target.household_id = HOUSEHOLD_ID
+        self.run_check()
+
+        self.assertEqual(self.checks, 2)
+
+    def test_state_does_not_reference_the_group(self) -> None:
+        """A torn down group is not kept alive by the memo."""
+        self.run_check()
+
+        self.assertTrue(
+            all(isinstance(value, int) for value in InteractionTestMemo.state or ()),
+        )
+
+    def test_zone_teardown_drops_results(self) -> None:
+        """Nothing is kept from a torn down zone."""
+        self.run_check()
+
+        InteractionTestMemo.on_zone_teardown(None, None)  # type: ignore[arg-type]
+
+        self.assertEqual(InteractionTestMemo.results, {})
+        self.assertIsNone(InteractionTestMemo.state)
+
+
+if __name__ == "__main__":
+    unittest.main()
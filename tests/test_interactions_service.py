@@ -0,0 +1,62 @@
+"""Tests of the injection of the mod's interactions into sims."""
+
+from __future__ import annotations
+
+import unittest
+from typing import Any
+
+from control_any_sim.services.interactions_service import InteractionsService
+
+GAME_AFFORDANCES = (type("GameInteraction", (), {}),)
+INJECTED_AFFORDANCES = (type("ModInteraction", (), {}),)
+
+
+class TestInjectIntoSim(unittest.TestCase):
+    """Affordances are patched on the sim class and shared by its sims."""
+
+    def setUp(self) -> None:
+        """Resolve the injected interactions and create a sim class."""
+        InteractionsService.injected_affordances = INJECTED_AFFORDANCES
+        self.addCleanup(InteractionsService.on_zone_teardown, None, None)
+
+        self.sim_class: Any = type(
+            "Sim",
+            (),
+            {"_super_affordances": GAME_AFFORDANCES},
+        )
+
+    def test_class_is_patched_once(self) -> None:
+        """All sims of a class share a single extended tuple."""
+        sims = [self.sim_class() for _ in range(3)]
+
+        for sim in sims:
+            InteractionsService.inject_into_sim(sim)
+
+        patched = self.sim_class._super_affordances  # noqa: SLF001
+
+        self.assertEqual(patched, GAME_AFFORDANCES + INJECTED_AFFORDANCES)
+        self.assertTrue(all(sim._super_affordances is patched for sim in sims))  # noqa: SLF001
+        self.assertTrue(all("_super_affordances" not in vars(sim) for sim in sims))
+
+    def test_reset_class_is_patched_again(self) -> None:
+        """A list that was replaced after patching is extended again."""
+        InteractionsService.inject_into_sim(self.sim_class())
+        self.sim_class._super_affordances = GAME_AFFORDANCES  # noqa: SLF001
+
+        InteractionsService.inject_into_sim(self.sim_class())
+
+        self.assertEqual(
+            self.sim_class._super_affordances,  # noqa: SLF001
+            GAME_AFFORDANCES + INJECTED_AFFORDANCES,
+        )
+
+    def test_instance_list_is_interned(self) -> None:
+        """Sims with their own list share the extended tuple of that list."""
+        sims = [self.sim_class() for _ in range(2)]
+
+        for sim in sims:
+            sim._super_affordances = GAME_AFFORDANCES  # noqa: SLF001
+            InteractionsService.inject_into_sim(sim)
+
+        self.assertIs(sims[0]._super_affordances, sims[1]._super_affordances)  # noqa: SLF001
+        self.assertEqual(self.sim_class._super_affordances, GAME_AFFORDANCES)  # noqa: SLF001
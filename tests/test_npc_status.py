@@ -0,0 +1,124 @@
+"""Equivalence of the cached is_npc override with the uncached lookups."""
+
+from __future__ import annotations
+
+import unittest
+from typing import Any
+
+from control_any_sim import main
+from control_any_sim.services.selection_group import SelectionGroupService
+from tests.fakes import (
+    HOUSEHOLD_ID,
+    OTHER_HOUSEHOLD_ID,
+    FakeSimInfo,
+    SelectionGroupTestCase,
+)
+
+SIM_COUNT = 1000
+
+
+def uncached_is_npc(
+    sim_info: FakeSimInfo,
+    active_sim_info: FakeSimInfo | None,
+    selection_group: SelectionGroupService | None,
+) -> bool:
+    """Answer is_npc like the override did before the NPC status was cached."""
+    if active_sim_info == sim_info:
+        return False
+
+    if sim_info.household_id == HOUSEHOLD_ID:
+        if not selection_group:
+            return False
+
+        return selection_group.is_household_npc(sim_info)
+
+    return True
+
+
+def original_is_npc(_sim_info: FakeSimInfo) -> bool:
+    """Stand-in for the game's getter, it must never be reached."""
+    message = "the override fell back to the original getter"
+    raise AssertionError(message)
+
+
+class TestNpcStatus(SelectionGroupTestCase):
+    """The override answers like the uncached lookups for any active sim."""
+
+    def setUp(self) -> None:
+        """Create sims of three households, every tenth member is an NPC."""
+        super().setUp()
+
+        self.sim_infos = [
+            FakeSimInfo(100 + index, (HOUSEHOLD_ID, OTHER_HOUSEHOLD_ID, 3)[index % 3])
+            for index in range(SIM_COUNT)
+        ]
+
+        for sim_info in self.sim_infos[::10]:
+            if sim_info.household_id == HOUSEHOLD_ID:
+                self.group.add_household_npc(sim_info)
+
+        self.group.remove_household_npc(self.sim_infos[0])
+
+        SelectionGroupService.instance = self.group
+        self.addCleanup(setattr, SelectionGroupService, "instance", None)
+
+    def set_active_sim_info(self, sim_info: FakeSimInfo | None) -> None:
+        """Change the active sim through the injected client method."""
+
+        def set_active(_client: Any, new_sim_info: FakeSimInfo | None) -> None:  # noqa: ANN401
+            self.client.active_sim_info = new_sim_info
+            self.services.active_sim_info.return_value = new_sim_info
+
+            # active sim changed listeners of the client run at this point
+            if new_sim_info is not None:
+                self.assertFalse(
+                    main.canys_sim_info_is_npc(original_is_npc, new_sim_info),
+                )
+
+        main.canys_client_set_active_sim_info(set_active, self.client, sim_info)
+
+    def assert_equivalent(self, selection_group: SelectionGroupService | None) -> None:
+        """Compare the override with the uncached lookups for all sims."""
+        active_sim_info = self.client.active_sim_info
+
+        for sim_info in self.sim_infos:
+            self.assertEqual(
+                main.canys_sim_info_is_npc(original_is_npc, sim_info),
+                uncached_is_npc(sim_info, active_sim_info, selection_group),
+                f"sim {sim_info.id} with active sim {active_sim_info}",
+            )
+
+    def test_equivalent_for_any_active_sim(self) -> None:
+        """Members, household NPCs and foreign sims can all be active."""
+        npc = next(
+            sim_info
+            for sim_info in self.sim_infos
+            if self.group.is_household_npc(sim_info)
+        )
+        candidates = [None, self.sim_infos[3], npc, self.sim_infos[1]]
+
+        for active_sim_info in candidates:
+            self.set_active_sim_info(active_sim_info)
+            self.assert_equivalent(self.group)
+
+    def test_equivalent_after_household_npc_changes(self) -> None:
+        """Household NPC changes need no reset of the NPC status."""
+        self.set_active_sim_info(self.sim_infos[3])
+        self.assert_equivalent(self.group)
+
+        self.group.add_household_npc(self.sim_infos[6])
+        self.group.remove_household_npc(self.sim_infos[30])
+
+        self.assert_equivalent(self.group)
+
+    def test_equivalent_without_selection_group(self) -> None:
+        """Without a selection group the override falls back to the services."""
+        SelectionGroupService.instance = None
+
+        for active_sim_info in (None, self.sim_infos[3], self.sim_infos[1]):
+            self.set_active_sim_info(active_sim_info)
+            self.assert_equivalent(None)
+
+
+if __name__ == "__main__":
+    unittest.main()
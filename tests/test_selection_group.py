@@ -0,0 +1,315 @@
+"""Tests of the selection group service."""
+
+from __future__ import annotations
+
+import unittest
+from typing import Any, Callable
+from unittest import mock
+
+from control_any_sim.services import selection_group
+from control_any_sim.services.selection_group import SelectionGroupService
+from control_any_sim.util.game_events import GameEvents
+from tests.fakes import (
+    HOUSEHOLD_ID,
+    OTHER_HOUSEHOLD_ID,
+    FakeSimInfo,
+    SelectionGroupTestCase,
+)
+
+
+class TestIncrementalTracking(SelectionGroupTestCase):
+    """Selectable sims are tracked from the selectable sim events."""
+
+    def test_events_are_tracked(self) -> None:
+        """Added and removed sims are tracked without a rebuild."""
+        npc = FakeSimInfo(20, OTHER_HOUSEHOLD_ID)
+
+        self.add_with_event(npc)
+
+        self.assertTrue(self.group.is_selectable(npc.id))
+        self.assertEqual(self.group.selectable_sims, [npc.id])
+
+        self.remove_with_event(npc)
+
+        self.assertFalse(self.group.is_selectable(npc.id))
+        self.assertEqual(self.group.selectable_sims, [])
+        self.assertTrue(self.group.is_selectable(self.member.id))
+
+    def test_change_without_event_is_not_lost(self) -> None:
+        """A notification without an event is not cleared by a later event."""
+        silent = FakeSimInfo(20, OTHER_HOUSEHOLD_ID)
+        npc = FakeSimInfo(30, OTHER_HOUSEHOLD_ID)
+
+        # the client changed without going through the injected methods
+        self.client.add_selectable_sim_info(silent)
+        self.add_with_event(npc)
+
+        self.assertTrue(self.group.is_selectable(silent.id))
+        self.assertTrue(self.group.is_selectable(npc.id))
+        self.assertEqual(self.group.selectable_sims, [silent.id, npc.id])
+
+    def test_silent_change_is_rebuilt_before_use(self) -> None:
+        """A notification without any event rebuilds on the next lookup."""
+        silent = FakeSimInfo(20, OTHER_HOUSEHOLD_ID)
+
+        self.client.add_selectable_sim_info(silent)
+
+        self.assertTrue(self.group.is_selectable(silent.id))
+        self.assertEqual(self.group.selectable_sims, [silent.id])
+
+    def test_generation_changes_with_selection(self) -> None:
+        """Every change of the selectable sims moves the generation."""
+        generation = self.group.selection_generation
+
+        self.add_with_event(FakeSimInfo(20, OTHER_HOUSEHOLD_ID))
+
+        self.assertNotEqual(self.group.selection_generation, generation)
+
+
+class TestChangesSince(SelectionGroupTestCase):
+    """The delta of the custom sims since a generation."""
+
+    def test_net_changes(self) -> None:
+        """Sims that are added and removed again are not part of the delta."""
+        removed = FakeSimInfo(20, OTHER_HOUSEHOLD_ID)
+        added = FakeSimInfo(30, OTHER_HOUSEHOLD_ID)
+        transient = FakeSimInfo(40, OTHER_HOUSEHOLD_ID)
+
+        self.add_with_event(removed)
+        generation = self.group.selection_generation
+
+        self.remove_with_event(removed)
+        self.add_with_event(added)
+        self.add_with_event(transient)
+        self.remove_with_event(transient)
+
+        self.assertEqual(
+            self.group.changes_since(generation),
+            ([added.id], [removed.id]),
+        )
+        self.assertEqual(
+            self.group.changes_since(self.group.selection_generation),
+            ([], []),
+        )
+
+    def test_household_members_are_not_part_of_the_delta(self) -> None:
+        """Only custom sims are tracked in the change log."""
+        generation = self.group.selection_generation
+
+        self.add_with_event(FakeSimInfo(11, HOUSEHOLD_ID))
+
+        self.assertEqual(self.group.changes_since(generation), ([], []))
+
+    def test_silent_change_is_part_of_the_delta(self) -> None:
+        """Changes without an event are synced before the delta is computed."""
+        silent = FakeSimInfo(20, OTHER_HOUSEHOLD_ID)
+        generation = self.group.selection_generation
+
+        self.client.add_selectable_sim_info(silent)
+
+        self.assertEqual(self.group.changes_since(generation), ([silent.id], []))
+
+    def test_log_that_does_not_reach_back(self) -> None:
+        """Generations older than the change log have no delta."""
+        generation = self.group.selection_generation
+        npc = FakeSimInfo(20, OTHER_HOUSEHOLD_ID)
+
+        for _ in range(self.group.CHANGE_LOG_SIZE):
+            self.add_with_event(npc)
+            self.remove_with_event(npc)
+
+        self.assertIsNone(self.group.changes_since(generation))
+
+
+class TestPersistState(SelectionGroupTestCase):
+    """Persisting the state consumes the delta of the custom sims."""
+
+    def setUp(self) -> None:
+        """Record the writes of the selection group."""
+        super().setUp()
+        self.state_store = mock.Mock()
+        self.group.state_store = self.state_store
+        self.group.persist_state()
+        self.state_store.reset_mock()
+
+    def test_unchanged_state_is_not_written(self) -> None:
+        """Changes that are not part of the state do not write it."""
+        self.add_with_event(FakeSimInfo(11, HOUSEHOLD_ID))
+        self.group.persist_state()
+
+        self.state_store.save.assert_not_called()
+
+    def test_changed_custom_sims_are_written(self) -> None:
+        """A new custom sim writes the state."""
+        self.add_with_event(FakeSimInfo(20, OTHER_HOUSEHOLD_ID))
+        self.group.persist_state()
+
+        self.state_store.save.assert_called_once()
+
+    def test_changed_household_npcs_are_written(self) -> None:
+        """A new household NPC writes the state."""
+        self.group.add_household_npc(self.member)
+        self.group.persist_state()
+
+        self.state_store.save.assert_called_once()
+
+    def test_silent_change_is_written(self) -> None:
+        """Changes without an event are synced before persisting."""
+        self.client.add_selectable_sim_info(FakeSimInfo(20, OTHER_HOUSEHOLD_ID))
+        self.group.persist_state()
+
+        self.state_store.save.assert_called_once()
+
+
+class TestReadersSync(SelectionGroupTestCase):
+    """Every reader of the tracked sims sees changes without an event."""
+
+    def test_is_custom_sim(self) -> None:
+        """is_custom_sim syncs the tracked sims."""
+        silent = FakeSimInfo(20, OTHER_HOUSEHOLD_ID)
+
+        self.client.add_selectable_sim_info(silent)
+
+        self.assertTrue(self.group.is_custom_sim(silent.id))
+
+    def test_selection_generation(self) -> None:
+        """The generation moves for changes without an event."""
+        generation = self.group.selection_generation
+
+        self.client.add_selectable_sim_info(FakeSimInfo(20, OTHER_HOUSEHOLD_ID))
+
+        self.assertNotEqual(self.group.selection_generation, generation)
+
+
+class TestSkewerUpdate(SelectionGroupTestCase):
+    """Skewer updates of groups that are not the current instance."""
+
+    def test_update_is_sent_right_away(self) -> None:
+        """Without a current instance nobody would send a scheduled update."""
+        self.group.schedule_selectable_sims_update()
+
+        self.assertEqual(self.client.skewer_updates, 1)
+
+
+class TestSpawnedSims(SelectionGroupTestCase):
+    """Skewer updates of the current instance for spawning sims."""
+
+    def setUp(self) -> None:
+        """Make the group current, add NPCs and replace the game's alarms."""
+        super().setUp()
+        self.npcs = [FakeSimInfo(sim_id, OTHER_HOUSEHOLD_ID) for sim_id in range(100)]
+
+        for sim_info in self.npcs:
+            self.add_with_event(sim_info)
+
+        patcher = mock.patch.object(selection_group, "alarms")
+        self.alarms = patcher.start()
+        self.addCleanup(patcher.stop)
+
+        SelectionGroupService.instance = self.group
+        self.addCleanup(setattr, SelectionGroupService, "instance", None)
+
+    def skewer_update_alarms(self) -> list[Callable[[Any], None]]:
+        """Get the callbacks of all skewer update alarms that have been added."""
+        return [
+            alarm_call[0][2]
+            for alarm_call in self.alarms.add_alarm_real_time.call_args_list
+            if alarm_call[0][2] == self.group._on_skewer_update_alarm  # noqa: SLF001
+        ]
+
+    def test_spawn_burst_sends_one_update(self) -> None:
+        """100 spawning NPCs are coalesced into a single skewer update."""
+        for sim_info in self.npcs:
+            GameEvents.emit_post_spawn_sim(sim_info)
+
+        callbacks = self.skewer_update_alarms()
+
+        self.assertEqual(len(callbacks), 1)
+        self.assertEqual(self.client.skewer_updates, 0)
+
+        callbacks[0](self.group._skewer_update_alarm)  # noqa: SLF001
+
+        self.assertEqual(self.client.skewer_updates, 1)
+
+    def test_household_spawn_sends_no_update(self) -> None:
+        """Spawning household members do not touch the skewer."""
+        GameEvents.emit_post_spawn_sim(self.member)
+
+        self.assertEqual(self.skewer_update_alarms(), [])
+        self.assertEqual(self.client.skewer_updates, 0)
+
+
+class TestMakeSimsSelectable(SelectionGroupTestCase):
+    """Adding many sims to the skewer at once."""
+
+    def setUp(self) -> None:
+        """Activate the household member and create NPCs to add."""
+        super().setUp()
+        self.client.active_sim_info = self.member
+        self.npcs = [FakeSimInfo(sim_id, OTHER_HOUSEHOLD_ID) for sim_id in range(100)]
+
+    def test_single_skewer_update(self) -> None:
+        """All added sims share a single skewer update."""
+        added = self.group.make_sims_selectable(self.npcs)
+
+        self.assertEqual(added, self.npcs)
+        self.assertEqual(self.client.skewer_updates, 1)
+
+    def test_active_sim_is_kept(self) -> None:
+        """The tracker information is published without switching sims."""
+        self.group.make_sims_selectable(self.npcs)
+
+        self.assertEqual(self.client.active_sim_switches, 0)
+        self.assertIs(self.client.active_sim_info, self.member)
+
+    def test_every_npc_is_published(self) -> None:
+        """Each added NPC sends its tracker information once."""
+        self.group.make_sims_selectable(self.npcs)
+
+        for sim_info in self.npcs:
+            self.assertEqual(sim_info.commodity_publishes, 1)
+            self.assertEqual(sim_info.relationship_tracker.sends, 1)
+
+    def test_selectable_sims_are_skipped(self) -> None:
+        """Sims already in the skewer are neither added nor published."""
+        self.group.make_sims_selectable(self.npcs)
+        added = self.group.make_sims_selectable(self.npcs)
+
+        self.assertEqual(added, [])
+        self.assertEqual(self.client.skewer_updates, 1)
+        self.assertEqual(self.npcs[0].commodity_publishes, 1)
+
+
+class FakeHousehold:
+    """Household with a list of members."""
+
+    def __init__(self, household_id: int, sim_infos: list[FakeSimInfo]) -> None:
+        """Create a new household with the given members."""
+        self.id = household_id
+        self.sim_infos = sim_infos
+
+    def __len__(self) -> int:
+        """Get the number of members."""
+        return len(self.sim_infos)
+
+
+class TestHouseholdDecision(SelectionGroupTestCase):
+    """The custom sim check of a household follows its members."""
+
+    def test_member_swap_is_noticed(self) -> None:
+        """Replacing a member with another keeps the size but not the answer."""
+        npc = FakeSimInfo(20, OTHER_HOUSEHOLD_ID)
+        other = FakeSimInfo(30, OTHER_HOUSEHOLD_ID)
+        household = FakeHousehold(OTHER_HOUSEHOLD_ID, [other])
+
+        self.add_with_event(npc)
+
+        self.assertFalse(self.group.has_custom_sim_in_household(household))
+
+        household.sim_infos[0] = npc
+
+        self.assertTrue(self.group.has_custom_sim_in_household(household))
+
+
+if __name__ == "__main__":
+    unittest.main()
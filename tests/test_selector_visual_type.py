@@ -0,0 +1,129 @@
+"""Tests of the memo of the selector visual types."""
+
+from __future__ import annotations
+
+import unittest
+from typing import Any
+from unittest import mock
+
+from control_any_sim import main
+from control_any_sim.main import SelectorVisualTypeMemo
+from control_any_sim.services.selection_group import SelectionGroupService
+from control_any_sim.util.game_events import GameEvents
+from tests.fakes import (
+    HOUSEHOLD_ID,
+    OTHER_HOUSEHOLD_ID,
+    FakeSimInfo,
+    SelectionGroupTestCase,
+)
+
+VISUAL_TYPE = (1, None)
+ZONE_ID = 5
+
+
+class TestSelectorVisualTypeMemo(SelectionGroupTestCase):
+    """Visual types are remembered until anything they depend on changes."""
+
+    def setUp(self) -> None:
+        """Count the computed visual types."""
+        super().setUp()
+
+        patcher = mock.patch.object(
+            main,
+            "get_selector_visual_type",
+            return_value=VISUAL_TYPE,
+        )
+        self.compute = patcher.start()
+        self.addCleanup(patcher.stop)
+        SelectorVisualTypeMemo.invalidate()
+        self.addCleanup(SelectorVisualTypeMemo.invalidate)
+
+        SelectionGroupService.instance = self.group
+        self.addCleanup(setattr, SelectionGroupService, "instance", None)
+        self.services.current_zone_id.return_value = ZONE_ID
+
+    def visual_type(self) -> Any:  # noqa: ANN401
+        """Ask for the visual type like the skewer update does."""
+        return main.canys_client_get_selector_visual_type(
+            mock.Mock(),
+            self.client,
+            self.member,
+        )
+
+    def assert_computed_again(self, change: Any) -> None:  # noqa: ANN401
+        """Check that the visual type is computed again after a change."""
+        self.assertEqual(self.visual_type(), VISUAL_TYPE)
+
+        change()
+
+        self.assertEqual(self.visual_type(), VISUAL_TYPE)
+        self.assertEqual(self.compute.call_count, 2)
+
+    def test_remembered_across_updates(self) -> None:
+        """Repeated skewer updates compute the visual type once."""
+        for _ in range(3):
+            self.assertEqual(self.visual_type(), VISUAL_TYPE)
+
+        self.assertEqual(self.compute.call_count, 1)
+
+    def test_dropped_when_selection_changes(self) -> None:
+        """A new selectable sim drops the memo."""
+        self.assert_computed_again(
+            lambda: self.add_with_event(FakeSimInfo(20, OTHER_HOUSEHOLD_ID)),
+        )
+
+    def test_dropped_when_zone_changes(self) -> None:
+        """Another current zone drops the memo."""
+
+        def change() -> None:
+            self.services.current_zone_id.return_value = ZONE_ID + 1
+
+        self.assert_computed_again(change)
+
+    def test_dropped_when_career_is_added(self) -> None:
+        """A new career drops the memo."""
+        self.assert_computed_again(
+            lambda: main.canys_career_tracker_add_career(mock.Mock(), mock.Mock()),
+        )
+
+    def test_dropped_when_career_is_removed(self) -> None:
+        """A removed career drops the memo."""
+        self.assert_computed_again(
+            lambda: main.canys_career_tracker_remove_career(mock.Mock(), mock.Mock()),
+        )
+
+    def test_dropped_when_sim_travels(self) -> None:
+        """A sim that travels out drops the memo."""
+        self.assert_computed_again(
+            lambda: GameEvents.emit_travel_sim_out(self.member),
+        )
+
+    def test_dropped_when_sim_spawns(self) -> None:
+        """A sim that spawns drops the memo."""
+        main.canys_watch_spawned_sims(mock.Mock(), HOUSEHOLD_ID, self.member.id)
+        self.addCleanup(
+            GameEvents.post_spawn_sim.unsubscribe,
+            SelectorVisualTypeMemo.invalidate,
+        )
+        self.addCleanup(setattr, GameEvents, "post_spawn_sim_source", None)
+
+        self.assert_computed_again(
+            lambda: GameEvents.emit_post_spawn_sim(mock.Mock()),
+        )
+
+    def test_dropped_when_zone_is_torn_down(self) -> None:
+        """Nothing is kept from a torn down zone."""
+        self.visual_type()
+
+        self.assertIn(
+            SelectorVisualTypeMemo.invalidate,
+            GameEvents.zone_teardown.handlers(),
+        )
+
+        SelectorVisualTypeMemo.invalidate(mock.Mock(), self.client)
+
+        self.assertEqual(SelectorVisualTypeMemo.results, {})
+
+
+if __name__ == "__main__":
+    unittest.main()
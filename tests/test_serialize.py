@@ -0,0 +1,134 @@
+"""Tests of the validation of serialized data."""
+
+from __future__ import annotations
+
+import unittest
+from typing import ClassVar
+
+from control_any_sim.util.serialize import (
+    Serializable,
+    SerializationError,
+    SerializedField,
+)
+
+
+class Record(Serializable):
+    """Serializable with an int field and a list of ints."""
+
+    schema_version: ClassVar[int] = 2
+    serialized_fields = (
+        SerializedField("household_id", int),
+        SerializedField("sim_ids", list, int),
+        SerializedField("note", str, required=False),
+    )
+
+    def __init__(
+        self,
+        household_id: int,
+        sim_ids: list[int],
+        note: str = "",
+    ) -> None:
+        """Create a new record."""
+        self.household_id = household_id
+        self.sim_ids = sim_ids
+        self.note = note
+
+
+class TestValidation(unittest.TestCase):
+    """Serialized data is validated against the declared fields."""
+
+    def test_valid_data(self) -> None:
+        """Valid data restores all fields."""
+        record = Record.from_dict({"household_id": 1, "sim_ids": [2, 3]})
+
+        self.assertEqual(record.household_id, 1)
+        self.assertEqual(record.sim_ids, [2, 3])
+        self.assertEqual(record.note, "")
+
+    def test_missing_required_field(self) -> None:
+        """A missing required field is rejected."""
+        with self.assertRaises(SerializationError):
+            Record.from_dict({"sim_ids": []})
+
+    def test_wrong_type(self) -> None:
+        """A field of the wrong type is rejected."""
+        with self.assertRaises(SerializationError):
+            Record.from_dict({"household_id": "1", "sim_ids": []})
+
+        with self.assertRaises(SerializationError):
+            Record.from_dict({"household_id": 1, "sim_ids": {}})
+
+    def test_bool_is_not_an_int(self) -> None:
+        """Booleans are not accepted for int fields or items."""
+        with self.assertRaises(SerializationError):
+            Record.from_dict({"household_id": True, "sim_ids": []})
+
+        with self.assertRaises(SerializationError):
+            Record.from_dict({"household_id": 1, "sim_ids": [2, False]})
+
+        with self.assertRaises(SerializationError):
+            Record.from_dict({"household_id": 1, "sim_ids": [], "version": True})
+
+    def test_wrong_item_type(self) -> None:
+        """Items of a list field have to match the item type."""
+        with self.assertRaises(SerializationError):
+            Record.from_dict({"household_id": 1, "sim_ids": [2, "3"]})
+
+    def test_unsupported_version(self) -> None:
+        """Data of a newer schema version is rejected."""
+        with self.assertRaises(SerializationError):
+            Record.from_dict({"household_id": 1, "sim_ids": [], "version": 3})
+
+    def test_not_an_object(self) -> None:
+        """JSON data has to be an object."""
+        with self.assertRaises(SerializationError):
+            Record.deserialize("[1, 2]")
+
+
+class TestRoundTrip(unittest.TestCase):
+    """Serialized records restore to equal records."""
+
+    def test_json(self) -> None:
+        """Records survive a JSON round trip."""
+        record = Record.deserialize(Record(1, [2, 3], "note").serialize())
+
+        self.assertEqual(record.household_id, 1)
+        self.assertEqual(record.sim_ids, [2, 3])
+        self.assertEqual(record.note, "note")
+
+
+class BinaryRecord(Serializable):
+    """Serializable that only has fields with a binary representation."""
+
+    serialized_fields = (
+        SerializedField("household_id", int),
+        SerializedField("sim_ids", list, int),
+    )
+
+    def __init__(self, household_id: int, sim_ids: list[int]) -> None:
+        """Create a new record."""
+        self.household_id = household_id
+        self.sim_ids = sim_ids
+
+
+class TestBinary(unittest.TestCase):
+    """Binary serialized records."""
+
+    def test_round_trip(self) -> None:
+        """Records survive a binary round trip."""
+        data = BinaryRecord(1, [2, 3]).serialize_binary()
+        record = BinaryRecord.deserialize(data)
+
+        self.assertEqual(record.household_id, 1)
+        self.assertEqual(record.sim_ids, [2, 3])
+
+    def test_truncated(self) -> None:
+        """Truncated binary data is rejected."""
+        data = BinaryRecord(1, [2, 3]).serialize_binary()
+
+        with self.assertRaises(SerializationError):
+            BinaryRecord.deserialize(data[:-4])
+
+
+if __name__ == "__main__":
+    unittest.main()
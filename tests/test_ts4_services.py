@@ -0,0 +1,71 @@
+"""Tests of the typed facade for the game's services."""
+
+from __future__ import annotations
+
+import unittest
+from unittest import mock
+
+import services
+
+from control_any_sim import ts4_services
+
+
+class TestUse(unittest.TestCase):
+    """A stand-in services module backs all accessors."""
+
+    def setUp(self) -> None:
+        """Back the facade by a mock services module."""
+        self.services = mock.MagicMock()
+        self.facade = ts4_services.use(self.services)
+        self.addCleanup(ts4_services.use, services)
+
+    def test_accessors_use_module(self) -> None:
+        """The module level accessors answer from the stand-in module."""
+        self.services.active_household_id.return_value = 7
+        self.services.current_zone_id.return_value = 8
+
+        self.assertIs(ts4_services.facade, self.facade)
+        self.assertEqual(ts4_services.active_household_id(), 7)
+        self.assertEqual(ts4_services.current_zone_id(), 8)
+        self.assertIs(
+            ts4_services.get_roommate_service(),
+            self.services.get_roommate_service.return_value,
+        )
+
+    def test_active_client_is_cached(self) -> None:
+        """The active client is looked up once until it is invalidated."""
+        inner = self.services.client_manager.return_value
+        self.services.active_household_id.return_value = 7
+
+        client = ts4_services.active_client()
+
+        self.assertIs(ts4_services.active_client(), client)
+        inner.get_client_by_household_id.assert_called_once_with(7)
+
+        ts4_services.invalidate_active_client()
+        ts4_services.active_client()
+
+        self.assertEqual(inner.get_client_by_household_id.call_count, 2)
+
+    def test_missing_client_is_not_cached(self) -> None:
+        """A household without a client is looked up again."""
+        inner = self.services.client_manager.return_value
+        inner.get_client_by_household_id.return_value = None
+
+        self.assertIsNone(ts4_services.active_client())
+        self.assertIsNone(ts4_services.active_client())
+        self.assertEqual(inner.get_client_by_household_id.call_count, 2)
+
+    def test_reset_drops_wrappers(self) -> None:
+        """Resetting creates a new client manager wrapper."""
+        client_manager = ts4_services.client_manager()
+
+        self.assertIs(ts4_services.client_manager(), client_manager)
+
+        ts4_services.reset()
+
+        self.assertIsNot(ts4_services.client_manager(), client_manager)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,180 @@
+"""Tests of the selection group service over many zone changes."""
+
+from __future__ import annotations
+
+import gc
+import tracemalloc
+import types
+import unittest
+from typing import Callable
+from unittest import mock
+
+import services
+
+from control_any_sim import ts4_services
+from control_any_sim.services import selection_group
+from control_any_sim.services.selection_group import SelectionGroupService
+from control_any_sim.util.game_events import GameEvents
+from control_any_sim.util.logger import Logger, LogLevel
+from tests.fakes import HOUSEHOLD_ID, OTHER_HOUSEHOLD_ID, FakeClient, FakeSimInfo
+
+CYCLES = 1000
+WARMUP_CYCLES = 50
+MAX_GROWTH = 64 * 1024
+
+
+class FakeStateStore:
+    """State store that keeps the persisted states in memory."""
+
+    def __init__(self) -> None:
+        """Create an empty store."""
+        self.states: dict[int | str, str] = {}
+
+    def load(self, key: int | str) -> str | None:
+        """Get the persisted state of a key."""
+        return self.states.get(key)
+
+    def save(self, key: int | str, data: str) -> None:
+        """Persist the state of a key."""
+        self.states[key] = data
+
+
+class FakeSpawnerService:
+    """Sim spawner service that accepts the spawn event dispatcher."""
+
+    def register_sim_spawned_callback(self, _callback: object) -> None:
+        """Accept the dispatcher of the post spawn sim event."""
+
+
+class FakeAlarms:
+    """Alarms module that keeps only the callbacks of the pending alarms."""
+
+    def __init__(self) -> None:
+        """Create a module without pending alarms."""
+        self.pending: dict[object, Callable[[object], None]] = {}
+
+    def add_alarm_real_time(
+        self,
+        _owner: object,
+        _interval: object,
+        callback: Callable[[object], None],
+    ) -> object:
+        """Add a pending alarm."""
+        handle = object()
+        self.pending[handle] = callback
+
+        return handle
+
+    def cancel_alarm(self, handle: object) -> None:
+        """Drop a pending alarm."""
+        self.pending.pop(handle, None)
+
+
+class TestZoneCycles(unittest.TestCase):
+    """Setting up and tearing down the real service for many zones."""
+
+    def setUp(self) -> None:
+        """Back the services by plain functions and keep the state in memory."""
+        self.member = FakeSimInfo(10, HOUSEHOLD_ID)
+        self.npcs = [FakeSimInfo(sim_id, OTHER_HOUSEHOLD_ID) for sim_id in range(10)]
+        self.sim_infos = {
+            sim_info.id: sim_info for sim_info in (self.member, *self.npcs)
+        }
+        self.client = FakeClient()
+        self.zone = object()
+        self.alarms = FakeAlarms()
+
+        # mocks record every call, the accessors of the game must not grow
+        fake_services = types.ModuleType("services")
+        sim_info_manager = types.SimpleNamespace(get=self.sim_infos.get)
+        spawner_service = FakeSpawnerService()
+        fake_services.get_first_client = lambda: self.client  # type: ignore[attr-defined]
+        fake_services.sim_info_manager = lambda: sim_info_manager  # type: ignore[attr-defined]
+        fake_services.sim_spawner_service = lambda _zone_id: spawner_service  # type: ignore[attr-defined]
+
+        ts4_services.use(fake_services)
+        self.addCleanup(ts4_services.use, services)
+
+        for target, attribute, value in (
+            (SelectionGroupService, "state_store", FakeStateStore()),
+            (
+                selection_group,
+                "LEGACY_STATE_FILE",
+                mock.Mock(**{"is_file.return_value": False}),
+            ),
+            (selection_group, "alarms", self.alarms),
+        ):
+            patcher = mock.patch.object(target, attribute, value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+        level = Logger.level
+        Logger.set_level(LogLevel.ERROR)
+        self.addCleanup(Logger.set_level, level)
+        self.addCleanup(setattr, SelectionGroupService, "instance", None)
+
+        # the first zone makes the NPCs selectable, they are persisted on teardown
+        self.enter_zone().make_sims_selectable(self.npcs)
+        self.leave_zone()
+
+    def enter_zone(self) -> SelectionGroupService:
+        """Create the client of a new zone and set up the service for it."""
+        self.client = FakeClient()
+        self.client.add_selectable_sim_info(self.member)
+
+        return SelectionGroupService.get(HOUSEHOLD_ID)
+
+    def leave_zone(self) -> None:
+        """Tear the current zone down."""
+        GameEvents.emit_zone_teardown(self.zone, self.client)
+
+    def cycle(self, count: int) -> None:
+        """Set up and tear down the given number of zones."""
+        for _ in range(count):
+            group = self.enter_zone()
+
+            self.assertEqual(group.selectable_sims, [npc.id for npc in self.npcs])
+
+            self.leave_zone()
+
+    def subscriber_counts(self) -> dict[str, int]:
+        """Count the live listeners of every game event channel."""
+        return {
+            name: len(channel.handlers())
+            for name, channel in vars(GameEvents).items()
+            if hasattr(channel, "handlers")
+        }
+
+    def test_subscribers_stay_flat(self) -> None:
+        """Every zone removes the listeners it added."""
+        counts = self.subscriber_counts()
+
+        self.cycle(CYCLES)
+
+        self.assertEqual(self.subscriber_counts(), counts)
+        self.assertEqual(self.alarms.pending, {})
+        self.assertIsNone(SelectionGroupService.instance)
+
+    def test_sims_leave_the_skewer(self) -> None:
+        """Every zone removes the NPCs from the skewer on teardown."""
+        self.cycle(CYCLES)
+
+        self.assertEqual(self.client.selectable_sims, [self.member])
+        self.assertFalse(any(npc.is_selectable for npc in self.npcs))
+
+    def test_memory_stays_bounded(self) -> None:
+        """The memory does not grow with the number of zones."""
+        self.cycle(WARMUP_CYCLES)
+        gc.collect()
+
+        tracemalloc.start()
+        self.addCleanup(tracemalloc.stop)
+        before = tracemalloc.take_snapshot()
+
+        self.cycle(CYCLES)
+        gc.collect()
+
+        after = tracemalloc.take_snapshot()
+        growth = sum(stat.size_diff for stat in after.compare_to(before, "filename"))
+
+        self.assertLess(growth, MAX_GROWTH)